@@ -0,0 +1,50 @@
+"""배치 결과 저장 형식 비교: CSV (f"{v:.11g}") vs Arrow IPC vs Parquet
+
+실행: python benchmarks/bench_columnar.py [행 수]
+"""
+import os, sys
+import csv
+import time
+import tempfile
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from line_list_io import write_columns, read_columns
+
+def make_result(n: int, seed: int = 0):
+    rng = np.random.default_rng(seed)
+    return {name: rng.uniform(0, 1000, n)
+            for name in ("velocity", "reynolds", "friction", "pressure_drop", "thickness")}
+
+def write_csv(path: str, columns):
+    with open(path, "w", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(list(columns))
+        writer.writerows([f"{v:.11g}" for v in row] for row in zip(*(c.tolist() for c in columns.values())))
+
+def read_csv(path: str):
+    with open(path, newline="") as f:
+        reader = csv.reader(f)
+        header = next(reader)
+        data = np.array([[float(v) for v in row] for row in reader])
+    return {name: data[:, i] for i, name in enumerate(header)}
+
+def timed(func, *args):
+    start = time.perf_counter()
+    func(*args)
+    return time.perf_counter() - start
+
+if __name__ == "__main__":
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    columns = make_result(n)
+    print(f"{n:,} rows x {len(columns)} float64 columns")
+    with tempfile.TemporaryDirectory() as tmp:
+        cases = [("csv", write_csv, read_csv),
+                 ("arrow", write_columns, read_columns),
+                 ("parquet", write_columns, read_columns)]
+        for ext, writer, reader in cases:
+            path = os.path.join(tmp, f"result.{ext}")
+            write_s = timed(writer, path, columns)
+            read_s = timed(reader, path)
+            print(f"{ext:>8}: write {write_s * 1000:8.1f} ms, read {read_s * 1000:8.1f} ms, "
+                  f"size {os.path.getsize(path) / 1e6:7.1f} MB")
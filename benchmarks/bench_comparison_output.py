@@ -0,0 +1,62 @@
+"""comparison_test 출력 형식별 시간/메모리 (말뭉치 크기별)
+
+legacy: fit + transform + toarray (기존 구현 재현)
+csr / packed / dense: example_code.comparison_vectors
+result: 결과 배열 크기, peak: tracemalloc 최대 할당량
+실행: python benchmarks/bench_comparison_output.py [--max-features N|0]  (0 = 어휘 전체)
+"""
+import os, sys
+import time
+import argparse
+import tracemalloc
+import numpy as np
+import sklearn.feature_extraction.text as txt
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from example_code import comparison_vectors
+
+DENSE_LIMIT = 2 << 30 # 밀집 결과가 이보다 크면 legacy/dense 는 건너뜀
+
+def make_corpus(n_docs, vocab=50_000, words=20, seed=0):
+    rng = np.random.default_rng(seed)
+    ids = np.minimum(rng.zipf(1.3, size=(n_docs, words)), vocab) # 실제 문서처럼 단어 빈도가 치우치게
+    return [" ".join(f"w{i}" for i in row) for row in ids.tolist()]
+
+def legacy(text, max_features):
+    vectorizer = txt.CountVectorizer(binary=True, max_features=max_features)
+    vectorizer.fit(text)
+    return vectorizer.transform(text).toarray()
+
+def nbytes(result):
+    if hasattr(result, "indptr"):
+        return result.data.nbytes + result.indices.nbytes + result.indptr.nbytes
+    return result.nbytes
+
+def measure(name, func):
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = func()
+    seconds = time.perf_counter() - start
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    print(f"  {name:>7}: {seconds * 1000:9.1f} ms, result {nbytes(result) / 2**20:9.2f} MB, "
+          f"peak {peak / 2**20:9.2f} MB")
+    return result
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--max-features", type=int, default=20)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 100_000])
+    args = parser.parse_args()
+    max_features = args.max_features or None
+
+    for n in args.sizes:
+        text = make_corpus(n)
+        csr = comparison_vectors(text, "csr", max_features=max_features)
+        dense_bytes = csr.shape[0] * csr.shape[1] * 8
+        print(f"{n:,} docs, {csr.shape[1]:,} features (dense would be {dense_bytes / 2**20:,.1f} MB)")
+        if dense_bytes <= DENSE_LIMIT:
+            measure("legacy", lambda: legacy(text, max_features))
+            measure("dense", lambda: comparison_vectors(text, "dense", max_features=max_features))
+        measure("csr", lambda: comparison_vectors(text, "csr", max_features=max_features))
+        measure("packed", lambda: comparison_vectors(text, "packed", max_features=max_features))
@@ -0,0 +1,53 @@
+"""단위 환산 탭의 위젯 수와 메모리(RSS) 비교: 카테고리별 카드 vs 통합 카드 하나
+
+시나리오마다 별도 프로세스에서 측정 (QT_QPA_PLATFORM=offscreen 으로 화면 없이 실행 가능)
+실행: python benchmarks/bench_converter_widgets.py
+"""
+import os, sys
+import subprocess
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SCENARIOS = ["per-category", "compact", "per-category x50", "compact x50"]
+
+def rss_kb() -> int:
+    with open("/proc/self/status") as f:
+        for line in f:
+            if line.startswith("VmRSS:"):
+                return int(line.split()[1])
+    return 0
+
+def synthetic_catalogue(n: int):
+    from units import UNIT_DATA
+    base = list(UNIT_DATA.items())
+    return {f"{base[i % len(base)][0]} #{i}": base[i % len(base)][1] for i in range(n)}
+
+def measure(scenario: str):
+    sys.path.insert(0, ROOT)
+    from PySide6.QtWidgets import QApplication, QWidget, QVBoxLayout
+    import piping_tool as p
+
+    app = QApplication(sys.argv)
+    container = QWidget()
+    layout = QVBoxLayout(container)
+    widgets_before, rss_before = len(QApplication.allWidgets()), rss_kb()
+
+    catalogue = synthetic_catalogue(50) if scenario.endswith("x50") else p.UNIT_DATA
+    if scenario.startswith("per-category"):
+        for title, units in catalogue.items():
+            layout.addWidget(p.RatioConverterWidget(title, units))
+        layout.addWidget(p.TemperatureConverterWidget())
+    else:
+        layout.addWidget(p.CompactConverterWidget(catalogue))
+    container.show()
+    app.processEvents()
+
+    print(f"{scenario:>18}: {len(QApplication.allWidgets()) - widgets_before:5d} widgets, "
+          f"+{(rss_kb() - rss_before) / 1024:6.1f} MB RSS")
+
+if __name__ == "__main__":
+    if len(sys.argv) == 2:
+        measure(sys.argv[1])
+    else:
+        env = dict(os.environ, QT_QPA_PLATFORM=os.environ.get("QT_QPA_PLATFORM", "offscreen"))
+        for name in SCENARIOS:
+            subprocess.run([sys.executable, __file__, name], env=env, check=True)
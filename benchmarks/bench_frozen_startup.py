@@ -0,0 +1,51 @@
+"""패키징된 실행 파일(one-dir)의 시작 시간 측정 + 회귀 확인
+
+실행 파일을 --startup-check 로 여러 번 띄워 첫 화면까지의 시간(앱 내부)과
+프로세스 전체 시간(부트로더 포함)의 중앙값을 출력. --max-ms 를 주면 초과 시 종료 코드 1.
+먼저 빌드: pyinstaller piping_tool.spec
+실행: python benchmarks/bench_frozen_startup.py [--runs 5] [--max-ms 1500] [--source]
+"""
+import os, sys
+import re
+import time
+import argparse
+import statistics
+import subprocess
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+EXE_NAME = "piping_tool.exe" if sys.platform == "win32" else "piping_tool"
+FROZEN_EXE = os.path.join(ROOT, "dist", "piping_tool", EXE_NAME)
+STARTUP_RE = re.compile(r"startup: (\d+) ms")
+
+def run_once(command, env):
+    start = time.perf_counter()
+    out = subprocess.run(command, env=env, capture_output=True, text=True, check=True, cwd=ROOT)
+    wall = (time.perf_counter() - start) * 1000
+    match = STARTUP_RE.search(out.stdout)
+    return (float(match.group(1)) if match else float("nan")), wall
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--max-ms", type=float, default=None, help="프로세스 전체 시간 중앙값 상한")
+    parser.add_argument("--source", action="store_true", help="비교용으로 소스 실행(python piping_tool.py)도 측정")
+    args = parser.parse_args()
+
+    if not os.path.exists(FROZEN_EXE):
+        sys.exit(f"{FROZEN_EXE} 없음 - 먼저 pyinstaller piping_tool.spec 실행")
+    env = dict(os.environ, QT_QPA_PLATFORM=os.environ.get("QT_QPA_PLATFORM", "offscreen"))
+    targets = [("frozen", [FROZEN_EXE, "--startup-check"])]
+    if args.source:
+        targets.append(("source", [sys.executable, os.path.join(ROOT, "piping_tool.py"), "--startup-check"]))
+
+    medians = {}
+    for name, command in targets:
+        run_once(command, env) # 디스크 캐시 워밍업
+        samples = [run_once(command, env) for _ in range(args.runs)]
+        app_ms = statistics.median(s[0] for s in samples)
+        wall_ms = statistics.median(s[1] for s in samples)
+        medians[name] = wall_ms
+        print(f"{name:>6}: first window {app_ms:7.1f} ms (in app), process {wall_ms:7.1f} ms (median of {args.runs})")
+
+    if args.max_ms is not None and medians["frozen"] > args.max_ms:
+        sys.exit(f"회귀: {medians['frozen']:.1f} ms > {args.max_ms:.1f} ms")
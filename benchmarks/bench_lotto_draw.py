@@ -0,0 +1,45 @@
+"""추첨 생성 속도 비교 (draws/s)
+
+randint: 기존 방식 (randint(1, 45) 6번, 중복 가능) 을 파이썬 루프로
+argpartition: 행마다 45개의 난수 키 중 가장 작은 6개
+floyd: lotto_engine.draw (벡터화 Floyd)
+실행: python benchmarks/bench_lotto_draw.py [N]
+"""
+import os, sys
+import time
+from random import randint
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from lotto_engine import draw, POOL, PICK
+
+def draw_randint(n):
+    return [[randint(1, POOL) for _ in range(PICK)] for _ in range(n)]
+
+def draw_argpartition(n, rng, chunk=1 << 16):
+    out = np.empty((n, PICK), dtype=np.uint8)
+    for start in range(0, n, chunk):
+        keys = rng.random((min(chunk, n - start), POOL), dtype=np.float32)
+        picked = np.argpartition(keys, PICK, axis=1)[:, :PICK] + 1
+        picked.sort(axis=1)
+        out[start:start + len(keys)] = picked
+    return out
+
+def timed(name, func, n):
+    start = time.perf_counter()
+    func()
+    seconds = time.perf_counter() - start
+    print(f"{name:>12}: {n:>10,} draws in {seconds * 1000:8.1f} ms ({n / seconds:>13,.0f} draws/s)")
+
+if __name__ == "__main__":
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    rng = np.random.default_rng(0)
+    timed("randint", lambda: draw_randint(n // 10), n // 10)
+    timed("argpartition", lambda: draw_argpartition(n, rng), n)
+    timed("floyd", lambda: draw(n, rng=rng), n)
+
+    sample = draw(n, rng=rng)
+    unique = (np.diff(sample.astype(np.int16), axis=1) > 0).all()
+    counts = np.bincount(sample.ravel(), minlength=POOL + 1)[1:]
+    print(f"all rows unique: {unique}, per-number count spread: {counts.min():,}..{counts.max():,} "
+          f"(expected {n * PICK / POOL:,.0f})")
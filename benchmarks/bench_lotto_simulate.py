@@ -0,0 +1,26 @@
+"""병렬 시뮬레이션 워커 수별 처리량 + 결과 동일성 확인
+
+같은 시드로 워커 수만 바꿔 실행하고, 집계 결과가 워커 1개일 때와 비트 단위로 같은지 확인
+실행: python benchmarks/bench_lotto_simulate.py [추첨 수]
+"""
+import os, sys
+import time
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from lotto_engine import simulate, to_masks
+
+if __name__ == "__main__":
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 20_000_000
+    tickets = to_masks([[1, 2, 3, 4, 5, 6], [7, 14, 21, 28, 35, 42]])
+    counts = sorted({1, 2, 4, os.cpu_count() or 1})
+    baseline = None
+    for workers in counts:
+        start = time.perf_counter()
+        result = simulate(n, seed=2024, workers=workers, tickets=tickets)
+        seconds = time.perf_counter() - start
+        if baseline is None:
+            baseline, base_seconds = result, seconds
+        same = all(np.array_equal(result[k], baseline[k]) for k in ("number_counts", "match_counts"))
+        print(f"workers {workers:>2}: {seconds:6.2f} s ({n / seconds:>12,.0f} draws/s), "
+              f"speedup {base_seconds / seconds:4.2f}x, identical: {same}")
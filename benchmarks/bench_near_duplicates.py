@@ -0,0 +1,45 @@
+"""유사 문서 찾기: MinHash/LSH 대 정확한 모든 쌍 비교 (시간, 재현율)
+
+말뭉치에 단어 일부만 바꾼 사본을 섞어 넣고 Jaccard >= threshold 인 쌍을 두 방식으로 찾음
+실행: python benchmarks/bench_near_duplicates.py [문서 수] [--threshold 0.8] [--exact-limit N]
+"""
+import os, sys
+import time
+import argparse
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from example_code import comparison_vectors
+from near_duplicates import near_duplicate_pairs
+
+def make_corpus(n_docs, dup_ratio=0.05, words=40, seed=0):
+    rng = np.random.default_rng(seed)
+    docs = [rng.integers(0, 200_000, size=words) for _ in range(n_docs)]
+    for target in rng.choice(n_docs, size=int(n_docs * dup_ratio), replace=False):
+        copy = docs[rng.integers(n_docs)].copy()
+        changed = rng.choice(words, size=rng.integers(0, 4), replace=False)
+        copy[changed] = rng.integers(0, 200_000, size=len(changed))
+        docs[target] = copy
+    return [" ".join(f"w{i}" for i in doc) for doc in docs]
+
+def timed(name, func):
+    start = time.perf_counter()
+    i, j, jaccard = func()
+    print(f"{name:>6}: {time.perf_counter() - start:7.2f} s, {len(i):,} pairs")
+    return set(zip(i.tolist(), j.tolist()))
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("docs", type=int, nargs="?", default=20_000)
+    parser.add_argument("--threshold", type=float, default=0.8)
+    parser.add_argument("--exact-limit", type=int, default=100_000,
+                        help="skip the all-pairs check above this many docs (memory grows quadratically)")
+    args = parser.parse_args()
+    matrix = comparison_vectors(make_corpus(args.docs), "csr", max_features=None)
+    print(f"{args.docs:,} docs, {matrix.shape[1]:,} features")
+    lsh = timed("lsh", lambda: near_duplicate_pairs(matrix, args.threshold))
+    if args.docs > args.exact_limit:
+        sys.exit(0)
+    exact = timed("exact", lambda: near_duplicate_pairs(matrix, args.threshold, method="exact"))
+    found = len(lsh & exact)
+    print(f"recall {found / max(len(exact), 1):.3f}, false positives {len(lsh - exact)}")
@@ -0,0 +1,33 @@
+"""병렬 벡터화 워커 수별 속도 곡선 + 직렬 결과와 동일성 확인
+
+serial: example_code.comparison_vectors, parallel: example_code.parallel_vectors (워커 1..N)
+실행: python benchmarks/bench_parallel_vectors.py [문서 수] [--max-workers N]
+"""
+import os, sys
+import time
+import argparse
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from example_code import comparison_vectors, parallel_vectors
+from bench_comparison_output import make_corpus
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("docs", type=int, nargs="?", default=100_000)
+    parser.add_argument("--max-workers", type=int, default=os.cpu_count() or 1)
+    args = parser.parse_args()
+    text = make_corpus(args.docs)
+
+    start = time.perf_counter()
+    serial = comparison_vectors(text)
+    base = time.perf_counter() - start
+    print(f"serial   : {base:6.2f} s")
+    workers = 1
+    while workers <= max(args.max_workers, 1):
+        start = time.perf_counter()
+        result = parallel_vectors(text, workers=workers)
+        seconds = time.perf_counter() - start
+        same = result.shape == serial.shape and (result != serial).nnz == 0
+        print(f"workers {workers:>2}: {seconds:6.2f} s, speedup {base / seconds:4.2f}x, identical: {same}")
+        workers *= 2
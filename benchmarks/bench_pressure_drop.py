@@ -0,0 +1,33 @@
+"""라인 리스트 크기별 압력 손실 계산 시간 측정
+
+실행: python benchmarks/bench_pressure_drop.py
+"""
+import os, sys
+import time
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from pressure_drop import pressure_drop
+
+def make_line_list(n: int, seed: int = 0):
+    rng = np.random.default_rng(seed)
+    flow_units = np.array(["m³/hr", "L/s", "gal(US)/min", "kg/hr", "lb/s"])
+    visc_units = np.array(["Centipoise", "mPa·s", "Centistokes"])
+    return dict(
+        flow=rng.uniform(1, 500, n),
+        flow_unit=flow_units[rng.integers(0, len(flow_units), n)],
+        inner_diameter=rng.uniform(20, 600, n),
+        length=rng.uniform(5, 500, n),
+        density=rng.uniform(600, 1200, n),
+        viscosity=rng.uniform(0.2, 50, n),
+        viscosity_unit=visc_units[rng.integers(0, len(visc_units), n)],
+        roughness=0.045,
+    )
+
+if __name__ == "__main__":
+    for n in (1_000, 10_000, 50_000, 100_000):
+        lines = make_line_list(n)
+        start = time.perf_counter()
+        pressure_drop(**lines)
+        elapsed = time.perf_counter() - start
+        print(f"{n:>7} lines: {elapsed * 1000:8.1f} ms ({n / elapsed:,.0f} lines/s)")
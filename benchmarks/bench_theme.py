@@ -0,0 +1,67 @@
+"""테마 적용 + 첫 폴리시까지의 시작 시간 비교
+
+legacy: qdarktheme.setup_theme + 위젯별 setStyleSheet (기존 방식 재현)
+cold:   theme.apply_theme, 캐시 없음 (qdarktheme 로 생성 후 저장)
+warm:   theme.apply_theme, 디스크 캐시 사용
+시나리오마다 별도 프로세스에서 측정. 실행: python benchmarks/bench_theme.py
+"""
+import os, sys
+import time
+import tempfile
+import subprocess
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# 기존 코드가 위젯마다 넣던 스타일시트
+LEGACY_CARD = """
+    QFrame { background-color: transparent; border-radius: 10px; border: 1px solid #dee2e6; }
+    QLabel { border: none; }
+    QLineEdit { border: 1px solid #ced4da; border-radius: 4px; padding: 2px; }
+    QComboBox { border: 1px solid #ced4da; border-radius: 4px; }
+"""
+LEGACY_RESULT = "font-weight: bold; color: #d35400; font-size: 11pt; border: none;"
+LEGACY_MUTED = "color: #95a5a6; border: none;"
+
+def apply_legacy_styles(root):
+    from PySide6.QtWidgets import QWidget
+    for widget in root.findChildren(QWidget):
+        if widget.property("card"):
+            widget.setStyleSheet(LEGACY_CARD)
+        elif widget.property("role") == "result":
+            widget.setStyleSheet(LEGACY_RESULT)
+        elif widget.property("role") == "muted":
+            widget.setStyleSheet(LEGACY_MUTED)
+
+def measure(scenario: str, cache_dir: str):
+    start = time.perf_counter()
+    sys.path.insert(0, ROOT)
+    from PySide6.QtWidgets import QApplication
+    import piping_tool as p
+    from theme import apply_theme
+
+    app = QApplication(sys.argv)
+    t0 = time.perf_counter()
+    if scenario == "legacy":
+        import qdarktheme
+        qdarktheme.setup_theme("dark")
+    else:
+        apply_theme(app, "dark", cache_dir)
+    t1 = time.perf_counter()
+
+    window = p.MainWindow()
+    if scenario == "legacy":
+        apply_legacy_styles(window)
+    window.show()
+    app.processEvents() # 첫 폴리시/레이아웃
+    t2 = time.perf_counter()
+    print(f"{scenario:>6}: theme {(t1 - t0) * 1000:7.1f} ms, window + polish {(t2 - t1) * 1000:7.1f} ms, "
+          f"total since start {(t2 - start) * 1000:7.1f} ms")
+
+if __name__ == "__main__":
+    if len(sys.argv) == 3:
+        measure(sys.argv[1], sys.argv[2])
+    else:
+        env = dict(os.environ, QT_QPA_PLATFORM=os.environ.get("QT_QPA_PLATFORM", "offscreen"))
+        with tempfile.TemporaryDirectory() as cache_dir:
+            for name in ("legacy", "cold", "warm"):
+                subprocess.run([sys.executable, __file__, name, cache_dir], env=env, check=True)
@@ -0,0 +1,38 @@
+"""티켓 x 추첨 이력 일치 계산 속도 (비트마스크 AND + popcount)
+
+set: 파이썬 set 교집합 (일부 티켓만 측정 후 쌍/초 비교)
+mask: lotto_engine.match_histogram
+실행: python benchmarks/bench_ticket_match.py [티켓 수] [추첨 수]
+"""
+import os, sys
+import time
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from lotto_engine import draw, to_masks, match_histogram, PICK
+
+if __name__ == "__main__":
+    n_tickets = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    n_draws = int(sys.argv[2]) if len(sys.argv) > 2 else 1_000
+    rng = np.random.default_rng(0)
+    tickets, draws = draw(n_tickets, rng=rng), draw(n_draws, rng=rng)
+
+    sample = [set(t) for t in tickets[:1000].tolist()]
+    history = [set(d) for d in draws.tolist()]
+    start = time.perf_counter()
+    slow = np.zeros(PICK + 1, dtype=np.int64)
+    for t in sample:
+        for d in history:
+            slow[len(t & d)] += 1
+    set_rate = len(sample) * n_draws / (time.perf_counter() - start)
+
+    start = time.perf_counter()
+    ticket_masks, draw_masks = to_masks(tickets), to_masks(draws)
+    counts = match_histogram(ticket_masks, draw_masks)
+    seconds = time.perf_counter() - start
+    pairs = n_tickets * n_draws
+    assert (match_histogram(ticket_masks[:1000], draw_masks) == slow).all()
+
+    print(f" set: {set_rate:>15,.0f} pairs/s")
+    print(f"mask: {pairs / seconds:>15,.0f} pairs/s ({n_tickets:,} tickets x {n_draws:,} draws in {seconds:.2f} s)")
+    print("match count histogram:", {m: int(c) for m, c in enumerate(counts)})
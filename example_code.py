@@ -1,9 +1,302 @@
-
+import os
+import glob
+import time
+import pickle
+import sqlite3
+import hashlib
+from itertools import chain, islice
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+import scipy.sparse as sp
 import sklearn.feature_extraction.text as txt
 
-def comparison_test(text):    
-    count_vectorizer = txt.CountVectorizer(
-        binary=True, max_features=20)
-    count_vectorizer.fit(text)
-    vectorized = count_vectorizer.transform(text)
-    return vectorized.toarray()
+MAX_FEATURES = 20
+OUTPUTS = ("csr", "packed", "dense")
+STREAM_BATCH = 10_000        # 스트리밍 모드에서 한 번에 벡터화하는 문서 수
+HASH_FEATURES = 2 ** 20      # 해싱 특징 공간 크기
+BLOCK_PATTERN = "block_{:06d}.npz"
+PARALLEL_CHUNK = 20_000      # 병렬 모드에서 워커 하나가 맡는 문서 수
+VOCAB_CACHE_FILE = "vocabulary_cache.sqlite"
+VOCAB_CACHE_ENTRIES = 32     # 최근 사용 순으로 이 개수만 보관
+
+def make_vectorizer(binary: bool = True, max_features: int = MAX_FEATURES, dtype=np.int64) -> txt.CountVectorizer:
+    return txt.CountVectorizer(binary=binary, max_features=max_features, dtype=dtype)
+
+def pack_rows(matrix) -> np.ndarray:
+    """이진 CSR 행렬 -> 행마다 비트를 채운 uint8 배열 (np.unpackbits(..., axis=1, count=열 수)로 복원)
+
+    밀집 행렬을 거치지 않고 0 이 아닌 칸만 비트로 기록
+    """
+    n_rows, n_cols = matrix.shape
+    packed = np.zeros((n_rows, (n_cols + 7) // 8), dtype=np.uint8)
+    rows = np.repeat(np.arange(n_rows), np.diff(matrix.indptr))
+    cols = matrix.indices
+    np.bitwise_or.at(packed, (rows, cols >> 3), (128 >> (cols & 7)).astype(np.uint8))
+    return packed
+
+def format_output(matrix, output: str, binary: bool = True):
+    if output == "csr":
+        return matrix
+    if output == "packed":
+        if not binary:
+            raise ValueError("packed 출력은 binary=True 일 때만 가능")
+        return pack_rows(matrix)
+    if output == "dense":
+        return matrix.toarray()
+    raise ValueError(f"output 은 {OUTPUTS} 중 하나 (입력: {output})")
+
+def comparison_vectors(text, output: str = "csr", binary: bool = True, max_features: int = MAX_FEATURES,
+                       cache: "VocabularyCache" = None):
+    """문서를 한 번만 토큰화(fit_transform)해 희소 행렬(CSR)로 반환
+
+    output="packed" 는 행별 비트 배열, output="dense" 는 기존처럼 밀집 배열 (메모리 주의)
+    cache 를 주면 저장된 어휘를 쓰고 (같은 말뭉치 또는 뒤에 문서가 추가된 말뭉치), 새로 구한 어휘는 저장
+    """
+    # 이진 희소 출력은 값이 0/1 뿐이므로 uint8 (dense 는 기존과 같은 int64)
+    dtype = np.uint8 if binary and output != "dense" else np.int64
+    if cache is not None:
+        matrix = cache.vectors(text, binary, max_features, dtype).astype(dtype)
+    else:
+        matrix = make_vectorizer(binary, max_features, dtype).fit_transform(text)
+    return format_output(matrix.tocsr(), output, binary)
+
+def comparison_test(text, cache: "VocabularyCache" = None):
+    """기존 호출부 호환용: 밀집 배열 반환"""
+    return comparison_vectors(text, output="dense", cache=cache)
+
+# --- 스트리밍 (메모리보다 큰 말뭉치) ---
+def iter_documents(source):
+    """문서 이터러블 또는 파일 경로(한 줄에 문서 하나)를 한 문서씩"""
+    if isinstance(source, (str, os.PathLike)):
+        with open(source, "r", encoding="utf-8") as f:
+            for line in f:
+                yield line.rstrip("\n")
+    else:
+        yield from source
+
+def iter_batches(source, batch_size: int = STREAM_BATCH):
+    documents = iter_documents(source)
+    while True:
+        batch = list(islice(documents, batch_size))
+        if not batch:
+            return
+        yield batch
+
+def make_stream_vectorizer(source, binary: bool = True, sample_size: int = 0,
+                           max_features: int = MAX_FEATURES, n_features: int = HASH_FEATURES):
+    """sample_size == 0: 해싱 특징 공간 (어휘 학습 없음, 배치 간 열 번호가 항상 같음)
+    sample_size > 0: 앞쪽 sample_size 개 문서로 어휘를 고정 (comparison_test 와 같은 max_features 의미,
+    일회용 이터러블이면 표본 문서가 소비됨 -> stream_vectors 는 표본을 다시 앞에 붙여 사용)
+    """
+    if sample_size:
+        sample = list(islice(iter_documents(source), sample_size))
+        vectorizer = make_vectorizer(binary, max_features, np.uint8 if binary else np.int64)
+        return vectorizer.fit(sample)
+    return txt.HashingVectorizer(n_features=n_features, binary=binary, alternate_sign=False,
+                                 norm=None, dtype=np.uint8 if binary else np.int64)
+
+def stream_vectors(source, batch_size: int = STREAM_BATCH, vectorizer=None, **vectorizer_params):
+    """문서를 batch_size 개씩 벡터화해 CSR 블록을 차례로 반환 (메모리는 배치 크기만큼만 사용)
+
+    sample_size 로 어휘를 정할 때는 표본 문서를 한 번만 읽어 보관했다가 다시 앞에 붙이므로
+    일회용 이터러블(제너레이터 등)도 모든 문서가 출력에 포함됨
+    """
+    documents = iter_documents(source)
+    if vectorizer is None:
+        sample = list(islice(documents, vectorizer_params.get("sample_size", 0)))
+        vectorizer = make_stream_vectorizer(sample, **vectorizer_params)
+        documents = chain(sample, documents)
+    for batch in iter_batches(documents, batch_size):
+        yield vectorizer.transform(batch).tocsr()
+
+def write_blocks(blocks, out_dir: str) -> dict:
+    """CSR 블록을 out_dir/block_NNNNNN.npz 로 하나씩 바로 저장 (이전 실행의 블록 파일은 먼저 삭제)"""
+    os.makedirs(out_dir, exist_ok=True)
+    for path in glob.glob(os.path.join(out_dir, "block_*.npz")): # 더 길었던 이전 결과가 read_blocks 에 섞이지 않도록
+        os.remove(path)
+    stats = {"blocks": 0, "documents": 0, "nnz": 0}
+    for i, block in enumerate(blocks):
+        sp.save_npz(os.path.join(out_dir, BLOCK_PATTERN.format(i)), block, compressed=False)
+        stats["blocks"] += 1
+        stats["documents"] += block.shape[0]
+        stats["nnz"] += block.nnz
+    return stats
+
+def read_blocks(out_dir: str):
+    """write_blocks 로 저장한 블록을 순서대로 하나씩"""
+    for path in sorted(glob.glob(os.path.join(out_dir, "block_*.npz"))):
+        yield sp.load_npz(path)
+
+# --- 병렬 (청크별 토큰화 후 하나의 어휘로 합침) ---
+def _vectorize_chunk(args):
+    """워커: 청크 안의 어휘로 fit_transform (토큰화는 이 한 번뿐)"""
+    docs, binary = args
+    dtype = np.uint8 if binary else np.int64
+    vectorizer = make_vectorizer(binary, None, dtype)
+    try:
+        matrix = vectorizer.fit_transform(docs).tocsr()
+    except ValueError: # 청크 전체가 빈 문서/불용어뿐이면 어휘가 없음 (다른 청크에는 있을 수 있음)
+        return sp.csr_matrix((len(docs), 0), dtype=dtype), np.array([], dtype=object)
+    return matrix, vectorizer.get_feature_names_out()
+
+def term_totals(matrix, names) -> dict:
+    """청크 행렬의 단어별 합계 (binary 면 문서 빈도)"""
+    return dict(zip(names.tolist(), np.asarray(matrix.sum(axis=0)).ravel().tolist()))
+
+def vocabulary_from_totals(totals: dict, max_features: int = MAX_FEATURES, dtype=np.uint8) -> dict:
+    """CountVectorizer 와 같은 규칙으로 어휘 선택
+
+    알파벳 순 단어의 합계(binary 면 문서 빈도)를 CountVectorizer._limit_features 와 같은 (-합계).argsort() 로
+    골라 동점 처리까지 맞춘 뒤 (안정 정렬이 아님) 알파벳 순으로 번호 부여. dtype 은 fit 했을 행렬의 dtype
+    """
+    terms = sorted(totals)
+    if max_features is not None and max_features < len(terms):
+        # 합계 배열의 dtype 도 fit 때의 X.sum(axis=0) 과 같게 (uint8 행렬 -> uint64)
+        sum_dtype = np.zeros(0, dtype).sum().dtype
+        tfs = np.array([totals[term] for term in terms], dtype=sum_dtype)
+        terms = [terms[i] for i in np.sort((-tfs).argsort()[:max_features])]
+    return {term: i for i, term in enumerate(terms)}
+
+def select_vocabulary(chunks, max_features: int = MAX_FEATURES, dtype=np.uint8) -> dict:
+    """청크별 (행렬, 단어 이름) 의 단어 합계를 더해 공통 어휘 선택"""
+    totals = {}
+    for matrix, names in chunks:
+        for name, count in term_totals(matrix, names).items():
+            totals[name] = totals.get(name, 0) + count
+    return vocabulary_from_totals(totals, max_features, dtype)
+
+def remap_columns(matrix, names, vocabulary: dict):
+    """청크 어휘의 열 번호를 공통 어휘의 열 번호로 바꾸고, 공통 어휘에 없는 열은 제거"""
+    mapping = np.array([vocabulary.get(name, -1) for name in names.tolist()], dtype=np.int64)
+    coo = matrix.tocoo()
+    columns = mapping[coo.col]
+    keep = columns >= 0
+    remapped = sp.csr_matrix((coo.data[keep], (coo.row[keep], columns[keep])),
+                             shape=(matrix.shape[0], len(vocabulary)), dtype=matrix.dtype)
+    remapped.sort_indices()
+    return remapped
+
+def parallel_vectors(text, workers: int = None, chunk_size: int = PARALLEL_CHUNK, output: str = "csr",
+                     binary: bool = True, max_features: int = MAX_FEATURES):
+    """comparison_vectors 와 같은 결과를 프로세스 풀에서 계산
+
+    문서를 청크로 나눠 워커마다 토큰화하고, 부모에서 단어 합계로 공통 어휘를 고른 뒤
+    각 청크의 열 번호를 바꿔 순서대로 쌓음 (각 문서는 한 번만 토큰화)
+    """
+    workers = workers or os.cpu_count() or 1
+    tasks = [(text[start:start + chunk_size], binary) for start in range(0, len(text), chunk_size)]
+    if workers <= 1 or len(tasks) <= 1:
+        chunks = [_vectorize_chunk(task) for task in tasks]
+    else:
+        with ProcessPoolExecutor(workers) as pool:
+            chunks = list(pool.map(_vectorize_chunk, tasks))
+    # comparison_vectors 가 fit 하는 행렬과 같은 dtype 기준으로 어휘 선택
+    vocabulary = select_vocabulary(chunks, max_features, np.uint8 if binary and output != "dense" else np.int64)
+    if not vocabulary: # 직렬 fit_transform 과 같은 오류
+        raise ValueError("empty vocabulary; perhaps the documents only contain stop words")
+    matrix = sp.vstack([remap_columns(matrix, names, vocabulary) for matrix, names in chunks], format="csr")
+    if output == "dense":
+        matrix = matrix.astype(np.int64)
+    return format_output(matrix, output, binary)
+
+# --- 어휘 캐시 (같은 말뭉치 / 뒤에 문서가 추가된 말뭉치의 재학습 생략) ---
+def corpus_fingerprints(text, lengths) -> dict:
+    """앞에서부터 n 개 문서의 sha1 (lengths 에 있는 n 마다, 문서 경계가 섞이지 않도록 길이를 함께 해시)"""
+    wanted = set(lengths)
+    digest = hashlib.sha1()
+    found = {0: digest.hexdigest()} if 0 in wanted else {}
+    for n, doc in enumerate(text, 1):
+        data = doc.encode("utf-8")
+        digest.update(len(data).to_bytes(8, "little"))
+        digest.update(data)
+        if n in wanted:
+            found[n] = digest.hexdigest()
+    return found
+
+class VocabularyCache:
+    """말뭉치 지문 -> 단어별 합계를 보관하는 SQLite 캐시 (최근 사용 순 LRU)
+
+    max_features 에 따른 어휘 선택은 단어별 합계로 바로 계산되므로 합계를 (지문, binary) 로 저장해
+    max_features 가 달라도 같은 항목을 사용. 뒤에 문서가 추가된 말뭉치는 추가된 문서만 토큰화해 합계를 갱신
+    """
+    def __init__(self, path: str = VOCAB_CACHE_FILE, max_entries: int = VOCAB_CACHE_ENTRIES):
+        self.max_entries = max_entries
+        self.conn = sqlite3.connect(path)
+        self.conn.execute("CREATE TABLE IF NOT EXISTS vocab ("
+                          "fingerprint TEXT, binary INTEGER, n_docs INTEGER, totals BLOB, last_used REAL, "
+                          "PRIMARY KEY (fingerprint, binary))")
+        self.conn.execute("CREATE INDEX IF NOT EXISTS idx_vocab_docs ON vocab(binary, n_docs)")
+        self.last_status = None # "hit" | "append" | "miss"
+
+    def _longest_prefix(self, text, binary: bool):
+        """저장된 항목 중 text 의 가장 긴 앞부분과 같은 말뭉치 -> (n_docs, 지문, 합계, 전체 지문)"""
+        rows = self.conn.execute("SELECT n_docs, fingerprint FROM vocab WHERE binary = ? AND n_docs <= ?",
+                                 (int(binary), len(text))).fetchall()
+        fingerprints = corpus_fingerprints(text, [n for n, _ in rows] + [len(text)])
+        matches = [(n, fp) for n, fp in rows if fingerprints.get(n) == fp]
+        if not matches:
+            return 0, None, None, fingerprints[len(text)]
+        n, fp = max(matches)
+        (blob,) = self.conn.execute("SELECT totals FROM vocab WHERE fingerprint = ? AND binary = ?",
+                                    (fp, int(binary))).fetchone()
+        return n, fp, pickle.loads(blob), fingerprints[len(text)]
+
+    def _store(self, fingerprint: str, binary: bool, n_docs: int, totals: dict):
+        with self.conn:
+            self.conn.execute("INSERT OR REPLACE INTO vocab VALUES (?, ?, ?, ?, ?)",
+                              (fingerprint, int(binary), n_docs,
+                               pickle.dumps(totals, protocol=pickle.HIGHEST_PROTOCOL), time.time()))
+            self.conn.execute("DELETE FROM vocab WHERE rowid NOT IN "
+                              "(SELECT rowid FROM vocab ORDER BY last_used DESC LIMIT ?)", (self.max_entries,))
+
+    def _touch(self, fingerprint: str, binary: bool):
+        with self.conn:
+            self.conn.execute("UPDATE vocab SET last_used = ? WHERE fingerprint = ? AND binary = ?",
+                              (time.time(), fingerprint, int(binary)))
+
+    def _totals(self, text, binary: bool):
+        """-> (단어별 합계, 캐시에서 재사용한 앞쪽 문서 수, 새로 토큰화한 (행렬, 이름) 또는 None)"""
+        n_cached, cached_fp, totals, full_fp = self._longest_prefix(text, binary)
+        if n_cached == len(text) and totals is not None:
+            self.last_status = "hit"
+            self._touch(cached_fp, binary)
+            return totals, n_cached, None
+
+        # 처음 보거나 뒤에 문서가 추가된 말뭉치: 새 문서만 토큰화해 합계를 갱신
+        self.last_status = "append" if totals is not None else "miss"
+        new_chunk = _vectorize_chunk((text[n_cached:], binary))
+        totals = dict(totals or {})
+        for name, count in term_totals(*new_chunk).items():
+            totals[name] = totals.get(name, 0) + count
+        self._store(full_fp, binary, len(text), totals)
+        return totals, n_cached, new_chunk
+
+    def vocabulary(self, text, binary: bool = True, max_features: int = MAX_FEATURES, dtype=None) -> dict:
+        """fit 한 CountVectorizer(binary, max_features, dtype).vocabulary_ 와 같은 어휘 (같은 말뭉치면 토큰화 없음)
+
+        dtype 기본값은 comparison_vectors 의 희소 출력과 같음 (binary 면 uint8, 아니면 int64)
+        """
+        totals, _, _ = self._totals(list(text), binary)
+        return self._select(totals, binary, max_features, dtype)
+
+    def vectors(self, text, binary: bool = True, max_features: int = MAX_FEATURES, dtype=None):
+        """comparison_vectors(cache=...) 용: 어휘를 캐시에서 얻어 CSR 행렬을 반환 (각 문서는 한 번만 토큰화)"""
+        text = list(text)
+        totals, n_cached, new_chunk = self._totals(text, binary)
+        vocabulary = self._select(totals, binary, max_features, dtype)
+        blocks = []
+        if n_cached:
+            blocks.append(txt.CountVectorizer(binary=binary, vocabulary=vocabulary).transform(text[:n_cached]))
+        if new_chunk is not None:
+            blocks.append(remap_columns(*new_chunk, vocabulary))
+        return sp.vstack(blocks, format="csr")
+
+    @staticmethod
+    def _select(totals: dict, binary: bool, max_features: int, dtype) -> dict:
+        vocabulary = vocabulary_from_totals(totals, max_features, dtype or (np.uint8 if binary else np.int64))
+        if not vocabulary: # 새로 fit 할 때와 같은 오류
+            raise ValueError("empty vocabulary; perhaps the documents only contain stop words")
+        return vocabulary
+
+    def close(self):
+        self.conn.close()
@@ -0,0 +1,288 @@
+"""라인 리스트/변환 배치의 스트리밍 읽기·쓰기 (.xlsx, .xls, .csv, 결과는 .arrow/.parquet 도 가능)
+
+행을 chunk_size 단위로 읽어 열 배열 딕셔너리로 배치 엔진에 넘기고, 결과도 청크 단위로 바로
+기록하므로 10만 행 통합 문서도 메모리 사용량이 행 수와 무관하게 유지됨
+(.xls 는 형식상 시트를 한 번에 읽으므로 xlrd 의 on_demand 로 필요한 시트만 로드)
+"""
+import os
+import sys
+import csv
+import time
+import argparse
+from typing import Dict, Iterator, List, Tuple
+import numpy as np
+
+from units import convert_array
+from thickness import thickness_from_columns
+from reference_data import load_reference_data
+
+CHUNK_SIZE = 10000
+
+# --- 1. 행 단위 읽기 ---
+def iter_rows(path: str, sheet=0) -> Iterator[list]:
+    """파일 형식에 맞게 행을 하나씩 돌려줌 (첫 행은 헤더)"""
+    ext = os.path.splitext(path)[1].lower()
+    if ext == ".xlsx":
+        try:
+            import openpyxl
+        except ImportError:
+            raise ImportError("reading .xlsx requires openpyxl (pip install openpyxl)")
+        workbook = openpyxl.load_workbook(path, read_only=True, data_only=True)
+        try:
+            worksheet = workbook.worksheets[sheet] if isinstance(sheet, int) else workbook[sheet]
+            yield from worksheet.iter_rows(values_only=True)
+        finally:
+            workbook.close()
+    elif ext == ".xls":
+        try:
+            import xlrd
+        except ImportError:
+            raise ImportError("reading .xls requires xlrd (pip install xlrd)")
+        workbook = xlrd.open_workbook(path, on_demand=True)
+        try:
+            worksheet = workbook.sheet_by_index(sheet) if isinstance(sheet, int) else workbook.sheet_by_name(sheet)
+            for r in range(worksheet.nrows):
+                yield worksheet.row_values(r)
+        finally:
+            workbook.release_resources()
+    elif ext == ".csv":
+        with open(path, newline="", encoding="utf-8-sig") as f:
+            yield from csv.reader(f)
+    else:
+        raise ValueError(f"Unsupported line list format: {ext}")
+
+def _to_array(values: list) -> np.ndarray:
+    """숫자 열은 float 배열(빈 칸 nan), 그 외는 문자열 배열"""
+    cleaned = [np.nan if v is None or v == "" else v for v in values]
+    try:
+        return np.array(cleaned, dtype=float)
+    except (ValueError, TypeError):
+        return np.array(["" if v is None else str(v) for v in values])
+
+def iter_chunks(path: str, chunk_size: int = CHUNK_SIZE, sheet=0) -> Iterator[Dict[str, np.ndarray]]:
+    """헤더 이름 -> 열 배열 딕셔너리를 chunk_size 행씩 돌려줌"""
+    rows = iter_rows(path, sheet)
+    header = [str(h).strip() for h in next(rows)]
+    buffer: List[list] = []
+    for row in rows:
+        buffer.append(row)
+        if len(buffer) == chunk_size:
+            yield _columns(header, buffer)
+            buffer = []
+    if buffer:
+        yield _columns(header, buffer)
+
+def _columns(header: List[str], rows: List[list]) -> Dict[str, np.ndarray]:
+    width = len(header)
+    cols = list(zip(*(list(r[:width]) + [None] * (width - len(r)) for r in rows)))
+    return {name: _to_array(list(col)) for name, col in zip(header, cols) if name}
+
+# --- 2. 청크 단위 쓰기 ---
+ARROW_FORMATS = (".arrow", ".feather", ".parquet")
+
+# 엔진 입력/결과 열의 기본 단위 (Arrow/Parquet 필드 메타데이터로 기록)
+COLUMN_UNITS = {
+    "pressure": "MPa", "diameter": "mm", "stress": "MPa", "corrosion": "mm",
+    "temperature": "˚C", "thickness": "mm", "inner_diameter": "mm", "length": "m",
+    "density": "kg/m³", "velocity": "m/s", "pressure_drop": "kPa/100 m", # line_sizing 결과 기준
+    "outside_diameter": "mm", "wall_thickness": "mm", "required_thickness": "mm",
+}
+# Arrow/Parquet 열 형식 ("float" | "string"): 단위가 있는 열은 숫자
+COLUMN_TYPES = {name: "float" for name in COLUMN_UNITS}
+
+def _is_blank(v) -> bool:
+    return v is None or v == "" or (isinstance(v, float) and v != v)
+
+def arrow_column(values: np.ndarray, as_string: bool = False):
+    """numpy 배열 -> Arrow 배열
+
+    숫자 열: float64 는 복사 없이 같은 버퍼를 사용 (nan 은 값으로 유지), 문자열로 읽힌 청크는 빈 칸을 nan 으로 변환
+    (숫자가 아닌 값이 있으면 ValueError). as_string: 문자열 열, 빈 칸은 null
+    """
+    import pyarrow as pa
+    values = np.asarray(values)
+    if as_string:
+        return pa.array([None if _is_blank(v) else str(v) for v in values.tolist()], pa.string())
+    if values.dtype.kind != "f":
+        values = _to_array(values.tolist())
+        if values.dtype.kind != "f":
+            raise ValueError("숫자가 아닌 값이 있음")
+    values = np.ascontiguousarray(values, dtype=np.float64)
+    return pa.Array.from_buffers(pa.float64(), len(values), [None, pa.py_buffer(values)])
+
+class LineListWriter:
+    """열 배열 딕셔너리를 받아 바로 기록
+
+    .xlsx: openpyxl write_only / .csv: csv / .arrow, .feather: Arrow IPC 파일 / .parquet: Parquet
+    Arrow/Parquet 스키마(float64, string)는 types (COLUMN_TYPES 와 합침) 로 정하고, 선언이 없는 열은 첫 청크의 dtype
+    을 따름. 첫 청크에서 빈 칸뿐인 열은 뒤에 글자가 올 수 있으므로 문자열(null 허용)로 둠. units 는 필드 메타데이터
+    """
+    def __init__(self, path: str, header: List[str], units: Dict[str, str] = None, types: Dict[str, str] = None):
+        self.path = path
+        self.header = header
+        self.units = {**COLUMN_UNITS, **(units or {})}
+        self.types = {**COLUMN_TYPES, **(types or {})}
+        self.ext = os.path.splitext(path)[1].lower()
+        if self.ext == ".xlsx":
+            try:
+                import openpyxl
+            except ImportError:
+                raise ImportError("writing .xlsx requires openpyxl (pip install openpyxl)")
+            self.workbook = openpyxl.Workbook(write_only=True)
+            self.sheet = self.workbook.create_sheet()
+            self.sheet.append(header)
+        elif self.ext == ".csv":
+            self.file = open(path, "w", newline="", encoding="utf-8")
+            self.writer = csv.writer(self.file)
+            self.writer.writerow(header)
+        elif self.ext in ARROW_FORMATS:
+            try:
+                import pyarrow
+            except ImportError:
+                raise ImportError(f"writing {self.ext} requires pyarrow (pip install pyarrow)")
+            self.writer = None # 첫 청크에서 스키마를 정한 뒤 생성
+        else:
+            raise ValueError(f"Unsupported output format: {self.ext} (use .xlsx, .csv, .arrow or .parquet)")
+
+    def write_chunk(self, columns: Dict[str, np.ndarray]):
+        if self.ext in ARROW_FORMATS:
+            self._write_arrow(columns)
+            return
+        rows = zip(*(np.asarray(columns[name]).tolist() for name in self.header))
+        if self.ext == ".xlsx":
+            for row in rows:
+                self.sheet.append([None if v != v else v for v in row])
+        else:
+            self.writer.writerows(["" if v != v else v for v in row] for row in rows)
+
+    def _write_arrow(self, columns: Dict[str, np.ndarray]):
+        import pyarrow as pa
+        if self.writer is None:
+            kinds = {"float": pa.float64(), "string": pa.string()}
+            fields = [pa.field(name, kinds[self._column_type(name, columns[name])],
+                               metadata={"unit": self.units[name]} if name in self.units else None)
+                      for name in self.header]
+            self.schema = pa.schema(fields)
+            if self.ext == ".parquet":
+                import pyarrow.parquet as pq
+                self.writer = pq.ParquetWriter(self.path, self.schema)
+            else:
+                self.writer = pa.ipc.new_file(self.path, self.schema)
+        arrays = []
+        for name, field in zip(self.header, self.schema):
+            try:
+                arrays.append(arrow_column(columns[name], field.type == pa.string()))
+            except ValueError as e:
+                raise ValueError(f"'{name}' 열: {e} (문자열 열이면 types={{'{name}': 'string'}} 으로 지정)") from e
+        batch = pa.record_batch(arrays, schema=self.schema)
+        if self.ext == ".parquet":
+            self.writer.write_batch(batch)
+        else:
+            self.writer.write(batch)
+
+    def _column_type(self, name: str, values) -> str:
+        if name in self.types:
+            return self.types[name]
+        values = np.asarray(values)
+        if values.dtype.kind == "f" and not np.isnan(values).all():
+            return "float"
+        return "string"
+
+    def close(self):
+        if self.ext == ".xlsx":
+            self.workbook.save(self.path)
+        elif self.ext == ".csv":
+            self.file.close()
+        elif self.writer is not None:
+            self.writer.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+def write_columns(path: str, columns: Dict[str, np.ndarray], units: Dict[str, str] = None,
+                  types: Dict[str, str] = None):
+    """배치 결과(열 배열 딕셔너리) 하나를 통째로 기록"""
+    with LineListWriter(path, list(columns), units, types) as writer:
+        writer.write_chunk(columns)
+
+def read_columns(path: str) -> Tuple[Dict[str, np.ndarray], Dict[str, str]]:
+    """Arrow/Parquet 파일을 (열 배열 딕셔너리, 열 단위) 로 읽음 (float64 열은 복사 없이 numpy 로)"""
+    import pyarrow as pa
+    if path.lower().endswith(".parquet"):
+        import pyarrow.parquet as pq
+        table = pq.read_table(path)
+    else:
+        with pa.memory_map(path) as source:
+            table = pa.ipc.open_file(source).read_all()
+    columns = {}
+    for name in table.column_names:
+        chunked = table.column(name)
+        array = chunked.chunk(0) if chunked.num_chunks == 1 else pa.concat_arrays(chunked.chunks)
+        columns[name] = array.to_numpy(zero_copy_only=False)
+    units = {f.name: f.metadata[b"unit"].decode("utf-8") for f in table.schema
+             if f.metadata and b"unit" in f.metadata}
+    return columns, units
+
+# --- 3. 스트리밍 배치 처리 ---
+def stream_process(in_path: str, out_path: str, process, result_names: List[str],
+                   chunk_size: int = CHUNK_SIZE, units: Dict[str, str] = None,
+                   types: Dict[str, str] = None) -> Dict[str, float]:
+    """청크마다 process(열 딕셔너리) -> 결과 열 딕셔너리 를 계산해 입력 열과 함께 기록
+
+    반환: 처리 행 수, 소요 시간, 초당 행 수
+    """
+    start = time.perf_counter()
+    total = 0
+    writer = None
+    try:
+        for chunk in iter_chunks(in_path, chunk_size):
+            results = process(chunk)
+            if writer is None:
+                writer = LineListWriter(out_path, list(chunk) + result_names, units, types)
+            writer.write_chunk({**chunk, **results})
+            total += len(next(iter(chunk.values())))
+    finally:
+        if writer is not None:
+            writer.close()
+    elapsed = time.perf_counter() - start
+    return {"rows": total, "seconds": elapsed, "rows_per_second": total / elapsed if elapsed else 0.0}
+
+def stream_thickness(in_path: str, out_path: str, chunk_size: int = CHUNK_SIZE, db=None) -> Dict[str, float]:
+    """라인 리스트의 요구 두께를 청크 단위로 계산해 'thickness' 열로 기록"""
+    db = db or load_reference_data()
+    return stream_process(in_path, out_path, lambda c: {"thickness": thickness_from_columns(c, db)},
+                          ["thickness"], chunk_size)
+
+def stream_convert(in_path: str, out_path: str, column: str, category: str, in_unit: str, out_unit: str,
+                   chunk_size: int = CHUNK_SIZE) -> Dict[str, float]:
+    """한 열을 단위 환산해 '<열>_<단위>' 열로 기록"""
+    name = f"{column}_{out_unit}"
+    return stream_process(in_path, out_path,
+                          lambda c: {name: convert_array(c[column], category, in_unit, out_unit)},
+                          [name], chunk_size, {column: in_unit, name: out_unit})
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Streaming line list import/export")
+    sub = parser.add_subparsers(dest="command", required=True)
+    p_thick = sub.add_parser("thickness", help="required wall thickness per line")
+    p_conv = sub.add_parser("convert", help="unit conversion of one column")
+    for p in (p_thick, p_conv):
+        p.add_argument("input")
+        p.add_argument("output")
+        p.add_argument("--chunk-size", type=int, default=CHUNK_SIZE)
+    p_conv.add_argument("--column", required=True)
+    p_conv.add_argument("--category", required=True)
+    p_conv.add_argument("--from", dest="in_unit", required=True)
+    p_conv.add_argument("--to", dest="out_unit", required=True)
+    args = parser.parse_args()
+
+    if args.command == "thickness":
+        stats = stream_thickness(args.input, args.output, args.chunk_size)
+    else:
+        stats = stream_convert(args.input, args.output, args.column, args.category,
+                               args.in_unit, args.out_unit, args.chunk_size)
+    print(f"{stats['rows']} rows in {stats['seconds']:.2f} s ({stats['rows_per_second']:,.0f} rows/s)",
+          file=sys.stderr)
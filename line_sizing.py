@@ -0,0 +1,134 @@
+"""라인 사이징: 유속/압력 손실 제한과 벽 두께 검토를 모두 만족하는 최소 NPS/스케줄 선정
+
+라인별 반복 대입 대신 (라인 × NPS × 스케줄) 배열을 한 번에 평가한 뒤,
+NPS·두께 순으로 정렬된 후보 축에서 첫 번째 만족 위치를 argmax 로 찾음
+"""
+import sys
+import csv
+from typing import Dict, List, Tuple
+import numpy as np
+
+from units import UnitSpec
+from pressure_drop import pressure_drop
+from thickness import required_thickness
+from reference_data import load_reference_data
+
+CONSTRAINTS = ["velocity", "pressure drop", "wall thickness"]
+
+# --- 1. 배관 규격표 (piping_data.json 의 pipe_size_data) ---
+def pipe_size_table(db: Dict[str, List[List[str]]]) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """(NPS 이름, 외경 mm, 스케줄 이름, 두께 mm [NPS × 스케줄]) 을 외경·두께 오름차순으로 반환
+
+    값이 없는 칸("", "...") 은 nan 이며 해당 스케줄은 후보에서 제외됨
+    """
+    header, *rows = db["pipe_size_data"]
+    schedules = np.array(header[2:])
+    nps = np.array([r[0] for r in rows])
+    od = np.array([float(r[1]) for r in rows])
+
+    def to_float(text: str) -> float:
+        try:
+            return float(text)
+        except ValueError:
+            return np.nan
+    wall = np.array([[to_float(v) for v in r[2:]] for r in rows])
+
+    order = np.argsort(od, kind="stable")
+    nps, od, wall = nps[order], od[order], wall[order]
+    sch_order = np.argsort(np.nanmean(wall, axis=0), kind="stable")
+    return nps, od, schedules[sch_order], wall[:, sch_order]
+
+# --- 2. 일괄 사이징 ---
+def size_lines(flow, flow_unit: UnitSpec, density, viscosity, viscosity_unit: UnitSpec,
+               pressure, stress, quality, weld, coeff, corrosion=0.0,
+               max_velocity=3.0, max_pressure_drop=50.0, roughness=0.045,
+               mill_tolerance=0.125, db=None) -> Dict[str, np.ndarray]:
+    """라인 리스트 전체에 대해 최소 NPS/스케줄을 선정
+
+    pressure, stress: MPa / corrosion, roughness: mm / density: kg/m³
+    max_velocity: m/s / max_pressure_drop: kPa per 100 m
+    벽 두께 검토: 공칭 두께 × (1 - mill_tolerance) ≥ 요구 두께 (PipeThicknessWidget 과 같은 식)
+    """
+    nps, od, schedules, wall = pipe_size_table(db or load_reference_data())
+    columns = np.broadcast_arrays(*(np.atleast_1d(np.asarray(v, dtype=float)) for v in
+                                    (flow, density, viscosity, pressure, stress, quality, weld, coeff,
+                                     corrosion, max_velocity, max_pressure_drop, roughness)))
+    flow, density, viscosity, pressure, stress, quality, weld, coeff, \
+        corrosion, max_velocity, max_pressure_drop, roughness = columns
+    n = flow.shape[0]
+    flow_unit = flow_unit if isinstance(flow_unit, str) else np.asarray(flow_unit)
+    viscosity_unit = viscosity_unit if isinstance(viscosity_unit, str) else np.asarray(viscosity_unit)
+
+    # 벽 두께: 라인 × NPS 요구 두께와 NPS × 스케줄 공칭 두께 비교 -> NPS 별 가장 얇은 통과 스케줄
+    t_req = required_thickness(pressure[:, None], od[None, :], stress[:, None], quality[:, None],
+                               weld[:, None], coeff[:, None], corrosion[:, None])
+    wall_ok = (wall[None, :, :] * (1 - mill_tolerance)) >= t_req[:, :, None]
+    has_schedule = wall_ok.any(axis=2)
+    sch_idx = np.argmax(wall_ok, axis=2)
+    # 통과 스케줄이 없으면 가장 얇은 스케줄로 수력 계산 (결과는 벽 두께 불만족)
+    thinnest = np.argmax(~np.isnan(wall), axis=1)
+    sch_idx = np.where(has_schedule, sch_idx, thinnest[None, :])
+    chosen_wall = wall[np.arange(len(od))[None, :], sch_idx]
+    inner = od[None, :] - 2 * chosen_wall
+
+    # 수력 계산: 라인 × NPS 후보 전체를 한 번의 배열 연산으로
+    m = len(od)
+    hyd = pressure_drop(np.repeat(flow, m),
+                        flow_unit if isinstance(flow_unit, str) else np.repeat(flow_unit, m),
+                        inner.ravel(), 100.0, np.repeat(density, m), np.repeat(viscosity, m),
+                        viscosity_unit if isinstance(viscosity_unit, str) else np.repeat(viscosity_unit, m),
+                        np.repeat(roughness, m))
+    velocity = hyd["velocity"].reshape(n, m)
+    dp = hyd["pressure_drop"].reshape(n, m)
+
+    checks = np.stack([velocity <= max_velocity[:, None],
+                       dp <= max_pressure_drop[:, None],
+                       has_schedule], axis=2)                 # 라인 × NPS × 제약조건
+    feasible = checks.all(axis=2)
+    found = feasible.any(axis=1)
+    pick = np.where(found, np.argmax(feasible, axis=1), m - 1)
+    rows = np.arange(n)
+
+    # 지배 제약조건: 선정 NPS 바로 아래 크기를 탈락시킨 첫 번째 조건
+    below = np.clip(pick - 1, 0, None)
+    failed = np.where(found, below, pick)
+    governing = np.array(CONSTRAINTS)[np.argmax(~checks[rows, failed], axis=1)]
+    governing = np.where(found & (pick == 0), "minimum size", governing)
+    governing = np.where(found, governing, "no size: " + governing.astype(object))
+
+    picked_sch = sch_idx[rows, pick]
+    return {
+        "nps": np.where(found, nps[pick], ""),
+        "schedule": np.where(found, schedules[picked_sch], ""),
+        "outside_diameter": np.where(found, od[pick], np.nan),
+        "wall_thickness": np.where(found, wall[pick, picked_sch], np.nan),
+        "required_thickness": t_req[rows, pick],
+        "velocity": velocity[rows, pick],
+        "pressure_drop": dp[rows, pick],                       # kPa/100 m
+        "governing": governing.astype(str),
+    }
+
+def format_sizing_table(result: Dict[str, np.ndarray]) -> str:
+    """라인별 선정 결과와 지배 제약조건을 표 형태의 문자열로"""
+    lines = [f"{'Line':>5} {'NPS':>6} {'SCH':>8} {'t_req(mm)':>10} {'V(m/s)':>8} {'dP(kPa/100m)':>13}  Governing"]
+    for i in range(len(result["nps"])):
+        lines.append(f"{i + 1:>5} {result['nps'][i]:>6} {result['schedule'][i]:>8} "
+                     f"{result['required_thickness'][i]:>10.3f} {result['velocity'][i]:>8.2f} "
+                     f"{result['pressure_drop'][i]:>13.2f}  {result['governing'][i]}")
+    return "\n".join(lines)
+
+# --- 3. CSV 라인 리스트 사이징 ---
+TEXT_COLUMNS = ("flow_unit", "viscosity_unit")
+
+def read_line_list_csv(path: str) -> Dict[str, np.ndarray]:
+    """헤더가 size_lines 인자 이름인 CSV 를 열 배열 딕셔너리로 읽음"""
+    with open(path, newline="", encoding="utf-8") as f:
+        rows = list(csv.DictReader(f))
+    return {key: np.array([r[key] for r in rows], dtype=str if key in TEXT_COLUMNS else float)
+            for key in rows[0]}
+
+if __name__ == "__main__":
+    if len(sys.argv) != 2:
+        print("usage: python line_sizing.py <line_list.csv>")
+        sys.exit(1)
+    print(format_sizing_table(size_lines(**read_line_list_csv(sys.argv[1]))))
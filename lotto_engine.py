@@ -0,0 +1,265 @@
+"""로또 번호 추첨 엔진 (Qt 없이 사용 가능)
+
+1..45 에서 서로 다른 6개를 뽑는 추첨을 한 번에 N 개씩 numpy 로 생성하고,
+번호 묶음을 uint64 비트마스크(번호 n -> 비트 n-1)로 바꿔 AND + popcount 로 일치 개수를 계산
+"""
+import re
+import sys
+import time
+import argparse
+from typing import Dict, Optional
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+
+POOL = 45   # 번호 범위 1..POOL
+PICK = 6    # 한 번 추첨에 뽑는 개수
+SIM_CHUNK = 1 << 20     # 시뮬레이션 청크 당 추첨 수 (청크마다 독립 난수열)
+STATS_CHUNK = 1 << 16   # 통계 갱신 단위 (추첨 수와 관계없이 중간 배열 크기 고정)
+MAX_GAP = 200           # 간격 분포의 마지막 칸은 MAX_GAP 이상 전체
+MAX_STREAK = 20         # 연속 출현 분포의 마지막 칸은 MAX_STREAK 이상 전체
+MATCH_BLOCK = 1 << 18   # 일치 계산 시 한 번에 만드는 (티켓 x 추첨) 쌍 수 (uint64 2 MB, CPU 캐시 크기)
+
+# --- 1. 추첨 ---
+def draw(n: int, k: int = PICK, pool: int = POOL, rng: Optional[np.random.Generator] = None) -> np.ndarray:
+    """비복원 추출 n 회 -> (n, k) uint8 배열, 각 행은 오름차순
+
+    Floyd 알고리즘을 열 단위로 벡터화: j = pool-k .. pool-1 에 대해 0..j 에서 t 를 뽑고,
+    이미 뽑힌 값이면 j 를 넣음. k 번의 반복만으로 모든 조합이 같은 확률로 나옴
+    """
+    if not 0 < k <= pool <= 255:
+        raise ValueError(f"1 <= k <= pool <= 255 이어야 함 (k={k}, pool={pool})")
+    rng = rng if rng is not None else np.random.default_rng()
+    out = np.empty((n, k), dtype=np.uint8)
+    for i, j in enumerate(range(pool - k, pool)):
+        t = rng.integers(0, j + 1, size=n, dtype=np.uint8)
+        duplicate = (out[:, :i] == t[:, None]).any(axis=1)
+        out[:, i] = np.where(duplicate, j, t)
+    out += 1
+    out.sort(axis=1)
+    return out
+
+# --- 2. 비트마스크 표현 ---
+def to_masks(numbers) -> np.ndarray:
+    """(n, k) 번호 배열 -> (n,) uint64 비트마스크"""
+    numbers = np.atleast_2d(np.asarray(numbers))
+    if numbers.size and (numbers.min() < 1 or numbers.max() > 64):
+        raise ValueError("번호는 1..64 범위여야 함")
+    bits = np.left_shift(np.uint64(1), numbers.astype(np.uint64) - np.uint64(1))
+    return np.bitwise_or.reduce(bits, axis=1)
+
+def from_masks(masks, pool: int = POOL) -> np.ndarray:
+    """(n,) uint64 비트마스크 -> (n, k) 번호 배열 (모든 마스크의 비트 수가 같아야 함)"""
+    masks = np.ascontiguousarray(np.atleast_1d(masks), dtype="<u8")
+    bits = np.unpackbits(masks.view(np.uint8).reshape(-1, 8), axis=1, bitorder="little")[:, :pool]
+    _, cols = np.nonzero(bits)
+    return (cols + 1).astype(np.uint8).reshape(len(masks), -1)
+
+if hasattr(np, "bitwise_count"): # numpy >= 2.0
+    def popcount(values: np.ndarray) -> np.ndarray:
+        return np.bitwise_count(values)
+else:
+    _BYTE_COUNTS = np.array([bin(i).count("1") for i in range(256)], dtype=np.uint8)
+
+    def popcount(values: np.ndarray) -> np.ndarray:
+        values = np.ascontiguousarray(values, dtype=np.uint64)
+        return _BYTE_COUNTS[values.view(np.uint8)].reshape(values.shape + (8,)).sum(axis=-1, dtype=np.uint8)
+
+# --- 3. 티켓 x 추첨 이력 일치 개수 ---
+def match_histogram(tickets: np.ndarray, draws: np.ndarray, per_ticket: bool = False,
+                    k: int = PICK) -> np.ndarray:
+    """티켓 마스크와 추첨 마스크의 모든 쌍에 대해 일치 개수(0..k)별 건수
+
+    per_ticket=False 면 (k+1,) 전체 합계, True 면 (티켓 수, k+1)
+    (티켓 x 추첨) 쌍을 MATCH_BLOCK 크기로 나눠 계산하므로 메모리는 입력 크기와 무관
+    """
+    tickets = np.asarray(tickets, dtype=np.uint64)
+    draws = np.asarray(draws, dtype=np.uint64)
+    buckets = k + 1
+    result = np.zeros((len(tickets), buckets) if per_ticket else buckets, dtype=np.int64)
+    if not len(draws):
+        return result
+    step = max(1, MATCH_BLOCK // len(draws))
+    anded = np.empty((min(step, len(tickets)), len(draws)), dtype=np.uint64) # 블록마다 재사용
+    for start in range(0, len(tickets), step):
+        block = tickets[start:start + step]
+        pairs = anded[:len(block)]
+        np.bitwise_and(block[:, None], draws[None, :], out=pairs)
+        matches = popcount(pairs)
+        for m in range(buckets): # 값이 0..k 뿐이라 bincount(intp 변환)보다 비교 k+1 번이 빠름
+            if per_ticket:
+                result[start:start + len(block), m] = np.count_nonzero(matches == m, axis=1)
+            else:
+                result[m] += np.count_nonzero(matches == m)
+    return result
+
+# --- 4. 추첨 이력 파일 ---
+INT_FIELD_RE = re.compile(r"^\d+$")
+FIELD_SEP_RE = re.compile(r"[,\t; ]+")
+
+def load_history(path: str, bonus: bool = False, k: int = PICK, pool: int = POOL) -> np.ndarray:
+    """추첨 이력 텍스트/CSV -> (회차 수,) uint64 마스크
+
+    줄마다 정수 칸의 마지막 k 개(bonus=True 면 마지막 칸은 보너스 번호로 보고 그 앞 k 개)를 사용하므로
+    "회차,추첨일,n1..n6[,보너스]" 형식도 그대로 읽음. 정수가 모자란 줄(머리글 등)은 건너뜀
+    """
+    rows = []
+    with open(path, "r", encoding="utf-8-sig") as f:
+        for line_no, line in enumerate(f, 1):
+            ints = [int(v) for v in FIELD_SEP_RE.split(line.strip()) if INT_FIELD_RE.match(v)]
+            if bonus:
+                ints = ints[:-1]
+            if len(ints) < k:
+                continue
+            numbers = ints[-k:]
+            if len(set(numbers)) != k or min(numbers) < 1 or max(numbers) > pool:
+                raise ValueError(f"{path}:{line_no}: 잘못된 번호 {numbers}")
+            rows.append(numbers)
+    return to_masks(np.array(rows, dtype=np.uint8).reshape(-1, k))
+
+# --- 5. 누적 통계 ---
+class DrawStats:
+    """추첨이 나오는 대로 누적하는 통계 (메모리는 추첨 수와 무관)
+
+    counts: 번호별 출현 수, pairs: 두 번호가 같은 회차에 나온 수 (pool x pool, 대칭)
+    gap_hist[g]: 어떤 번호가 나온 뒤 g 회차 동안 안 나오다 다시 나온 횟수 (0 = 바로 다음 회차)
+    streak_hist[L]: 어떤 번호가 연속 L 회차 나오고 끊긴 횟수 (끝나지 않은 연속은 제외)
+    """
+    def __init__(self, pool: int = POOL, max_gap: int = MAX_GAP, max_streak: int = MAX_STREAK):
+        self.pool = pool
+        self.draws = 0
+        self.counts = np.zeros(pool, dtype=np.int64)
+        self._pair_codes = np.zeros(pool * pool, dtype=np.int64) # (작은 번호, 큰 번호) 칸만 사용
+        self.gap_hist = np.zeros(max_gap + 1, dtype=np.int64)
+        self._streaks = np.zeros(max_streak + 1, dtype=np.int64)   # 다시 나올 때 확정한 (끊긴) 연속
+        self.last_seen = np.full(pool, -1, dtype=np.int64)   # 번호별 마지막 출현 회차
+        self.run = np.zeros(pool, dtype=np.int64)            # 번호별 진행 중인 연속 출현 길이
+
+    @property
+    def pairs(self) -> np.ndarray:
+        upper = self._pair_codes.reshape(self.pool, self.pool)
+        return upper + upper.T
+
+    @property
+    def streak_hist(self) -> np.ndarray:
+        """다시 나오지 않은 번호의 연속도 마지막 회차에 없으면 끊긴 것이므로 함께 셈"""
+        ended = (self.run > 0) & (self.last_seen < self.draws - 1)
+        pending = np.minimum(self.run[ended], len(self._streaks) - 1)
+        return self._streaks + np.bincount(pending, minlength=len(self._streaks))
+
+    def update(self, draws: np.ndarray):
+        """(n, k) 오름차순 추첨 배열을 STATS_CHUNK 회씩 반영"""
+        for start in range(0, len(draws), STATS_CHUNK):
+            self._update_chunk(np.asarray(draws[start:start + STATS_CHUNK]))
+
+    def _update_chunk(self, draws: np.ndarray):
+        n, k = draws.shape
+        zero_based = draws.astype(np.int64) - 1
+        self.counts += np.bincount(zero_based.ravel(), minlength=self.pool)
+        for i in range(k - 1): # 행이 정렬되어 있으므로 (i < j) 열 조합이 곧 (작은 번호, 큰 번호)
+            codes = zero_based[:, i, None] * self.pool + zero_based[:, i + 1:]
+            self._pair_codes += np.bincount(codes.ravel(), minlength=self.pool * self.pool)
+
+        # 번호별 출현 회차 (번호 순, 같은 번호 안에서는 회차 순)
+        present = np.zeros((self.pool, n), dtype=bool)
+        present[zero_based, np.arange(n)[:, None]] = True
+        numbers, positions = np.nonzero(present)
+        positions += self.draws
+        if len(numbers):
+            first = np.r_[True, numbers[1:] != numbers[:-1]]
+            previous = np.empty_like(positions)
+            previous[1:] = positions[:-1]
+            previous[first] = self.last_seen[numbers[first]]
+            seen_before = previous >= 0
+            gaps = positions - previous - 1
+            self.gap_hist += np.bincount(np.minimum(gaps[seen_before], len(self.gap_hist) - 1),
+                                         minlength=len(self.gap_hist))
+            self._update_streaks(numbers, first, seen_before & (gaps == 0))
+            last = np.r_[first[1:], True]
+            self.last_seen[numbers[last]] = positions[last]
+        self.draws += n
+
+    def _update_streaks(self, numbers: np.ndarray, first: np.ndarray, continues: np.ndarray):
+        """출현이 직전 회차에 이어지지 않으면 그 번호의 이전 연속이 끝난 것"""
+        index = np.arange(len(numbers))
+        group_first = np.maximum.accumulate(np.where(first, index, 0))   # 같은 번호의 이 청크 첫 출현 위치
+        starts = np.flatnonzero(~continues)
+        if len(starts):
+            prev_start = np.r_[-1, starts[:-1]]
+            same_group = (prev_start >= 0) & (numbers[np.maximum(prev_start, 0)] == numbers[starts])
+            lengths = np.where(same_group, starts - prev_start,
+                               self.run[numbers[starts]] + starts - group_first[starts])
+            ended = lengths[lengths > 0]
+            self._streaks += np.bincount(np.minimum(ended, len(self._streaks) - 1),
+                                         minlength=len(self._streaks))
+        # 청크 끝에서 진행 중인 연속 길이
+        last = np.flatnonzero(np.r_[first[1:], True])
+        group_start = np.maximum.accumulate(np.where(~continues, index, -1))
+        restarted = group_start[last] >= group_first[last]
+        self.run[numbers[last]] = np.where(restarted, last - group_start[last] + 1,
+                                           self.run[numbers[last]] + last - group_first[last] + 1)
+
+# --- 6. 병렬 시뮬레이션 ---
+def chunk_rng(seed: int, index: int) -> np.random.Generator:
+    """루트 시드에서 index 번째 청크의 독립 난수열 (SeedSequence.spawn 의 index 번째 자식과 동일)"""
+    return np.random.default_rng(np.random.SeedSequence(seed, spawn_key=(index,)))
+
+def simulate_chunk(seed: int, index: int, size: int, tickets: Optional[np.ndarray] = None) -> Dict[str, np.ndarray]:
+    """청크 하나를 추첨하고 집계만 반환 (추첨 결과 자체는 프로세스 밖으로 보내지 않음)"""
+    draws = draw(size, rng=chunk_rng(seed, index))
+    stats = {"number_counts": np.bincount(draws.ravel(), minlength=POOL + 1)[1:].astype(np.int64)}
+    if tickets is not None:
+        stats["match_counts"] = match_histogram(tickets, to_masks(draws))
+    return stats
+
+def _simulate_task(args):
+    return simulate_chunk(*args)
+
+def merge_stats(total: Dict[str, np.ndarray], part: Dict[str, np.ndarray]) -> Dict[str, np.ndarray]:
+    for key, value in part.items():
+        total[key] = total[key] + value if key in total else value
+    return total
+
+def simulate(n_draws: int, seed: int, workers: int = 1, chunk_size: int = SIM_CHUNK,
+             tickets: Optional[np.ndarray] = None) -> Dict[str, np.ndarray]:
+    """추첨 n_draws 회를 청크로 나눠 (workers > 1 이면 프로세스 풀에서) 시뮬레이션
+
+    청크 분할과 청크별 난수열이 시드와 chunk_size 로만 정해지고 집계는 정수 합이므로
+    워커 수와 완료 순서에 관계없이 결과가 비트 단위로 같음
+    """
+    tasks = [(seed, i, min(chunk_size, n_draws - start), tickets)
+             for i, start in enumerate(range(0, n_draws, chunk_size))]
+    total = {"number_counts": np.zeros(POOL, dtype=np.int64)}
+    if tickets is not None: # 추첨이 0회여도 일치 개수 분포는 있음 (모두 0)
+        total["match_counts"] = np.zeros(PICK + 1, dtype=np.int64)
+    if workers <= 1:
+        for part in map(_simulate_task, tasks):
+            merge_stats(total, part)
+    else:
+        with ProcessPoolExecutor(workers) as pool:
+            for part in pool.map(_simulate_task, tasks):
+                merge_stats(total, part)
+    total["draws"] = n_draws
+    return total
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Lotto draw simulation")
+    parser.add_argument("draws", type=int)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--workers", type=int, default=1)
+    parser.add_argument("--chunk-size", type=int, default=SIM_CHUNK)
+    parser.add_argument("--ticket", type=int, nargs=PICK, action="append",
+                        help="count matches of this ticket (repeatable)")
+    args = parser.parse_args(argv)
+
+    start = time.perf_counter()
+    tickets = to_masks(args.ticket) if args.ticket else None
+    result = simulate(args.draws, args.seed, args.workers, args.chunk_size, tickets)
+    seconds = time.perf_counter() - start
+    print("number counts:", " ".join(f"{n + 1}:{c}" for n, c in enumerate(result["number_counts"])))
+    if tickets is not None:
+        print("match counts:", {m: int(c) for m, c in enumerate(result["match_counts"])})
+    print(f"{args.draws:,} draws in {seconds:.2f} s ({args.draws / seconds:,.0f} draws/s)", file=sys.stderr)
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
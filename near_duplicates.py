@@ -0,0 +1,134 @@
+"""comparison_test 이진 벡터 기반 유사 문서(near-duplicate) 찾기
+
+MinHash 서명 + LSH 밴딩으로 후보 쌍만 골라 Jaccard 유사도를 추정 (문서 수에 거의 선형).
+검증용으로 희소 행렬 곱으로 모든 쌍의 정확한 Jaccard 를 구하는 모드(method="exact")도 제공
+"""
+from typing import Tuple
+import numpy as np
+import scipy.sparse as sp
+
+from example_code import comparison_vectors
+
+NUM_PERM = 128          # MinHash 해시 함수 수 (서명 길이)
+NNZ_BLOCK = 1 << 10     # 서명 계산 시 한 번에 해시하는 0 아닌 칸 수 (x NUM_PERM x 8 바이트 = 1 MB, 캐시 크기)
+EMPTY = np.iinfo(np.uint32).max
+
+Pairs = Tuple[np.ndarray, np.ndarray, np.ndarray] # (i, j, jaccard), i < j
+
+# --- 1. MinHash 서명 ---
+def hash_params(num_perm: int = NUM_PERM, seed: int = 0) -> Tuple[np.ndarray, np.ndarray]:
+    """multiply-shift 해시 h(x) = ((a * x + b) mod 2^64) >> 32 의 계수 (a 는 홀수)"""
+    rng = np.random.default_rng(seed)
+    a = rng.integers(1, 2 ** 63, size=num_perm, dtype=np.uint64) * np.uint64(2) + np.uint64(1)
+    b = rng.integers(0, 2 ** 63, size=num_perm, dtype=np.uint64)
+    return a, b
+
+def minhash_signatures(matrix, num_perm: int = NUM_PERM, seed: int = 0) -> np.ndarray:
+    """이진 CSR 행렬 (문서 x 특징) -> (문서 수, num_perm) uint32 서명 (빈 문서는 EMPTY)"""
+    matrix = sp.csr_matrix(matrix)
+    a, b = hash_params(num_perm, seed)
+    n_rows = matrix.shape[0]
+    signatures = np.full((n_rows, num_perm), EMPTY, dtype=np.uint32)
+    row_nnz = np.diff(matrix.indptr)
+    buffer = np.empty((min(NNZ_BLOCK, max(matrix.nnz, 1)), num_perm), dtype=np.uint64) # 블록마다 재사용
+    shift = np.uint64(32)
+    start = 0
+    while start < n_rows:
+        # 0 아닌 칸이 NNZ_BLOCK 개 이하가 되도록 행 범위를 잡음 (행 하나가 더 길면 그 행만)
+        stop = int(np.searchsorted(matrix.indptr, matrix.indptr[start] + NNZ_BLOCK, side="right")) - 1
+        stop = min(max(stop, start + 1), n_rows)
+        rows = np.arange(start, stop)
+        rows = rows[row_nnz[rows] > 0]
+        if len(rows):
+            lo, hi = matrix.indptr[start], matrix.indptr[stop]
+            features = matrix.indices[lo:hi].astype(np.uint64)
+            hashed = buffer[:hi - lo] if hi - lo <= len(buffer) else np.empty((hi - lo, num_perm), np.uint64)
+            with np.errstate(over="ignore"): # 2^64 나머지 연산은 의도된 overflow
+                np.multiply(features[:, None], a[None, :], out=hashed)
+                hashed += b
+            hashed >>= shift
+            offsets = matrix.indptr[rows] - lo
+            signatures[rows] = np.minimum.reduceat(hashed, offsets, axis=0)
+        start = stop
+    return signatures
+
+# --- 2. LSH 밴딩 ---
+def choose_bands(threshold: float, num_perm: int = NUM_PERM) -> Tuple[int, int]:
+    """b 밴드 x r 행 (b * r <= num_perm) 중 후보가 되는 유사도 경계 (1/b)^(1/r) 가 threshold 에 가장 가까운 것"""
+    options = [(b, num_perm // b) for b in range(1, num_perm + 1)]
+    return min(options, key=lambda br: abs((1 / br[0]) ** (1 / br[1]) - threshold))
+
+def lsh_candidates(signatures: np.ndarray, bands: int, rows: int, seed: int = 0) -> Tuple[np.ndarray, np.ndarray]:
+    """한 밴드라도 서명 조각이 같은 문서 쌍 (i < j, 중복 제거)
+
+    밴드 조각(rows 개 uint32)은 무작위 계수로 uint64 키 하나로 줄여 정렬 (키 충돌은 추정치 단계에서 걸러짐)
+    """
+    valid = np.flatnonzero(signatures[:, 0] != EMPTY)
+    multipliers = np.random.default_rng(seed).integers(1, 2 ** 63, size=rows, dtype=np.uint64) | np.uint64(1)
+    pair_codes = []
+    n = len(signatures)
+    for band in range(bands):
+        chunk = signatures[valid, band * rows:(band + 1) * rows].astype(np.uint64)
+        with np.errstate(over="ignore"):
+            keys = (chunk * multipliers).sum(axis=1, dtype=np.uint64)
+        order = np.argsort(keys)
+        sorted_keys = keys[order]
+        boundaries = np.flatnonzero(np.r_[True, sorted_keys[1:] != sorted_keys[:-1], True])
+        sizes = np.diff(boundaries)
+        starts = boundaries[:-1]
+        # 대부분의 버킷은 두 개짜리이므로 한 번에 처리하고, 더 큰 버킷만 하나씩
+        pairs = starts[sizes == 2]
+        if len(pairs):
+            a, b = valid[order[pairs]], valid[order[pairs + 1]]
+            pair_codes.append(np.minimum(a, b).astype(np.int64) * n + np.maximum(a, b))
+        for lo, size in zip(starts[sizes > 2], sizes[sizes > 2]):
+            members = np.sort(valid[order[lo:lo + size]])
+            i, j = np.triu_indices(size, 1)
+            pair_codes.append(members[i].astype(np.int64) * n + members[j])
+    if not pair_codes:
+        empty = np.empty(0, dtype=np.int64)
+        return empty, empty
+    codes = np.unique(np.concatenate(pair_codes))
+    return codes // n, codes % n
+
+def estimate_jaccard(signatures: np.ndarray, i: np.ndarray, j: np.ndarray) -> np.ndarray:
+    return (signatures[i] == signatures[j]).mean(axis=1)
+
+# --- 3. 정확한 Jaccard (검증용, 문서 수의 제곱) ---
+def exact_pairs(matrix, threshold: float) -> Pairs:
+    matrix = sp.csr_matrix(matrix, dtype=np.int32)
+    matrix.data[:] = 1
+    sizes = np.diff(matrix.indptr)
+    intersection = sp.triu(matrix @ matrix.T, k=1).tocoo()
+    i, j, inter = intersection.row, intersection.col, intersection.data
+    jaccard = inter / (sizes[i] + sizes[j] - inter)
+    keep = jaccard >= threshold
+    order = np.lexsort((j[keep], i[keep]))
+    return i[keep][order], j[keep][order], jaccard[keep][order]
+
+# --- 4. 진입점 ---
+def near_duplicate_pairs(matrix, threshold: float = 0.8, method: str = "lsh", num_perm: int = NUM_PERM,
+                         bands: int = None, seed: int = 0) -> Pairs:
+    """Jaccard 유사도가 threshold 이상인 (것으로 추정되는) 문서 쌍
+
+    method="lsh": MinHash 추정치 (놓치는 쌍이 있을 수 있음), method="exact": 모든 쌍의 정확한 값
+    """
+    if method == "exact":
+        return exact_pairs(matrix, threshold)
+    if method != "lsh":
+        raise ValueError(f"method 는 'lsh' 또는 'exact' (입력: {method})")
+    signatures = minhash_signatures(matrix, num_perm, seed)
+    if bands is None:
+        bands, rows = choose_bands(threshold, num_perm)
+    else:
+        rows = num_perm // bands
+    i, j = lsh_candidates(signatures, bands, rows, seed)
+    jaccard = estimate_jaccard(signatures, i, j)
+    keep = jaccard >= threshold
+    return i[keep], j[keep], jaccard[keep]
+
+def find_near_duplicates(text, threshold: float = 0.8, method: str = "lsh", max_features: int = None,
+                         **params) -> Pairs:
+    """문서 목록에서 바로 찾기 (comparison_vectors 이진 벡터, 기본은 어휘 전체)"""
+    return near_duplicate_pairs(comparison_vectors(text, "csr", max_features=max_features),
+                                threshold, method, **params)
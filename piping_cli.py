@@ -0,0 +1,132 @@
+"""GUI 없이 쓰는 명령행 도구 (python -m piping_tool convert|thickness ...)
+
+셸 파이프라인/CI 용이라 시작 시간이 중요하므로 Qt 와 numpy 를 import 하지 않음.
+인자로 값을 주거나, 인자가 없으면 stdin 의 NDJSON(한 줄에 JSON 객체 하나)을 한 줄씩 처리하고
+결과를 한 줄씩 NDJSON 으로 stdout 에 씀. 처리할 수 없는 줄은 {"error": ...} 를 쓰고 계속 진행.
+
+    python -m piping_tool convert --from psi --to bar 150 300
+    echo '{"value": 150, "from": "psi", "to": "bar"}' | python -m piping_tool convert
+    python -m piping_tool thickness --pressure 2 --diameter 168.3 --stress 138 --quality 1 --weld 1 --coeff 0.4
+"""
+import sys
+import json
+import argparse
+from typing import Dict, Iterable, Iterator, List
+
+from unit_data import UNIT_DATA, TEMPERATURE_CATEGORY, TEMPERATURE_DATA
+
+# thickness.THICKNESS_FIELDS 와 같은 순서 (numpy 를 피하려고 따로 둠)
+THICKNESS_FIELDS = ["pressure", "diameter", "stress", "quality", "weld", "coeff", "corrosion"]
+
+# --- 1. 스칼라 계산 ---
+def find_category(unit: str) -> str:
+    if unit in TEMPERATURE_DATA:
+        return TEMPERATURE_CATEGORY
+    for category, table in UNIT_DATA.items():
+        if unit in table:
+            return category
+    raise KeyError(f"unknown unit: {unit}")
+
+def _lookup(table: Dict, unit: str):
+    try:
+        return table[unit]
+    except KeyError:
+        raise KeyError(f"unknown unit: {unit}") from None
+
+def convert_value(value: float, in_unit: str, out_unit: str, category: str = None) -> float:
+    """units.convert_array / convert_temperature 의 스칼라 버전"""
+    category = category or find_category(in_unit)
+    if category == TEMPERATURE_CATEGORY:
+        scale, offset = _lookup(TEMPERATURE_DATA, in_unit)
+        out_scale, out_offset = _lookup(TEMPERATURE_DATA, out_unit)
+        return (scale * value + offset - out_offset) / out_scale
+    if category not in UNIT_DATA:
+        raise KeyError(f"unknown category: {category}")
+    table = UNIT_DATA[category]
+    return value * _lookup(table, in_unit) / _lookup(table, out_unit)
+
+def thickness_value(pressure, diameter, stress, quality, weld, coeff, corrosion=0.0) -> float:
+    """thickness.required_thickness 의 스칼라 버전 (분모가 0 이하면 nan)"""
+    denominator = 2 * (stress * quality * weld + pressure * coeff)
+    if not denominator > 0:
+        return float("nan")
+    return pressure * diameter / denominator + corrosion
+
+# --- 2. 레코드 처리 ---
+def convert_record(record: Dict, defaults: Dict) -> Dict:
+    merged = {**defaults, **{k: v for k, v in record.items() if v is not None}}
+    for key in ("value", "from", "to"):
+        if merged.get(key) is None:
+            raise KeyError(f"missing '{key}'")
+    category = merged.get("category") or find_category(merged["from"])
+    result = convert_value(float(merged["value"]), merged["from"], merged["to"], category)
+    return {**record, "from": merged["from"], "to": merged["to"], "category": category, "result": result}
+
+def thickness_record(record: Dict, defaults: Dict) -> Dict:
+    merged = {**defaults, **{k: v for k, v in record.items() if v is not None}}
+    missing = [k for k in THICKNESS_FIELDS[:-1] if merged.get(k) is None]
+    if missing:
+        raise KeyError(f"missing {missing}")
+    values = [float(merged.get(k) or 0) for k in THICKNESS_FIELDS]
+    t = thickness_value(*values)
+    return {**record, "thickness": None if t != t else t} # JSON 에는 NaN 이 없으므로 null
+
+def read_lines(stream) -> Iterator[str]:
+    for line in stream:
+        line = line.strip()
+        if line:
+            yield line
+
+def run(records: Iterable, handle, defaults: Dict, out=None, flush: bool = False) -> int:
+    """레코드(dict 또는 NDJSON 한 줄)마다 결과 한 줄씩 출력, 실패한 레코드 수를 반환"""
+    out = out or sys.stdout
+    errors = 0
+    for record in records:
+        try:
+            if isinstance(record, str):
+                record = json.loads(record)
+            line = handle(record, defaults)
+        except (KeyError, ValueError, TypeError, AttributeError) as e: # 잘못된 JSON 포함
+            errors += 1
+            # str(KeyError) 는 메시지를 따옴표로 감싸므로 KeyError 는 메시지만 씀
+            line = {"error": e.args[0] if isinstance(e, KeyError) and e.args else str(e)}
+        out.write(json.dumps(line, ensure_ascii=False) + "\n")
+        if flush:
+            out.flush()
+    return errors
+
+# --- 3. 진입점 ---
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="python -m piping_tool", description="Headless piping calculations (NDJSON out)")
+    sub = parser.add_subparsers(dest="command", required=True)
+    p_conv = sub.add_parser("convert", help="unit conversion")
+    p_conv.add_argument("values", nargs="*", type=float, help="values to convert (default: NDJSON on stdin)")
+    p_conv.add_argument("--from", dest="from")
+    p_conv.add_argument("--to", dest="to")
+    p_conv.add_argument("--category", help="unit category (default: found from --from)")
+    p_thick = sub.add_parser("thickness", help="ASME B31.3 required wall thickness (mm)")
+    for field in THICKNESS_FIELDS:
+        p_thick.add_argument(f"--{field}", type=float)
+    return parser
+
+def main(argv: List[str] = None) -> int:
+    args = vars(build_parser().parse_args(argv))
+    command = args.pop("command")
+    values = args.pop("values", None)
+    defaults = {k: v for k, v in args.items() if v is not None}
+
+    if command == "convert":
+        handle = convert_record
+        given = [{"value": v} for v in values] if values else None
+    else:
+        handle = thickness_record
+        given = [{}] if any(k in defaults for k in THICKNESS_FIELDS[:-1]) else None
+    if given is not None:
+        errors = run(given, handle, defaults)
+    else:
+        # stdin 이 파이프면 한 줄 처리할 때마다 내보내 다음 단계가 바로 받을 수 있게 함
+        errors = run(read_lines(sys.stdin), handle, defaults, flush=True)
+    return 1 if errors else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
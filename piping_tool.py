@@ -1,64 +1,34 @@
 import sys, os
-import json
-import qdarktheme
-from typing import Dict, List, Tuple
-from PySide6.QtCore import Qt
-from PySide6.QtGui import QFont, QColor
+if __name__ == "__main__" and sys.argv[1:2] in (["convert"], ["thickness"]):
+    from piping_cli import main # 명령행 모드: Qt 를 import 하지 않고 바로 실행
+    sys.exit(main(sys.argv[1:]))
+import time
+STARTED = time.perf_counter() # --startup-check 용 (PySide6 import 포함)
+from typing import Dict, List
+import numpy as np
+from PySide6.QtCore import (Qt, QObject, Signal, QFileSystemWatcher, QTimer,
+                            QThreadPool, QRunnable, QAbstractTableModel,
+                            QSortFilterProxyModel, QModelIndex, QAbstractListModel,
+                            QStringListModel, QSettings)
+from PySide6.QtGui import QFont, QColor, QKeySequence, QGuiApplication
 from PySide6.QtWidgets import (QApplication, QMainWindow, QWidget,
-                               QComboBox, QLabel, QLineEdit, QTableWidget,
+                               QComboBox, QLabel, QLineEdit,
                                QGridLayout, QVBoxLayout, QTabWidget,
-                               QSpacerItem, QSizePolicy, QTableWidgetItem,
-                               QHeaderView, QAbstractItemView,
+                               QSpacerItem, QSizePolicy,
+                               QAbstractItemView, QTableView,
                                QStackedLayout, QHBoxLayout, QFrame,
-                               QScrollArea)
-
-# --- 1. 상수 데이터 정의 (데이터와 로직 분리) ---
-UNIT_DATA = {
-    "길이": {
-        "mm": 0.001, "cm": 0.01, "m": 1.0, "km": 1000.0, "in": 0.0254,
-        "ft": 0.3048, "yd": 0.9144, "mi": 1609.344
-    },
-    "넓이": {
-        "mm²": 1e-6, "cm²": 0.0001, "m²": 1.0, "km²": 1e6,
-        "in²": 0.00064516, "ft²": 0.09290304,
-        "yd²": 0.83612736, "mi²": 2589988.110336
-    },
-    "부피": {
-        "Milliliter": 1e-6, "Liter": 0.001, "m³": 1.0, "mm³": 1e-9,
-        "cm³": 1e-6, "Barrel(oil)": 0.1589872949, "CC": 1e-6,
-        "in³": 0.0000163871, "ft³": 0.0283168466,
-        "yd³": 0.764554858, "US Gallon": 0.0037854118,
-    },
-    "무게": {
-        "Milligram": 1e-6, "Gram": 0.001, "Kilogram": 1.0,
-        "Ton": 1000.0, "Ounce": 0.0283495231, "Pound": 0.45359237
-    },
-    "압력": {
-        "Kilopascal": 0.001, "bar": 0.1, "Megapascal": 1.0,
-        "psi": 0.0068947573, "Standard Atmosphere": 0.101325,
-        "Newton/m²": 1e-6, "Newton/cm²": 0.01, "Newton/mm²": 1.0,
-        "kgf/m²": 0.00000980665, "kgf/cm²": 0.0980665, "kgf/mm²": 9.80665,
-        "Torr": 0.0001333224
-    },
-    "동적 유속": {
-        "mN·s/m²": 1.0, "Centipoise": 1.0, "mPa·s": 1.0
-    },
-    "정적 유속": {
-        "mm²/s": 1.0, "Centistokes": 1.0
-    },
-    "부피 유량": {
-        "cm³/s": 0.0036, "cm³/min": 0.00006, "cm³/hr": 1e-6,
-        "m³/s": 3600.0, "m³/min": 60.0, "m³/hr": 1.0,
-        "L/s": 3.6, "L/min": 0.06, "L/hr": 0.001,
-        "gal(US)/s": 13.627482, "gal(US)/min": 0.227124, "gal(US)/hr": 0.003785,
-        "barrel/s": 572.35426, "barrel/min": 9.539237, "barrel/hr": 0.158987
-    },
-    "질량 유량": {
-        "g/s": 3.6, "g/min": 0.06, "g/hr": 0.001,
-        "kg/s": 3600.0, "kg/min": 60.0, "kg/hr": 1.0,
-        "lb/s": 1632.9325, "lb/min": 27.21554, "lb/hr": 0.453592
-    }
-}
+                               QScrollArea, QCheckBox, QListView, QPushButton)
+
+# --- 1. 상수 데이터 (units, reference_data 모듈에서 관리) ---
+from units import (UNIT_DATA, TEMPERATURE_CATEGORY, TEMPERATURE_DATA, convert_to_all,
+                   convert_temperature, is_bulk_text, parse_pasted_values, format_values)
+from reference_data import (DATA_FILE, DATASET_KEYS, load_reference_data, diff_datasets,
+                            SearchIndex, resource_path)
+from thickness import THICKNESS_FIELDS, required_thickness
+from thermal import expansion_table, thermal_expansion
+from reactive import Graph
+from theme import apply_theme
+from result_store import FACTOR_DATASETS, STORE_FILE, ResultStore, material_versions
 
 # --- 2. 커스텀 UI 위젯 ---
 class UnitLabel(QLabel):
@@ -67,21 +37,124 @@ class UnitLabel(QLabel):
         self.setAlignment(Qt.AlignmentFlag.AlignVCenter | Qt.AlignmentFlag.AlignLeft)
         self.setContentsMargins(5, 0, 5, 0)
         if bold:
-            style = "font-weight: bold;"
+            font = self.font()
+            font.setBold(True)
             if font_size > 0:
-                style += f" font-size: {font_size}pt;"
-            self.setStyleSheet(style)
+                font.setPointSize(font_size)
+            self.setFont(font)
 
 class UnitLine(QLineEdit):
-    def __init__(self, default_text: str = "", parent=None):
+    bulk_pasted = Signal(str) # 여러 줄/탭 구분 텍스트 붙여넣기 (입력창에는 넣지 않음)
+
+    def __init__(self, default_text: str = "", parent=None, bulk: bool = False):
         super().__init__(default_text, parent)
+        self.bulk = bulk # True 일 때만 열 붙여넣기를 가로챔 (bulk_pasted 를 연결한 입력창)
         self.setAlignment(Qt.AlignmentFlag.AlignVCenter | Qt.AlignmentFlag.AlignRight)
 
+    def paste_bulk(self) -> bool:
+        text = QGuiApplication.clipboard().text()
+        if not self.bulk or not is_bulk_text(text):
+            return False
+        self.bulk_pasted.emit(text)
+        return True
+
+    def keyPressEvent(self, event):
+        if event.matches(QKeySequence.StandardKey.Paste) and self.paste_bulk():
+            return
+        super().keyPressEvent(event)
+
+    def contextMenuEvent(self, event):
+        if not self.bulk:
+            super().contextMenuEvent(event)
+            return
+        menu = self.createStandardContextMenu()
+        action = menu.addAction("열 전체 붙여넣기 / 변환")
+        action.setEnabled(is_bulk_text(QGuiApplication.clipboard().text()))
+        action.triggered.connect(self.paste_bulk)
+        menu.exec(event.globalPos())
+
+    def dropEvent(self, event):
+        text = event.mimeData().text()
+        if self.bulk and is_bulk_text(text):
+            self.bulk_pasted.emit(text)
+            event.acceptProposedAction()
+            return
+        super().dropEvent(event)
+
 class UnitCombobox(QComboBox):
     def __init__(self, units: List[str], parent=None):
         super().__init__(parent)
         self.addItems(units)
 
+class AllUnitsModel(QAbstractListModel):
+    """한 값을 모든 단위로 변환한 결과 목록 (값 배열만 보관하고 표시할 때 문자열로 만듦)"""
+    def __init__(self, units: List[str], parent=None):
+        super().__init__(parent)
+        self.units = units
+        self.values = np.full(len(units), np.nan)
+
+    def rowCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self.units)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid() or role != Qt.ItemDataRole.DisplayRole:
+            return None
+        value = self.values[index.row()]
+        return f"{value:.11g}  {self.units[index.row()]}" if value == value else f"-  {self.units[index.row()]}"
+
+    def set_values(self, values: np.ndarray):
+        self.values = values
+        self.dataChanged.emit(self.index(0), self.index(len(self.units) - 1))
+
+    def set_units(self, units: List[str]):
+        self.beginResetModel()
+        self.units = units
+        self.values = np.full(len(units), np.nan)
+        self.endResetModel()
+
+class BulkResultModel(QAbstractTableModel):
+    """붙여넣은 표의 변환 결과 (numpy 배열을 그대로 보관, 보이는 칸만 문자열로 만듦)"""
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.values = np.empty((0, 0))
+
+    def rowCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else self.values.shape[0]
+
+    def columnCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else self.values.shape[1]
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid() or role != Qt.ItemDataRole.DisplayRole:
+            return None
+        value = self.values[index.row(), index.column()]
+        return f"{value:.11g}" if value == value else ""
+
+    def set_values(self, values: np.ndarray):
+        self.beginResetModel()
+        self.values = values
+        self.endResetModel()
+
+class BulkResultView(QTableView):
+    """Ctrl+C 로 선택 영역을 탭 구분 텍스트로 복사하는 결과 표"""
+    def keyPressEvent(self, event):
+        if event.matches(QKeySequence.StandardKey.Copy):
+            self.copy_selection()
+            return
+        super().keyPressEvent(event)
+
+    def copy_selection(self):
+        # 선택 범위들을 감싸는 사각형을 배열 슬라이스로 복사 (항목별 인덱스를 만들지 않음)
+        ranges = self.selectionModel().selection()
+        if ranges.isEmpty():
+            return
+        top = min(r.top() for r in ranges)
+        bottom = max(r.bottom() for r in ranges)
+        left = min(r.left() for r in ranges)
+        right = max(r.right() for r in ranges)
+        values = self.model().values[top:bottom + 1, left:right + 1]
+        QGuiApplication.clipboard().setText(format_values(values))
+
 # --- 3. 단위 변환기 로직 ---
 class BaseConverterWidget(QWidget):
     """모든 단위 변환 위젯의 기본이 되는 클래스"""
@@ -100,16 +173,7 @@ class BaseConverterWidget(QWidget):
 
             # --- 카드 스타일 프레임 생성 ---
             self.card_frame = QFrame()
-            self.card_frame.setStyleSheet("""
-                QFrame {
-                    background-color: transparent;
-                    border-radius: 10px;
-                    border: 1px solid #dee2e6;
-                }
-                QLabel { border: none; }
-                QLineEdit { border: 1px solid #ced4da; border-radius: 4px; padding: 2px; }
-                QComboBox { border: 1px solid #ced4da; border-radius: 4px; }
-            """)
+            self.card_frame.setProperty("card", True) # 스타일은 theme.APP_QSS
             
             # 프레임 내부용 그리드 레이아웃
             self.glayout = QGridLayout(self.card_frame)
@@ -117,15 +181,15 @@ class BaseConverterWidget(QWidget):
             self.glayout.setHorizontalSpacing(15)
 
             # 구성 요소 생성
-            self.label = UnitLabel(self.title, bold=True)
+            self.label = self.create_title_widget()
             self.label.setMinimumWidth(80)
             
-            self.input_lineedit = UnitLine("1")
+            self.input_lineedit = UnitLine("1", bulk=True)
             self.input_combobox = UnitCombobox(self.unit_list)
             
             self.output_label = UnitLabel("-")
             self.output_label.setAlignment(Qt.AlignmentFlag.AlignVCenter | Qt.AlignmentFlag.AlignRight)
-            self.output_label.setStyleSheet("font-weight: bold; color: #d35400; font-size: 11pt; border: none;")
+            self.output_label.setProperty("role", "result")
             self.output_label.setTextInteractionFlags(
                 Qt.TextInteractionFlag.TextSelectableByMouse | 
                 Qt.TextInteractionFlag.TextSelectableByKeyboard
@@ -142,13 +206,36 @@ class BaseConverterWidget(QWidget):
             
             # 화살표나 구분 기호 역할을 하는 라벨 추가 (선택 사항)
             self.arrow_label = QLabel("▶")
-            self.arrow_label.setStyleSheet("color: #95a5a6; border: none;")
+            self.arrow_label.setProperty("role", "muted")
             self.arrow_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
             self.glayout.addWidget(self.arrow_label, 0, 3)
 
             self.glayout.addWidget(self.output_label, 0, 4)
             self.glayout.addWidget(self.output_combobox, 0, 5)
 
+            # 모든 단위 보기: 단위 수만큼 위젯을 만들지 않고 모델 기반 목록 하나로 표시
+            self.all_units_check = QCheckBox("모든 단위")
+            self.all_units_model = AllUnitsModel(self.unit_list, self)
+            self.all_units_view = QListView()
+            self.all_units_view.setModel(self.all_units_model)
+            self.all_units_view.setUniformItemSizes(True)
+            self.all_units_view.setVisible(False)
+            self.glayout.addWidget(self.all_units_check, 1, 0)
+            self.glayout.addWidget(self.all_units_view, 1, 1, 1, 5)
+
+            # 엑셀 열 붙여넣기 결과 (붙여넣기 전에는 숨김)
+            self.bulk_values = None
+            self.bulk_model = BulkResultModel(self)
+            self.bulk_view = BulkResultView()
+            self.bulk_view.setModel(self.bulk_model)
+            self.bulk_view.setMinimumHeight(200)
+            self.bulk_copy_button = QPushButton("결과 복사")
+            self.bulk_copy_button.clicked.connect(self.copy_bulk_result)
+            self.bulk_view.setVisible(False)
+            self.bulk_copy_button.setVisible(False)
+            self.glayout.addWidget(self.bulk_copy_button, 3, 0, Qt.AlignmentFlag.AlignTop)
+            self.glayout.addWidget(self.bulk_view, 3, 1, 1, 5)
+
             # 열 비율 조정 (입력창과 결과창이 유연하게 늘어나도록)
             self.glayout.setColumnStretch(1, 2)
             self.glayout.setColumnStretch(2, 1)
@@ -164,17 +251,32 @@ class BaseConverterWidget(QWidget):
             # 카드 프레임을 메인 레이아웃에 추가
             self.main_layout.addWidget(self.card_frame)
 
+    def create_title_widget(self) -> QWidget:
+        """카드 왼쪽의 제목 위젯 (자식 클래스에서 다른 위젯으로 대체 가능)"""
+        return UnitLabel(self.title, bold=True)
+
     def signal_connections(self):
+        self.input_lineedit.textChanged.connect(self.clear_bulk)
         self.input_lineedit.textChanged.connect(self.update_conversion)
         self.input_combobox.currentTextChanged.connect(self.update_conversion)
         self.output_combobox.currentTextChanged.connect(self.update_conversion)
+        self.all_units_check.toggled.connect(self.all_units_view.setVisible)
+        self.all_units_check.toggled.connect(self.update_conversion)
+        self.input_lineedit.bulk_pasted.connect(self.convert_bulk)
 
     def update_conversion(self):
         """UI 입력을 읽어 변환 로직을 수행하고 결과를 출력"""
         input_text = self.input_lineedit.text()
+        if is_bulk_text(input_text): # 붙여넣기 가로채기를 거치지 않은 여러 줄 입력
+            self.convert_bulk(input_text)
+            return
+        if self.bulk_values is not None: # 붙여넣은 열을 단위만 바꿔 다시 변환
+            self.update_bulk()
+            return
         
         if not input_text or input_text in ["-", "."]:
             self.output_label.setText("-")
+            self.all_units_model.set_values(np.full(len(self.unit_list), np.nan))
             return
 
         try:
@@ -186,6 +288,9 @@ class BaseConverterWidget(QWidget):
             result = self.calculate(val, in_unit, out_unit)
             
             self.output_label.setText(f"{result:.11g}")
+
+            if self.all_units_check.isChecked():
+                self.all_units_model.set_values(self.calculate_all(val, in_unit))
         except ValueError:
             self.output_label.setText("Error")
 
@@ -193,11 +298,44 @@ class BaseConverterWidget(QWidget):
         """자식 클래스에서 반드시 오버라이딩 해야 함"""
         raise NotImplementedError("Subclasses must implement convert_logic")
 
+    def calculate_all(self, value: float, in_unit: str) -> np.ndarray:
+        """unit_list 의 모든 단위로 변환 (자식 클래스에서 벡터 연산으로 대체)"""
+        return np.array([self.calculate(value, in_unit, unit) for unit in self.unit_list])
+
+    def calculate_array(self, values: np.ndarray, in_unit: str, out_unit: str) -> np.ndarray:
+        """값 배열 전체를 변환 (자식 클래스에서 벡터 연산으로 대체)"""
+        return np.vectorize(lambda v: self.calculate(v, in_unit, out_unit), otypes=[float])(values)
+
+    # --- 열 붙여넣기 일괄 변환 ---
+    def convert_bulk(self, text: str):
+        self.bulk_values = parse_pasted_values(text)
+        self.bulk_view.setVisible(True)
+        self.bulk_copy_button.setVisible(True)
+        self.update_bulk()
+
+    def update_bulk(self):
+        """붙여넣은 값 전체를 현재 단위 조합으로 한 번에 변환해 결과 표에 표시"""
+        in_unit = self.input_combobox.currentText()
+        out_unit = self.output_combobox.currentText()
+        self.bulk_model.set_values(self.calculate_array(self.bulk_values, in_unit, out_unit))
+        count = int(np.count_nonzero(~np.isnan(self.bulk_values)))
+        self.output_label.setText(f"{count} values")
+
+    def clear_bulk(self):
+        """직접 입력을 시작하면 붙여넣기 결과를 닫음"""
+        self.bulk_values = None
+        self.bulk_view.setVisible(False)
+        self.bulk_copy_button.setVisible(False)
+
+    def copy_bulk_result(self):
+        QGuiApplication.clipboard().setText(format_values(self.bulk_model.values))
+
 # --- 4. 비율 변환기 (길이, 넓이, 부피, 무게, 압력, 유속, 유량) ---
 class RatioConverterWidget(BaseConverterWidget):
     """단순 비율(Factor)로 변환하는 위젯"""
     def __init__(self, title: str, unit_dict: Dict[str, float], parent=None):
         self.unit_dict = unit_dict
+        self.factors = np.array(list(unit_dict.values()))
         # 부모 클래스 초기화 (키 값만 리스트로 전달)
         super().__init__(title, list(unit_dict.keys()), parent)
 
@@ -205,11 +343,18 @@ class RatioConverterWidget(BaseConverterWidget):
         # Base 단위로 변환 후 목표 단위로 변환
         return (value * self.unit_dict[in_unit]) / self.unit_dict[out_unit]
 
+    def calculate_all(self, value: float, in_unit: str) -> np.ndarray:
+        # 배율 벡터 전체에 대해 한 번에 계산
+        return (value * self.unit_dict[in_unit]) / self.factors
+
+    def calculate_array(self, values: np.ndarray, in_unit: str, out_unit: str) -> np.ndarray:
+        return (values * self.unit_dict[in_unit]) / self.unit_dict[out_unit]
+
 # --- 5. 온도 변환기 (공식 필요) ---
 class TemperatureConverterWidget(BaseConverterWidget):
     """온도 변환 위젯 (공식 사용)"""
     def __init__(self, parent=None):
-        super().__init__("온도", ["Celsius", "Fahrenheit", "Kelvin"], parent)
+        super().__init__(TEMPERATURE_CATEGORY, list(TEMPERATURE_DATA), parent)
         self.input_lineedit.setText("0") # 온도는 0도부터 시작하는게 자연스러움
 
     def to_celsius(self, value: float, unit: str) -> float:
@@ -225,27 +370,266 @@ class TemperatureConverterWidget(BaseConverterWidget):
         return value
 
     def calculate(self, value: float, in_unit: str, out_unit: str) -> float:
-        # 섭씨로 변환
-        celsius = value
-        if in_unit == "Fahrenheit":
-            celsius = (value -32) * 5 / 9
-        elif in_unit == "Kelvin":
-            celsius = value - 273.15
-        
-        # 목표 단위로 변환
-        if out_unit == "Celsius":
-            return celsius
-        elif out_unit == "Fahrenheit":
-            return (celsius * 9 / 5) + 32
-        elif out_unit == "Kelvin":
-            return celsius + 273.15
-        return celsius
-
-# --- 6. 파이프 두께 계산 (공식 필요) ---
+        # 섭씨를 거쳐 목표 단위로 변환 (units.TEMPERATURE_DATA 의 1차 변환식)
+        return float(convert_temperature(value, in_unit, out_unit))
+
+    def calculate_all(self, value: float, in_unit: str) -> np.ndarray:
+        return convert_to_all(value, TEMPERATURE_CATEGORY, in_unit)
+
+    def calculate_array(self, values: np.ndarray, in_unit: str, out_unit: str) -> np.ndarray:
+        return convert_temperature(values, in_unit, out_unit)
+
+# --- 6. 통합 변환기 카드 (카테고리를 모델로 전환) ---
+class CompactConverterWidget(BaseConverterWidget):
+    """카드 하나로 모든 카테고리를 변환하는 위젯
+
+    카테고리는 콤보박스 모델의 행일 뿐이므로 카테고리가 늘어도 위젯 수는 그대로이며,
+    자주 쓰는 (카테고리, 입력 단위, 출력 단위) 조합은 즐겨찾기로 고정해 둠.
+    catalogue 는 배율 변환 카테고리만 담고, 온도는 배율이 아니므로 convert_temperature 로 따로 변환
+    """
+    def __init__(self, catalogue: Dict[str, Dict[str, float]] = None, parent=None):
+        self.catalogue = dict(catalogue if catalogue is not None else UNIT_DATA)
+        self.categories = list(self.catalogue) + [TEMPERATURE_CATEGORY]
+        self.settings = QSettings("piping_tool", "converter")
+        first = self.categories[0]
+        self.factors = self.category_factors(first)
+        super().__init__(first, self.category_units(first), parent)
+        self.setup_favorites()
+
+    def category_units(self, category: str) -> List[str]:
+        return list(TEMPERATURE_DATA) if category == TEMPERATURE_CATEGORY else list(self.catalogue[category])
+
+    def category_factors(self, category: str) -> np.ndarray:
+        """배율 벡터 (온도는 배율이 없으므로 None)"""
+        if category == TEMPERATURE_CATEGORY:
+            return None
+        return np.array(list(self.catalogue[category].values()))
+
+    def create_title_widget(self) -> QWidget:
+        self.category_model = QStringListModel(self.categories, self)
+        self.category_combobox = QComboBox()
+        self.category_combobox.setModel(self.category_model)
+        self.category_combobox.currentTextChanged.connect(self.set_category)
+        return self.category_combobox
+
+    def setup_favorites(self):
+        self.pin_button = QPushButton("☆ 고정")
+        self.pin_button.clicked.connect(self.pin_current)
+
+        self.favorites_model = QStringListModel(self.settings.value("favorites", [], type=list), self)
+        self.favorites_view = QListView()
+        self.favorites_view.setModel(self.favorites_model)
+        self.favorites_view.setFlow(QListView.Flow.LeftToRight)
+        self.favorites_view.setFixedHeight(34)
+        self.favorites_view.clicked.connect(self.open_favorite)
+        self.favorites_view.doubleClicked.connect(self.unpin)
+
+        self.glayout.addWidget(self.pin_button, 2, 0)
+        self.glayout.addWidget(self.favorites_view, 2, 1, 1, 5)
+
+    def set_category(self, category: str):
+        """콤보박스와 전체 단위 목록의 모델만 교체"""
+        if category not in self.categories or category == self.title:
+            return
+        self.title = category
+        self.unit_list = self.category_units(category)
+        self.factors = self.category_factors(category)
+        for combobox, index in ((self.input_combobox, 0), (self.output_combobox, 1)):
+            combobox.blockSignals(True)
+            combobox.clear()
+            combobox.addItems(self.unit_list)
+            combobox.setCurrentIndex(min(index, len(self.unit_list) - 1))
+            combobox.blockSignals(False)
+        self.all_units_model.set_units(self.unit_list)
+        self.update_conversion()
+
+    def calculate(self, value: float, in_unit: str, out_unit: str) -> float:
+        if self.title == TEMPERATURE_CATEGORY:
+            return float(convert_temperature(value, in_unit, out_unit))
+        units = self.catalogue[self.title]
+        return (value * units[in_unit]) / units[out_unit]
+
+    def calculate_all(self, value: float, in_unit: str) -> np.ndarray:
+        if self.title == TEMPERATURE_CATEGORY:
+            return convert_to_all(value, TEMPERATURE_CATEGORY, in_unit)
+        return (value * self.catalogue[self.title][in_unit]) / self.factors
+
+    def calculate_array(self, values: np.ndarray, in_unit: str, out_unit: str) -> np.ndarray:
+        if self.title == TEMPERATURE_CATEGORY:
+            return convert_temperature(values, in_unit, out_unit)
+        units = self.catalogue[self.title]
+        return (values * units[in_unit]) / units[out_unit]
+
+    # --- 즐겨찾기: "카테고리: 입력 → 출력" 문자열로 저장 ---
+    def pin_current(self):
+        entry = f"{self.title}: {self.input_combobox.currentText()} → {self.output_combobox.currentText()}"
+        favorites = self.favorites_model.stringList()
+        if entry not in favorites:
+            self.favorites_model.setStringList(favorites + [entry])
+            self.settings.setValue("favorites", self.favorites_model.stringList())
+
+    def unpin(self, index):
+        self.favorites_model.removeRow(index.row())
+        self.settings.setValue("favorites", self.favorites_model.stringList())
+
+    def open_favorite(self, index):
+        category, units = index.data().split(": ", 1)
+        in_unit, out_unit = units.split(" → ")
+        if category not in self.categories:
+            return
+        self.category_combobox.setCurrentText(category)
+        self.input_combobox.setCurrentText(in_unit)
+        self.output_combobox.setCurrentText(out_unit)
+
+# --- 7. 참조 데이터 핫 리로드 ---
+class ReloadSignals(QObject):
+    finished = Signal(int, dict, dict)   # (리로드 세대, 새 데이터, 데이터셋별 행 diff)
+
+class ReferenceReloadTask(QRunnable):
+    """백그라운드 스레드에서 JSON 을 다시 읽고 이전 데이터와의 행 단위 차이를 계산"""
+    def __init__(self, path: str, old_db: dict, signals: ReloadSignals, generation: int):
+        super().__init__()
+        self.path = path
+        self.old_db = old_db
+        self.signals = signals
+        self.generation = generation
+
+    def run(self):
+        try:
+            new_db = load_reference_data(self.path)
+        except (OSError, ValueError):
+            return # 편집기가 저장 중인 경우 등, 다음 변경 알림에서 다시 시도
+        self.signals.finished.emit(self.generation, new_db, diff_datasets(self.old_db, new_db))
+
+class ReferenceDataWatcher(QObject):
+    """piping_data.json 변경을 감시하고 바뀐 데이터셋만 알림"""
+    reloaded = Signal(dict, dict)
+
+    def __init__(self, path: str, db: dict, parent=None):
+        super().__init__(parent)
+        self.path = path
+        self.db = db
+        self.generation = 0 # 마지막으로 시작한 리로드 (그 이전 작업의 결과는 버림)
+        self.signals = ReloadSignals(self)
+        self.signals.finished.connect(self.on_reloaded)
+
+        # 저장 시 여러 번 발생하는 알림을 한 번으로 묶음
+        self.timer = QTimer(self)
+        self.timer.setSingleShot(True)
+        self.timer.setInterval(200)
+        self.timer.timeout.connect(self.start_reload)
+
+        self.watcher = QFileSystemWatcher(self)
+        if os.path.exists(path):
+            self.watcher.addPath(path)
+        self.watcher.fileChanged.connect(self.timer.start)
+
+    def start_reload(self):
+        # 파일을 새로 만들어 저장하는 편집기는 감시 경로가 빠지므로 다시 등록
+        if self.path not in self.watcher.files() and os.path.exists(self.path):
+            self.watcher.addPath(self.path)
+        self.generation += 1
+        QThreadPool.globalInstance().start(ReferenceReloadTask(self.path, self.db, self.signals, self.generation))
+
+    def on_reloaded(self, generation: int, new_db: dict, diffs: dict):
+        # 겹쳐 실행된 이전 리로드는 지난 db 와 비교한 결과이므로 무시 (마지막 리로드가 최신 파일을 반영)
+        if generation != self.generation:
+            return
+        self.db = new_db
+        if diffs:
+            self.reloaded.emit(new_db, diffs)
+
+# --- 8. 참조 테이블 모델 (검색 필터) ---
+class ReferenceTableModel(QAbstractTableModel):
+    """참조 데이터(행 목록)를 그대로 보여주는 테이블 모델 (첫 줄은 헤더 강조)"""
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.rows = []
+        self.columns = 0
+
+    def rowCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self.rows)
+
+    def columnCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else self.columns
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        row = self.rows[index.row()]
+        if role == Qt.ItemDataRole.DisplayRole:
+            return str(row[index.column()]) if index.column() < len(row) else ""
+        if index.row() == 0: # 첫 줄 헤더 강조
+            if role == Qt.ItemDataRole.BackgroundRole:
+                return QColor("#2c3e50")
+            if role == Qt.ItemDataRole.ForegroundRole:
+                return QColor("white")
+        return None
+
+    def set_rows(self, rows: list):
+        self.beginResetModel()
+        self.rows = list(rows)
+        self.columns = max((len(r) for r in self.rows), default=0)
+        self.endResetModel()
+
+    def apply_row_diff(self, rows: list, ops: list):
+        """(tag, i1, i2, j1, j2) 목록을 아래쪽부터 적용해 앞쪽 행 번호가 바뀌지 않게 함"""
+        columns = max((len(r) for r in rows), default=0)
+        if columns > self.columns:
+            self.beginInsertColumns(QModelIndex(), self.columns, columns - 1)
+            self.columns = columns
+            self.endInsertColumns()
+        for tag, i1, i2, j1, j2 in reversed(ops):
+            common = min(i2 - i1, j2 - j1)
+            if common:
+                self.rows[i1:i1 + common] = rows[j1:j1 + common]
+                self.dataChanged.emit(self.index(i1, 0), self.index(i1 + common - 1, self.columns - 1))
+            if i2 - i1 > common: # 남는 이전 행 삭제
+                self.beginRemoveRows(QModelIndex(), i1 + common, i2 - 1)
+                del self.rows[i1 + common:i2]
+                self.endRemoveRows()
+            elif j2 - j1 > common: # 새 행 삽입
+                self.beginInsertRows(QModelIndex(), i1 + common, i1 + (j2 - j1) - 1)
+                self.rows[i1 + common:i1 + common] = rows[j1 + common:j2]
+                self.endInsertRows()
+
+class ReferenceFilterProxyModel(QSortFilterProxyModel):
+    """SearchIndex 가 찾은 행 번호 집합으로만 거르는 프록시 (항목을 다시 만들지 않음)"""
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.accepted = None # None 이면 전체 표시
+
+    def set_accepted(self, accepted):
+        if hasattr(self, "beginFilterChange"): # Qt 6.9 이상
+            self.beginFilterChange()
+            self.accepted = accepted
+            self.endFilterChange(QSortFilterProxyModel.Direction.Rows)
+        else:
+            self.accepted = accepted
+            self.invalidateRowsFilter()
+
+    def filterAcceptsRow(self, source_row: int, source_parent) -> bool:
+        # 헤더 역할을 하는 첫 줄은 항상 표시
+        return self.accepted is None or source_row == 0 or source_row in self.accepted
+
+# --- 9. 파이프 두께 계산 (공식 필요) ---
+def parse_input(text: str) -> float:
+    """입력창 텍스트 -> 숫자 (빈 칸은 0, 숫자가 아니면 nan)"""
+    try:
+        return float(text or 0)
+    except ValueError:
+        return float("nan")
+
+def format_mm(value: float) -> str:
+    return "-" if value != value else f"{value:.4f} mm"
+
 class PipeThicknessWidget(QWidget):
+    reference_data_changed = Signal(list)   # 바뀐 데이터셋 키 목록
+
     def __init__(self, parent=None):
         super().__init__(parent)
         self.inputs = {}
+        self.graph = Graph()
         self.setup_ui()
         self.load_reference_data()
         
@@ -256,15 +640,8 @@ class PipeThicknessWidget(QWidget):
 
         # --- 왼쪽: 입력 영역 (카드 스타일) ---
         input_group = QFrame()
-        input_group.setStyleSheet("""
-            QFrame {
-                background-color: transparent;
-                border-radius: 10px;
-                border: 1px solid #dee2e6;
-            }
-            QLabel { border: none; }
-            QLineEdit { border: 1px solid #ced4da; border-radius: 4px; padding: 5px; }
-        """)
+        input_group.setObjectName("thicknessInput")
+        input_group.setProperty("card", True)
 
         # 입력 카드 내부 레이아웃
         input_vbox = QVBoxLayout(input_group)
@@ -272,7 +649,7 @@ class PipeThicknessWidget(QWidget):
 
         title_lbl = QLabel("Pipe Thickness Calculation")
         title_lbl.setMinimumHeight(75)
-        title_lbl.setStyleSheet("font-size: 13pt; font-weight: bold; color: #d35400; margin-bottom: 10px;")
+        title_lbl.setProperty("role", "title")
         input_vbox.addWidget(title_lbl)
 
         # 필드들을 담을 그리드
@@ -295,7 +672,6 @@ class PipeThicknessWidget(QWidget):
             lbl.setFont(QFont("Malgun Gothic", 11))
             edit = UnitLine()
             edit.setFixedHeight(30) # 입력창 높이 고정
-            edit.textChanged.connect(self.calculate)
             self.inputs[key] = edit
 
             fields_grid.addWidget(lbl, i, 0)
@@ -308,13 +684,14 @@ class PipeThicknessWidget(QWidget):
         input_vbox.addStretch(1) # 입력 필드와 결과 사이 공간을 늘려줌
 
         result_frame = QFrame()
-        result_frame.setStyleSheet("background-color: transparent; border-radius: 5px; border: 1px solid #e9ecef;")
+        result_frame.setObjectName("thicknessResult")
         res_layout = QHBoxLayout(result_frame)
 
         min_thick = QLabel("Required Min. Thickness (t):")
-        min_thick.setStyleSheet("font: Malgun Gothic; font-weight: bold; font-size: 11; border:noe;")
+        min_thick.setProperty("role", "strong")
         self.res_label = QLabel("-")
-        self.res_label.setStyleSheet("font-size: 12pt; font-weight: bold; color: #d35400; border:none;")
+        self.res_label.setObjectName("thicknessValue")
+        self.res_label.setProperty("role", "result")
 
         res_layout.addWidget(min_thick)
         res_layout.addStretch()
@@ -322,35 +699,55 @@ class PipeThicknessWidget(QWidget):
 
         input_vbox.addWidget(result_frame)
 
+        self.hydrotest_label = QLabel("-")
+        self.hydrotest_label.setProperty("role", "muted")
+        self.recompute_label = QLabel("")
+        self.recompute_label.setProperty("role", "muted")
+        self.recompute_label.setWordWrap(True)
+        input_vbox.addWidget(self.hydrotest_label)
+        input_vbox.addWidget(self.recompute_label)
+        self.setup_graph()
+
         # --- 오른쪽: 참조 테이블 (시인성 개선) ---
-        self.table = QTableWidget()
+        self.model = ReferenceTableModel(self)
+        self.proxy = ReferenceFilterProxyModel(self)
+        self.proxy.setSourceModel(self.model)
+
+        self.table = QTableView()
+        self.table.setModel(self.proxy)
         self.table.setMinimumSize(150, 550)
         self.table.setAlternatingRowColors(True) # 행 색상 교차
-        self.table.setStyleSheet("""
-            QTableWidget { 
-                gridline-color: #ecf0f1; 
-                background-color: transparent;
-                alternate-background-color: transparent;
-            }
-            QHeaderView::section { 
-                background-color: #34495e; 
-                color: white; 
-                padding: 5px;
-                font-weight: bold;
-            }
-        """)
+        self.table.setObjectName("referenceTable")
 
         self.selector = QComboBox()
-        self.selector.addItems(["Allowable Stress (S)", "Casting Quality (Ec)", "Longitudinal Weld Joints (Ej)", "Weld Joint (W)", "Coefficient (Y)"])
+        self.selector.addItems(["Allowable Stress (S)", "Casting Quality (Ec)", "Longitudinal Weld Joints (Ej)", "Weld Joint (W)", "Coefficient (Y)", "Pipe Size (NPS/SCH)", "Thermal Expansion (α)"])
         self.selector.currentIndexChanged.connect(self.update_table_view)
 
         ref_data_sele = QLabel("Reference Data Selection:")
-        ref_data_sele.setStyleSheet("font-size: 11;")
         ref_data_sele.setMinimumHeight(50)
 
+        # 검색창: 입력할수록 이전 결과 안에서 좁혀 나감
+        self.search_edit = QLineEdit()
+        self.search_edit.setPlaceholderText("Search (e.g. A106, TP316, seamless)")
+        self.search_edit.setClearButtonEnabled(True)
+        self.search_status = QLabel("")
+        self.search_status.setProperty("role", "muted")
+        self.last_query = ""
+        self.last_matches = None     # 현재 테이블의 일치 행
+        self.all_matches = None      # 데이터셋별 일치 행 (다음 입력은 이 안에서만 검색)
+
+        # 빠르게 입력하는 동안에는 검색하지 않고 입력이 멈추면 한 번만 검색
+        self.search_timer = QTimer(self)
+        self.search_timer.setSingleShot(True)
+        self.search_timer.setInterval(150)
+        self.search_timer.timeout.connect(lambda: self.apply_search(self.search_edit.text()))
+        self.search_edit.textChanged.connect(self.search_timer.start)
+
         right_layout = QVBoxLayout()
         right_layout.addWidget(ref_data_sele)
         right_layout.addWidget(self.selector)
+        right_layout.addWidget(self.search_edit)
+        right_layout.addWidget(self.search_status)
         right_layout.addWidget(self.table)
 
         layout.addWidget(input_group, 0, 0)
@@ -358,56 +755,228 @@ class PipeThicknessWidget(QWidget):
         layout.setColumnStretch(1, 2)
         layout.setHorizontalSpacing(50)
 
+    def setup_graph(self):
+        """입력은 바뀐 칸만 파싱하고, 그 칸에 의존하는 값만 다시 계산"""
+        for key, edit in self.inputs.items():
+            self.graph.input(key, parse_input, edit.text())
+            edit.textChanged.connect(lambda text, k=key: self.graph.set(k, text))
+
+        self.graph.computed("thickness", lambda *v: float(required_thickness(*v)), THICKNESS_FIELDS)
+        self.graph.computed("hydrotest", lambda p: 1.5 * p, ["pressure"]) # B31.3 345.4.2 (ST/S = 1 가정)
+
+        self.graph.subscribe("thickness", lambda t: self.res_label.setText(format_mm(t)))
+        self.graph.subscribe("hydrotest", lambda p: self.hydrotest_label.setText(
+            "Hydrotest Pressure (1.5P): " + ("-" if p != p else f"{p:.3f} MPa")))
+        self.graph.listeners.append(self.update_recompute_status)
+        self.update_recompute_status([])
+
+    def update_recompute_status(self, changed: List[str]):
+        counts = self.graph.recompute_counts()
+        self.recompute_label.setText("Recomputes: " + ", ".join(f"{k} {v}" for k, v in counts.items()))
+
     def load_reference_data(self):
-        """JSON 파일에서 데이터를 한 번에 로드"""
-        # 파일이 없을 경우를 대비한 기본 데이터 구조
-        self.db = {"stress_data": [], "casting_data": [], "longitu_data": [], "weld_data": [], "coefficient_data": []}
-        if os.path.exists("piping_data.json"):
-            with open("piping_data.json", "r", encoding="utf-8") as f:
-                self.db = json.load(f)
+        """JSON 파일에서 데이터를 한 번에 로드하고 이후 변경은 감시"""
+        self.db = load_reference_data()
+        self.search_index = SearchIndex(self.db)
         self.update_table_view()
+        self.reference_watcher = ReferenceDataWatcher(resource_path(DATA_FILE), self.db, self)
+        self.reference_watcher.reloaded.connect(self.apply_reference_diff)
+
+    def apply_reference_diff(self, new_db: dict, diffs: dict):
+        """바뀐 행만 테이블에 반영하고 이 데이터에 의존하는 결과를 무효화"""
+        self.db = new_db
+        for changed in diffs:
+            self.search_index.update(changed, new_db.get(changed, []))
+        key = DATASET_KEYS[self.selector.currentIndex()]
+        if key in diffs:
+            self.model.apply_row_diff(new_db.get(key, []), diffs[key])
+            self.table.resizeColumnsToContents()
+        if self.search_edit.text().strip():
+            self.all_matches = None # 행 번호가 바뀌었으므로 처음부터 다시 검색 (다른 데이터셋의 일치 수도 갱신)
+            self.apply_search(self.search_edit.text())
+
+        if {"stress_data", *FACTOR_DATASETS} & set(diffs) and os.path.exists(STORE_FILE):
+            store = ResultStore(STORE_FILE)
+            store.invalidate_stale(material_versions(new_db))
+            store.close()
+        self.reference_data_changed.emit(list(diffs))
 
     def update_table_view(self):
         """콤보박스 선택에 따라 테이블 갱신 (리팩토링 핵심)"""
-        key_map = ["stress_data", "casting_data", "longitu_data", "weld_data", "coefficient_data"]
-        data = self.db.get(key_map[self.selector.currentIndex()], [])
-        
-        if not data:
-            self.table.setRowCount(0)
-            return
+        data = self.db.get(DATASET_KEYS[self.selector.currentIndex()], [])
+        self.model.set_rows(data)
+        self.apply_search(self.search_edit.text())
 
-        self.table.setRowCount(len(data))
-        self.table.setColumnCount(len(data[0]))
-        
-        for r, row_data in enumerate(data):
-            for c, value in enumerate(row_data):
-                item = QTableWidgetItem(str(value))
-                if r == 0: # 첫 줄 헤더 강조
-                    item.setBackground(QColor("#2c3e50"))
-                    item.setForeground(QColor("white"))
-                self.table.setItem(r, c, item)
-        
         self.table.resizeColumnsToContents()
         self.table.resizeRowsToContents()
 
-    def calculate(self):
-        # 기존 계산 로직과 동일하되, 시각적 피드백 추가
-        try:
-            P = float(self.inputs['pressure'].text() or 0)
-            D = float(self.inputs['diameter'].text() or 0)
-            S = float(self.inputs['stress'].text() or 0)
-            E = float(self.inputs['quality'].text() or 0)
-            W = float(self.inputs['weld'].text() or 0)
-            Y = float(self.inputs['coeff'].text() or 0)
-            C = float(self.inputs['corrosion'].text() or 0)
-
-            denominator = 2 * (S * E * W + P * Y)
-            if denominator <= 0: return
-
-            t = (P * D / denominator) + C
-            self.res_label.setText(f"{t:.4f} mm")
-        except:
+    def apply_search(self, query: str):
+        """검색어로 현재 테이블을 거르고 데이터셋별 일치 수를 표시"""
+        self.search_timer.stop()
+        key = DATASET_KEYS[self.selector.currentIndex()]
+        if not query.strip():
+            self.proxy.set_accepted(None)
+            self.last_matches = None
+            self.all_matches = None
+            self.search_status.setText("")
+        else:
+            # 이전 검색어를 이어서 입력한 경우 데이터셋마다 이전 결과 안에서만 검색
+            within = self.all_matches if query.startswith(self.last_query) else None
+            self.all_matches = self.search_index.search_all(query, within)
+            self.last_matches = self.all_matches.get(key, set())
+            self.proxy.set_accepted(self.last_matches)
+            others = ", ".join(f"{self.selector.itemText(i)}: {len(self.all_matches[k])}"
+                               for i, k in enumerate(DATASET_KEYS)
+                               if self.all_matches.get(k) and k != key)
+            self.search_status.setText(f"{len(self.last_matches)} rows" + (f"  |  {others}" if others else ""))
+        self.last_query = query
+
+# --- 10. 배관 열팽창 계산 ---
+class ThermalExpansionWidget(QWidget):
+    """설치 -> 설계 온도의 열팽창량. 길이 칸에 엑셀 열(길이 또는 길이/설치/설계 온도 3열)을 붙여넣으면 한 번에 계산"""
+    def __init__(self, db: dict, parent=None):
+        super().__init__(parent)
+        self.db = db
+        self.inputs = {}
+        self.graph = Graph()
+        self.bulk_values = None
+        self.setup_ui()
+
+    def setup_ui(self):
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(15, 15, 15, 15)
+
+        card = QFrame()
+        card.setProperty("card", True)
+        card_layout = QVBoxLayout(card)
+        card_layout.setContentsMargins(20, 20, 20, 20)
+
+        title_lbl = QLabel("Thermal Expansion")
+        title_lbl.setProperty("role", "title")
+        card_layout.addWidget(title_lbl)
+
+        grid = QGridLayout()
+        grid.setVerticalSpacing(15)
+        grid.setHorizontalSpacing(25)
+        self.material_combo = QComboBox()
+        self.unit_combo = UnitCombobox(list(TEMPERATURE_DATA))
+        grid.addWidget(QLabel("Material"), 0, 0)
+        grid.addWidget(self.material_combo, 0, 1, 1, 2)
+        fields = [("length", "Pipe Length (L)", "m"),
+                  ("install", "Installation Temp. (T1)", None),
+                  ("design", "Design Temp. (T2)", None)]
+        for i, (key, label, unit) in enumerate(fields, 1):
+            edit = UnitLine(bulk=key == "length") # 길이 칸만 열 붙여넣기를 받음
+            edit.setFixedHeight(30)
+            self.inputs[key] = edit
+            grid.addWidget(QLabel(label), i, 0)
+            grid.addWidget(edit, i, 1)
+            if unit:
+                grid.addWidget(QLabel(unit), i, 2)
+        grid.addWidget(self.unit_combo, 2, 2, 2, 1)
+        card_layout.addLayout(grid)
+
+        result_layout = QHBoxLayout()
+        delta_lbl = QLabel("Expansion (ΔL):")
+        delta_lbl.setProperty("role", "strong")
+        self.res_label = QLabel("-")
+        self.res_label.setProperty("role", "result")
+        result_layout.addWidget(delta_lbl)
+        result_layout.addStretch()
+        result_layout.addWidget(self.res_label)
+        card_layout.addLayout(result_layout)
+        self.alpha_label = QLabel("")
+        self.alpha_label.setProperty("role", "muted")
+        card_layout.addWidget(self.alpha_label)
+
+        # 붙여넣은 라인 목록 결과: L, T1, T2, ΔL
+        self.bulk_model = BulkResultModel(self)
+        self.bulk_view = BulkResultView()
+        self.bulk_view.setModel(self.bulk_model)
+        self.bulk_view.setVisible(False)
+        self.bulk_status = QLabel("")
+        self.bulk_status.setProperty("role", "muted")
+        card_layout.addWidget(self.bulk_status)
+        card_layout.addWidget(self.bulk_view)
+
+        layout.addWidget(card)
+        self.set_reference_data(self.db)
+        self.setup_graph()
+
+    def setup_graph(self):
+        for key, edit in self.inputs.items():
+            self.graph.input(key, parse_input, edit.text())
+            edit.textChanged.connect(lambda text, k=key: self.graph.set(k, text))
+        self.graph.input("material", None, self.material_combo.currentText())
+        self.graph.input("unit", None, self.unit_combo.currentText())
+        self.material_combo.currentTextChanged.connect(lambda text: self.graph.set("material", text))
+        self.unit_combo.currentTextChanged.connect(lambda text: self.graph.set("unit", text))
+
+        self.graph.computed("expansion", self.expansion, ["length", "install", "design", "material", "unit"])
+        self.graph.subscribe("expansion", self.show_expansion)
+        self.inputs["length"].bulk_pasted.connect(self.convert_bulk)
+        self.unit_combo.currentTextChanged.connect(self.update_bulk)
+        self.material_combo.currentTextChanged.connect(self.update_bulk)
+        self.inputs["install"].textChanged.connect(self.update_bulk) # 1열 붙여넣기는 입력칸 온도를 씀
+        self.inputs["design"].textChanged.connect(self.update_bulk)
+
+    def set_reference_data(self, db: dict):
+        """expansion_data 가 바뀌면 재질 목록을 다시 채움 (선택은 유지)"""
+        self.db = db
+        self.table = expansion_table(db)
+        current = self.material_combo.currentText()
+        self.material_combo.blockSignals(True)
+        self.material_combo.clear()
+        self.material_combo.addItems(list(self.table))
+        if current:
+            self.material_combo.setCurrentText(current)
+        self.material_combo.blockSignals(False)
+        if "material" in self.graph.nodes and not self.graph.set("material", self.material_combo.currentText()):
+            self.graph.invalidate("material") # 같은 재질이라도 계수가 바뀌었을 수 있으므로 다시 계산
+
+    def expansion(self, length, install, design, material, unit):
+        if not material:
+            return None
+        result = thermal_expansion(length, install, design, material, self.db, unit, table=self.table)
+        return (float(result["delta"][0]), float(result["alpha_install"][0]), float(result["alpha_design"][0]))
+
+    def show_expansion(self, result):
+        if result is None:
             self.res_label.setText("-")
+            self.alpha_label.setText("")
+            return
+        delta, a1, a2 = result
+        self.res_label.setText(format_mm(delta))
+        self.alpha_label.setText(f"α(T1) {a1:.2f}, α(T2) {a2:.2f} ×10⁻⁶/˚C (mean from 20˚C)"
+                                 if a1 == a1 and a2 == a2 else "온도가 표 범위를 벗어남")
+
+    def convert_bulk(self, text: str):
+        """길이 1열 (온도는 입력칸 값) 또는 길이/설치/설계 온도 3열 (그 외 열 수는 거부)"""
+        values = parse_pasted_values(text)
+        if values.shape[1] not in (1, 3):
+            self.bulk_values = None
+            self.bulk_view.setVisible(False)
+            self.bulk_status.setText(f"Paste 1 column (L) or 3 columns (L, T1, T2); got {values.shape[1]}")
+            return
+        self.bulk_values = values
+        self.bulk_status.setText(f"{len(values)} lines, " + ("T1/T2 from input fields" if values.shape[1] == 1
+                                                             else "T1/T2 from pasted columns"))
+        self.bulk_view.setVisible(True)
+        self.update_bulk()
+
+    def update_bulk(self, *_):
+        if self.bulk_values is None or not self.material_combo.currentText():
+            return
+        values = self.bulk_values
+        length = values[:, 0]
+        if values.shape[1] == 3:
+            install, design = values[:, 1], values[:, 2]
+        else:
+            install = np.full(len(length), self.graph.value("install"))
+            design = np.full(len(length), self.graph.value("design"))
+        result = thermal_expansion(length, install, design, self.material_combo.currentText(),
+                                   self.db, self.unit_combo.currentText(), table=self.table)
+        self.bulk_model.set_values(np.column_stack([length, install, design, result["delta"]]))
 
 # --- 메인 윈도우 ---
 class MainWindow(QMainWindow):
@@ -438,33 +1007,39 @@ class MainWindow(QMainWindow):
             scroll.setWidget(container)
             return scroll
 
-        # 1. 단위 환산 위젯 그룹화
-        unit_group = QWidget()
-        unit_vbox = QVBoxLayout(unit_group)
-        for title, units in UNIT_DATA.items():
-            unit_vbox.addWidget(RatioConverterWidget(title, units))
-        unit_vbox.addWidget(TemperatureConverterWidget())
+        # 1. 단위 환산: 카테고리를 전환하는 카드 하나 (카테고리별 위젯을 만들지 않음)
+        unit_group = CompactConverterWidget()
 
         # 2. 배관 두께 위젯
         thickness_group = PipeThicknessWidget()
 
+        # 3. 열팽창 위젯 (참조 데이터는 두께 위젯이 읽고 감시하는 것을 공유)
+        expansion_group = ThermalExpansionWidget(thickness_group.db)
+        thickness_group.reference_data_changed.connect(
+            lambda keys: expansion_group.set_reference_data(thickness_group.db) if "expansion_data" in keys else None)
+
         # 스크롤 적용하여 탭 추가
         self.tab_widget.addTab(create_scroll_tab(unit_group), "단위 환산")
         self.tab_widget.addTab(create_scroll_tab(thickness_group), "배관 두께 계산")
+        self.tab_widget.addTab(create_scroll_tab(expansion_group), "열팽창 계산")
         
         self.setCentralWidget(self.tab_widget)
 
 if __name__ == "__main__":
     app = QApplication(sys.argv)
-
-    try:
-        qdarktheme.setup_theme("dark")
-    except AttributeError:
-        app.setStyleSheet(qdarktheme.load_stylesheet())
+    theme_timing = apply_theme(app, "dark") # qdarktheme 결과는 디스크에 캐시
 
     #app.setStyle("Fusion")
 
     window = MainWindow()
     window.show()
 
+    if "--startup-check" in sys.argv: # 패키징 결과 확인용: 첫 화면까지 걸린 시간(테마 적용 포함)을 출력하고 종료
+        def report_startup():
+            print(f"startup: {(time.perf_counter() - STARTED) * 1000:.0f} ms", flush=True)
+            print(f"theme: {'cache hit' if theme_timing['cache_hit'] else 'cache miss'}, "
+                  f"load {theme_timing['load_ms']:.1f} ms, apply {theme_timing['apply_ms']:.1f} ms", flush=True)
+            app.quit()
+        QTimer.singleShot(0, report_startup)
+
     sys.exit(app.exec())
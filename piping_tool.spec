@@ -0,0 +1,77 @@
+# -*- mode: python ; coding: utf-8 -*-
+"""piping_tool 패키징 설정 (pyinstaller piping_tool.spec)
+
+- onefile 대신 one-dir: 실행할 때마다 임시 폴더에 압축을 푸는 시간이 없음
+- qdarktheme 스타일시트/팔레트/아이콘을 빌드 시점에 미리 만들어 번들
+- 사용하지 않는 Qt 모듈은 제외해 번들 크기와 로딩할 라이브러리 수를 줄임
+"""
+import os
+import sys
+
+from PyInstaller.utils.hooks import copy_metadata
+
+sys.path.insert(0, SPECPATH)
+from reference_data import DATA_FILE
+from theme import BUNDLED_CACHE_DIR, build_theme_cache
+
+CACHE_BUILD_DIR = os.path.join(workpath, "precompiled")
+theme_dir = os.path.join(CACHE_BUILD_DIR, BUNDLED_CACHE_DIR)
+build_theme_cache("dark", theme_dir)
+
+# 이 앱은 QtCore/QtGui/QtWidgets 만 사용
+EXCLUDED_QT = [
+    "PySide6.QtWebEngineCore", "PySide6.QtWebEngineWidgets", "PySide6.QtWebEngineQuick",
+    "PySide6.QtWebChannel", "PySide6.QtWebSockets", "PySide6.QtQml", "PySide6.QtQuick",
+    "PySide6.QtQuickWidgets", "PySide6.QtQuick3D", "PySide6.Qt3DCore", "PySide6.Qt3DRender",
+    "PySide6.QtMultimedia", "PySide6.QtMultimediaWidgets", "PySide6.QtCharts",
+    "PySide6.QtDataVisualization", "PySide6.QtGraphs", "PySide6.QtPdf", "PySide6.QtPdfWidgets",
+    "PySide6.QtNetwork", "PySide6.QtSql", "PySide6.QtTest", "PySide6.QtSvgWidgets",
+    "PySide6.QtOpenGL", "PySide6.QtOpenGLWidgets", "PySide6.QtPrintSupport",
+    "PySide6.QtBluetooth", "PySide6.QtPositioning", "PySide6.QtSensors",
+    "PySide6.QtSerialPort", "PySide6.QtDesigner", "PySide6.QtHelp", "PySide6.QtUiTools",
+]
+# GUI 실행에 필요 없는 선택 의존성 (CLI 도구에서만 사용)
+EXCLUDED_PY = ["tkinter", "matplotlib", "pyarrow", "openpyxl", "xlrd", "reportlab", "sklearn", "scipy"]
+
+a = Analysis(
+    ["piping_tool.py"],
+    pathex=[SPECPATH],
+    binaries=[],
+    datas=[
+        (DATA_FILE, "."),
+        (theme_dir, BUNDLED_CACHE_DIR),
+        *copy_metadata("pyqtdarktheme"), # 테마 캐시 파일 이름에 버전을 사용
+    ],
+    hiddenimports=[],
+    hookspath=[],
+    runtime_hooks=[],
+    excludes=EXCLUDED_QT + EXCLUDED_PY,
+    noarchive=False,
+    optimize=1,
+)
+# 플러그인 훅이 끌어오는 Qt 라이브러리 중 사용하지 않는 것 (가상 키보드, PDF 이미지 포맷 -> Qml/Quick/Pdf)
+UNUSED_QT_BINARIES = ("virtualkeyboard", "libqpdf", "Qt6Pdf", "Qt6Qml", "Qt6Quick", "Qt6VirtualKeyboard")
+a.binaries = [entry for entry in a.binaries
+              if not any(name.lower() in entry[0].lower() for name in UNUSED_QT_BINARIES)]
+
+pyz = PYZ(a.pure)
+
+exe = EXE(
+    pyz,
+    a.scripts,
+    [],
+    exclude_binaries=True,
+    name="piping_tool",
+    debug=False,
+    strip=False,
+    upx=False, # UPX 압축은 실행 시 해제 비용이 있음
+    console=False,
+)
+coll = COLLECT(
+    exe,
+    a.binaries,
+    a.datas,
+    strip=False,
+    upx=False,
+    name="piping_tool",
+)
@@ -0,0 +1,83 @@
+"""Darcy-Weisbach 압력 손실 계산 (라인 리스트 전체를 배열로 한 번에 계산)"""
+from typing import Dict
+import numpy as np
+
+from units import UnitSpec, lookup_units, from_base
+
+FLOW_CATEGORIES = ("부피 유량", "질량 유량")          # 기준: m³/hr, kg/hr
+VISCOSITY_CATEGORIES = ("동적 유속", "정적 유속")     # 기준: mPa·s, mm²/s
+LAMINAR_RE = 2000.0
+LN10 = np.log(10.0)
+
+# --- 1. 입력 정규화 (UNIT_DATA 환산표 사용) ---
+def normalize_flow(flow, units: UnitSpec, density) -> np.ndarray:
+    """부피/질량 유량을 m³/s 로 정규화 (질량 유량은 밀도로 나눔)"""
+    factor, index = lookup_units(units, FLOW_CATEGORIES)
+    q = np.asarray(flow, dtype=float) * factor / 3600.0
+    return np.where(index == 1, q / np.asarray(density, dtype=float), q)
+
+def normalize_viscosity(viscosity, units: UnitSpec, density) -> np.ndarray:
+    """동적/정적 점도를 동점성계수 m²/s 로 정규화"""
+    factor, index = lookup_units(units, VISCOSITY_CATEGORIES)
+    base = np.asarray(viscosity, dtype=float) * factor
+    return np.where(index == 0,
+                    base * 1e-3 / np.asarray(density, dtype=float),   # mPa·s -> m²/s
+                    base * 1e-6)                                       # mm²/s -> m²/s
+
+# --- 2. 마찰 계수 (Colebrook, 벡터화 Newton 반복) ---
+def colebrook_friction(reynolds, relative_roughness, tol: float = 1e-10, max_iter: int = 20) -> np.ndarray:
+    """Darcy 마찰 계수를 배열 전체에 대해 동시에 계산
+
+    x = 1/√f 에 대해 g(x) = x + 2·log10(ε/3.7D + 2.51·x/Re) = 0 을 Newton 법으로 풀고,
+    Swamee-Jain 근사식을 초기값으로 사용. 층류 구간(Re < 2000)은 64/Re.
+    """
+    re, rr = np.broadcast_arrays(np.asarray(reynolds, dtype=float),
+                                 np.asarray(relative_roughness, dtype=float))
+    f = np.zeros(re.shape)
+    laminar = (re > 0) & (re < LAMINAR_RE)
+    f[laminar] = 64.0 / re[laminar]
+
+    turbulent = re >= LAMINAR_RE
+    if not turbulent.any():
+        return f
+    re_t = re[turbulent]
+    a = rr[turbulent] / 3.7
+    b = 2.51 / re_t
+    x = -2.0 * np.log10(a + 5.74 / re_t ** 0.9)
+    for _ in range(max_iter):
+        inner = a + b * x
+        g = x + 2.0 * np.log10(inner)
+        dg = 1.0 + 2.0 * b / (inner * LN10)
+        step = g / dg
+        x -= step
+        if np.max(np.abs(step)) < tol:
+            break
+    f[turbulent] = 1.0 / x ** 2
+    return f
+
+# --- 3. 압력 손실 ---
+def pressure_drop(flow, flow_unit: UnitSpec, inner_diameter, length, density,
+                  viscosity, viscosity_unit: UnitSpec, roughness=0.045,
+                  out_unit: UnitSpec = "Kilopascal") -> Dict[str, np.ndarray]:
+    """라인 리스트 전체의 Darcy-Weisbach 압력 손실 계산
+
+    inner_diameter, roughness: mm / length: m / density: kg/m³
+    유량·점도 단위는 UNIT_DATA 의 유량, 유속 카테고리 단위(행별 지정 가능)
+    out_unit 은 "압력" 카테고리 단위
+    """
+    d = np.asarray(inner_diameter, dtype=float) * 1e-3
+    q = normalize_flow(flow, flow_unit, density)
+    nu = normalize_viscosity(viscosity, viscosity_unit, density)
+
+    velocity = q / (np.pi * d ** 2 / 4.0)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        reynolds = np.where(nu > 0, np.abs(velocity) * d / nu, 0.0)
+    friction = colebrook_friction(reynolds, np.asarray(roughness, dtype=float) * 1e-3 / d)
+
+    dp_pa = friction * (np.asarray(length, dtype=float) / d) * np.asarray(density, dtype=float) * velocity ** 2 / 2.0
+    return {
+        "velocity": velocity,                                         # m/s
+        "reynolds": reynolds,
+        "friction": friction,
+        "pressure_drop": from_base(dp_pa * 1e-6, "압력", out_unit),   # 기준 단위 MPa
+    }
@@ -1,8 +1,17 @@
 import sys
-from random import randint
-from PySide6.QtCore import Qt
+if __name__ == "__main__" and sys.argv[1:2] == ["simulate"]:
+    from lotto_engine import main # 시뮬레이션 모드: python random_number.py simulate 1000000000 --workers 8
+    sys.exit(main(sys.argv[2:]))
+import numpy as np
+from PySide6.QtCore import Qt, QTimer
 from PySide6.QtWidgets import (QApplication, QMainWindow, QWidget,
-                               QLabel, QPushButton, QGridLayout)
+                               QLabel, QPushButton, QGridLayout, QFileDialog,
+                               QGroupBox, QVBoxLayout)
+
+from lotto_engine import draw, PICK, to_masks, match_histogram, load_history, DrawStats
+
+AUTO_BATCH = 50_000   # 연속 추첨 시 타이머 한 번에 뽑는 추첨 수
+REFRESH_MS = 250      # 통계 패널 최대 갱신 주기 (추첨마다 다시 그리지 않음)
 
 class MainWindow(QMainWindow):
     def __init__(self):
@@ -10,6 +19,7 @@ class MainWindow(QMainWindow):
 
         self.setWindowTitle("무작위 번호 생성기")
         self.setGeometry(100, 100, 400, 150) # 창 위치와 크기 설정
+        self.rng = np.random.default_rng()
 
         self.layout = QGridLayout()
         self.labels = [] # 생성된 모든 QLabel 객체를 저장할 리스트
@@ -32,16 +42,101 @@ class MainWindow(QMainWindow):
         # 버튼을 2행 0열부터 6열까지 걸쳐서 배치 (가운데 정렬 효과)
         self.layout.addWidget(self.btn, 2, 0, 1, 6) 
 
+        # --- 추첨 이력과 비교 ---
+        self.history_btn = QPushButton("추첨 이력 파일과 비교")
+        self.history_btn.clicked.connect(self.check_history)
+        self.layout.addWidget(self.history_btn, 3, 0, 1, 6)
+        self.history_label = QLabel("")
+        self.layout.addWidget(self.history_label, 4, 0, 1, 6)
+        self.tickets = None # 현재 표시 중인 번호 (행, 6)
+
+        # --- 누적 통계 패널 ---
+        self.stats = DrawStats()
+        self.stats_dirty = False
+        stats_group = QGroupBox("누적 통계")
+        stats_layout = QVBoxLayout(stats_group)
+        self.stats_label = QLabel("추첨 없음")
+        self.stats_label.setTextInteractionFlags(Qt.TextSelectableByMouse)
+        stats_layout.addWidget(self.stats_label)
+        self.auto_btn = QPushButton("연속 추첨 시작")
+        self.auto_btn.setCheckable(True)
+        self.auto_btn.toggled.connect(self.toggle_auto)
+        stats_layout.addWidget(self.auto_btn)
+        self.layout.addWidget(stats_group, 5, 0, 1, 6)
+
+        self.auto_timer = QTimer(self)
+        self.auto_timer.timeout.connect(self.auto_draw)
+        self.refresh_timer = QTimer(self)
+        self.refresh_timer.setInterval(REFRESH_MS)
+        self.refresh_timer.timeout.connect(self.refresh_stats)
+        self.refresh_timer.start()
+
         # --- 메인 위젯 설정 ---
         self.container = QWidget()
         self.container.setLayout(self.layout)
         self.setCentralWidget(self.container)
 
     def random_number(self):
-        """저장된 모든 레이블에 1부터 45 사이의 무작위 숫자를 설정합니다."""
-        for label in self.labels:
-            number = randint(1, 45)
+        """행마다 1부터 45 사이의 서로 다른 숫자 6개를 뽑아 레이블에 설정합니다."""
+        self.tickets = draw(len(self.labels) // PICK, rng=self.rng)
+        for label, number in zip(self.labels, self.tickets.ravel()):
             label.setText(f"{number}")
+        self.history_label.setText("")
+        self.stats.update(self.tickets)
+        self.stats_dirty = True
+
+    def toggle_auto(self, running: bool):
+        self.auto_btn.setText("연속 추첨 정지" if running else "연속 추첨 시작")
+        if running:
+            self.auto_timer.start(0)
+        else:
+            self.auto_timer.stop()
+
+    def auto_draw(self):
+        """이벤트 루프가 비는 동안 AUTO_BATCH 회씩 추첨해 통계에만 반영합니다."""
+        self.stats.update(draw(AUTO_BATCH, rng=self.rng))
+        self.stats_dirty = True
+
+    def refresh_stats(self):
+        """바뀐 내용이 있을 때만 REFRESH_MS 간격으로 패널을 다시 씁니다."""
+        if not self.stats_dirty:
+            return
+        self.stats_dirty = False
+        st = self.stats
+        order = np.argsort(st.counts, kind="stable")
+        pairs = np.triu(st.pairs, 1)
+        top_pairs = np.argsort(pairs, axis=None)[::-1][:3]
+        gap_bins = np.arange(len(st.gap_hist))
+        gap_total = st.gap_hist.sum()
+        mean_gap = (gap_bins * st.gap_hist).sum() / gap_total if gap_total else 0.0
+        streaks = np.flatnonzero(st.streak_hist)
+        self.stats_label.setText("\n".join([
+            f"총 추첨: {st.draws:,}회",
+            "많이 나온 번호: " + ", ".join(f"{n + 1}({st.counts[n]:,})" for n in order[::-1][:5]),
+            "적게 나온 번호: " + ", ".join(f"{n + 1}({st.counts[n]:,})" for n in order[:5]),
+            "함께 많이 나온 쌍: " + ", ".join(f"{a + 1}-{b + 1}({pairs[a, b]:,})"
+                                          for a, b in zip(*np.unravel_index(top_pairs, pairs.shape))),
+            f"재출현 평균 간격: {mean_gap:.2f}회차",
+            f"최장 연속 출현: {streaks[-1] if len(streaks) else 0}회차"
+            + (" 이상" if len(streaks) and streaks[-1] == len(st.streak_hist) - 1 else ""),
+        ]))
+
+    def check_history(self):
+        """현재 번호 각 행이 이력 파일의 회차들과 몇 개씩 일치했는지 표시합니다."""
+        if self.tickets is None:
+            self.random_number()
+        path, _ = QFileDialog.getOpenFileName(self, "추첨 이력 파일", "", "CSV/Text (*.csv *.txt);;All files (*)")
+        if not path:
+            return
+        try:
+            history = load_history(path)
+        except (OSError, ValueError) as e:
+            self.history_label.setText(f"읽기 실패: {e}")
+            return
+        counts = match_histogram(to_masks(self.tickets), history, per_ticket=True)
+        lines = [f"{row + 1}행: " + ", ".join(f"{m}개 {counts[row, m]}회" for m in range(3, PICK + 1))
+                 for row in range(len(counts))]
+        self.history_label.setText(f"{len(history)}회차와 비교\n" + "\n".join(lines))
 
 if __name__ == "__main__":
     app = QApplication(sys.argv)
@@ -0,0 +1,116 @@
+"""입력 -> 계산 값 의존 그래프 (Qt 비의존)
+
+입력 노드는 값이 바뀔 때 한 번만 파싱하고, 그 입력에 (직간접적으로) 의존하는 계산 노드만 다시 계산.
+계산 결과가 이전과 같으면 그 아래 노드는 다시 계산하지 않음. 노드별 재계산 횟수를 기록.
+"""
+import math
+from typing import Any, Callable, Dict, List, Optional
+
+def _same(a, b) -> bool:
+    """nan 끼리도 같은 값으로 취급"""
+    if isinstance(a, float) and isinstance(b, float) and math.isnan(a) and math.isnan(b):
+        return True
+    try:
+        return bool(a == b)
+    except (TypeError, ValueError): # 배열 등 비교가 모호한 값은 바뀐 것으로 봄
+        return False
+
+class Node:
+    def __init__(self, name: str, func: Optional[Callable] = None, deps: List[str] = ()):
+        self.name = name
+        self.func = func          # 입력 노드는 파서, 계산 노드는 의존 노드 값을 받는 함수
+        self.deps = list(deps)
+        self.dependents: List[str] = []
+        self.value: Any = None
+        self.recomputes = 0
+        self.subscribers: List[Callable[[Any], None]] = []
+
+    @property
+    def is_input(self) -> bool:
+        return not self.deps
+
+class Graph:
+    """노드는 의존 노드보다 뒤에 추가되므로 추가 순서가 곧 계산 순서"""
+    def __init__(self):
+        self.nodes: Dict[str, Node] = {}
+        self.listeners: List[Callable[[List[str]], None]] = []  # 한 번 전파가 끝날 때 (바뀐 노드 목록)
+
+    def input(self, name: str, parse: Callable = None, raw=None) -> Node:
+        node = Node(name, parse)
+        self.nodes[name] = node
+        node.value = parse(raw) if parse else raw
+        return node
+
+    def computed(self, name: str, func: Callable, deps: List[str]) -> Node:
+        missing = [d for d in deps if d not in self.nodes]
+        if missing:
+            raise KeyError(f"{name}: 알 수 없는 의존 노드 {missing}")
+        node = Node(name, func, deps)
+        self.nodes[name] = node
+        for dep in deps:
+            self.nodes[dep].dependents.append(name)
+        node.value = func(*(self.nodes[d].value for d in deps))
+        node.recomputes = 1
+        return node
+
+    def value(self, name: str):
+        return self.nodes[name].value
+
+    def subscribe(self, name: str, callback: Callable[[Any], None], call_now: bool = True):
+        """노드 값이 바뀔 때마다 callback(값) 호출"""
+        self.nodes[name].subscribers.append(callback)
+        if call_now:
+            callback(self.nodes[name].value)
+
+    def set(self, name: str, raw) -> List[str]:
+        """입력 노드에 원본 값(텍스트 등)을 넣고 값이 바뀐 노드 이름 목록을 반환"""
+        node = self.nodes[name]
+        if not node.is_input:
+            raise ValueError(f"{name} 은(는) 계산 노드")
+        value = node.func(raw) if node.func else raw
+        node.recomputes += 1
+        if _same(value, node.value):
+            return []
+        node.value = value
+        return self._propagate([name])
+
+    def invalidate(self, name: str) -> List[str]:
+        """값은 그대로지만 계산에 쓰는 외부 데이터가 바뀐 노드: 하위 노드를 한 번씩 다시 계산
+
+        계산 노드면 자신도 다시 계산. 값이 바뀐 노드 이름 목록을 반환 (name 은 항상 포함)
+        """
+        node = self.nodes[name]
+        if not node.is_input:
+            node.value = node.func(*(self.nodes[d].value for d in node.deps))
+        node.recomputes += 1
+        return self._propagate([name])
+
+    def _propagate(self, changed: List[str]) -> List[str]:
+        changed_set = set(changed)
+        # 바뀐 입력의 하위 노드만 추가 순서(위상 순서)대로 확인
+        pending = set()
+        stack = list(changed)
+        while stack:
+            for dependent in self.nodes[stack.pop()].dependents:
+                if dependent not in pending:
+                    pending.add(dependent)
+                    stack.append(dependent)
+        for name, node in self.nodes.items():
+            if name not in pending or not changed_set.intersection(node.deps):
+                continue
+            value = node.func(*(self.nodes[d].value for d in node.deps))
+            node.recomputes += 1
+            if not _same(value, node.value):
+                node.value = value
+                changed_set.add(name)
+                changed.append(name)
+
+        for name in changed:
+            for callback in self.nodes[name].subscribers:
+                callback(self.nodes[name].value)
+        for listener in self.listeners:
+            listener(changed)
+        return changed
+
+    def recompute_counts(self) -> Dict[str, int]:
+        return {name: node.recomputes for name, node in self.nodes.items()}
@@ -0,0 +1,117 @@
+"""piping_data.json 참조 데이터 로드 (Qt 없이 사용 가능)"""
+import os
+import sys
+import json
+import re
+import difflib
+from typing import Dict, List, Tuple
+
+DATA_FILE = "piping_data.json"
+
+# PipeThicknessWidget.selector 의 순서와 동일
+DATASET_KEYS = ["stress_data", "casting_data", "longitu_data", "weld_data",
+                "coefficient_data", "pipe_size_data", "expansion_data"]
+
+def empty_reference_data() -> Dict[str, List[List[str]]]:
+    """파일이 없을 경우를 대비한 기본 데이터 구조"""
+    return {key: [] for key in DATASET_KEYS}
+
+def resource_path(relative_path: str) -> str:
+    """실행 파일 내부의 임시 폴더(PyInstaller)나 현재 폴더에서 파일을 찾음"""
+    base_path = getattr(sys, "_MEIPASS", os.path.abspath("."))
+    return os.path.join(base_path, relative_path)
+
+def load_reference_data(path: str = None) -> Dict[str, List[List[str]]]:
+    """JSON 파일에서 데이터를 한 번에 로드"""
+    path = path or resource_path(DATA_FILE)
+    db = empty_reference_data()
+    if os.path.exists(path):
+        with open(path, "r", encoding="utf-8") as f:
+            db.update(json.load(f))
+    return db
+
+# --- 행 단위 변경 비교 (핫 리로드용) ---
+RowOp = Tuple[str, int, int, int, int]
+
+def diff_rows(old_rows: List[List[str]], new_rows: List[List[str]]) -> List[RowOp]:
+    """두 테이블의 행 단위 차이를 (tag, i1, i2, j1, j2) 목록으로 반환 (difflib opcode, equal 제외)
+
+    old_rows[i1:i2] 를 new_rows[j1:j2] 로 바꾸면 새 테이블이 됨
+    """
+    matcher = difflib.SequenceMatcher(None, [tuple(r) for r in old_rows],
+                                      [tuple(r) for r in new_rows], autojunk=False)
+    return [op for op in matcher.get_opcodes() if op[0] != "equal"]
+
+def diff_datasets(old_db: Dict[str, List[List[str]]],
+                  new_db: Dict[str, List[List[str]]]) -> Dict[str, List[RowOp]]:
+    """바뀐 데이터셋만 골라 행 단위 차이를 계산"""
+    diffs = {}
+    for key in new_db.keys() | old_db.keys():
+        old_rows, new_rows = old_db.get(key, []), new_db.get(key, [])
+        if old_rows != new_rows:
+            diffs[key] = diff_rows(old_rows, new_rows)
+    return diffs
+
+# --- 토큰/접두어 검색 인덱스 ---
+TOKEN_RE = re.compile(r"\w+")
+SUBTOKEN_RE = re.compile(r"(?<=[^\W\d_])(?=\d)|(?<=\d)(?=[^\W\d_])")   # 문자↔숫자 경계
+MAX_PREFIX = 20
+
+def tokenize(text: str) -> List[str]:
+    """셀 문자열을 소문자 토큰으로 분리 ("TP316L" -> tp316l, 316l, l)"""
+    tokens = []
+    for token in TOKEN_RE.findall(str(text).lower()):
+        tokens.append(token)
+        for m in SUBTOKEN_RE.finditer(token):
+            tokens.append(token[m.start():])
+    return tokens
+
+class SearchIndex:
+    """데이터셋의 행을 토큰 접두어 -> 행 번호 집합으로 색인 (생성/갱신 시 미리 만들어 둠)
+
+    검색은 질의 토큰별 집합의 교집합이며, 이전 질의를 이어서 입력한 경우
+    이전 결과 안에서만 교집합을 구해 입력할수록 점점 좁혀짐
+    """
+    def __init__(self, db: Dict[str, List[List[str]]]):
+        self.db = dict(db)
+        self.index: Dict[str, Dict[str, set]] = {}
+        for key in self.db:
+            self.prefixes(key)
+
+    def update(self, key: str, rows: List[List[str]]):
+        """바뀐 데이터셋의 인덱스만 다시 만듦"""
+        self.db[key] = rows
+        self.index.pop(key, None)
+        self.prefixes(key)
+
+    def prefixes(self, key: str) -> Dict[str, set]:
+        if key not in self.index:
+            prefixes: Dict[str, set] = {}
+            for r, row in enumerate(self.db.get(key, [])):
+                for token in {t for cell in row for t in tokenize(cell)}:
+                    for k in range(1, min(len(token), MAX_PREFIX) + 1):
+                        prefixes.setdefault(token[:k], set()).add(r)
+            self.index[key] = prefixes
+        return self.index[key]
+
+    def search(self, key: str, query: str, within: set = None) -> set:
+        """질의의 모든 토큰을 접두어로 포함하는 행 번호 집합 (빈 질의는 전체 행)"""
+        tokens = [t[:MAX_PREFIX] for t in TOKEN_RE.findall(query.lower())]
+        rows = set(range(len(self.db.get(key, [])))) if within is None else within
+        if not tokens:
+            return rows
+        prefixes = self.prefixes(key)
+        for token in sorted(tokens, key=lambda t: len(prefixes.get(t, ()))):
+            rows = rows & prefixes.get(token, set())
+            if not rows:
+                break
+        return rows
+
+    def search_all(self, query: str, within: Dict[str, set] = None) -> Dict[str, set]:
+        """모든 데이터셋의 일치 행 번호 (within: 이전 질의의 데이터셋별 결과, 이어서 입력한 경우)"""
+        within = within or {}
+        return {key: self.search(key, query, within.get(key)) for key in self.db}
+
+    def counts(self, query: str, within: Dict[str, set] = None) -> Dict[str, int]:
+        """데이터셋별 일치 행 수"""
+        return {key: len(rows) for key, rows in self.search_all(query, within).items()}
@@ -0,0 +1,252 @@
+"""배관 두께 계산서 생성 (라인마다 한 장, HTML/PDF 스트리밍 출력)
+
+라인 리스트를 청크 단위로 읽어 두께 엔진으로 한 번에 계산한 뒤, 한 번만 컴파일한 템플릿으로
+계산서를 한 장씩 바로 파일에 씀. 워커 프로세스를 여러 개 쓰면 청크마다 별도 파일(part)로 나눠 기록
+PDF 도 페이지를 만드는 즉시 파일에 쓰므로 (외부 라이브러리 없음) 장 수와 무관하게 메모리 사용량이 일정
+"""
+import os
+import sys
+import html
+import time
+import zlib
+import argparse
+from string import Template
+from concurrent.futures import ProcessPoolExecutor, FIRST_COMPLETED, wait
+from typing import Dict, Iterator
+import numpy as np
+
+from thickness import FACTOR_TABLES, required_thickness, resolve_inputs
+from reference_data import load_reference_data
+from line_list_io import iter_chunks
+
+REPORT_CHUNK_SIZE = 1000   # 워커 사용 시 파일 하나에 들어가는 장 수
+
+# --- 1. 템플릿 (모듈 로드 시 한 번만 생성) ---
+HTML_HEAD = """<!DOCTYPE html>
+<html><head><meta charset="utf-8"><title>Pipe Wall Thickness Calculation Sheets</title>
+<style>
+body { font-family: "Malgun Gothic", sans-serif; font-size: 10pt; }
+.sheet { page-break-after: always; padding: 10mm; }
+h2 { color: #d35400; border-bottom: 2px solid #34495e; }
+table { border-collapse: collapse; margin: 4mm 0; }
+td, th { border: 1px solid #ced4da; padding: 2px 8px; text-align: left; }
+.formula { font-family: monospace; font-size: 11pt; margin: 2mm 0; }
+.result { font-weight: bold; color: #d35400; font-size: 12pt; }
+</style></head><body>
+"""
+HTML_TAIL = "</body></html>\n"
+SHEET_TEMPLATE = Template("""<div class="sheet">
+<h2>Calculation Sheet - Line $line</h2>
+<p>ASME B31.3 304.1.2, Eq. (3a): straight pipe under internal pressure</p>
+<table>
+<tr><th>Design Pressure (P)</th><td>$P MPa</td><th>Outside Diameter (D)</th><td>$D mm</td></tr>
+<tr><th>Allowable Stress (S)</th><td>$S MPa</td><th>Source of S</th><td>$S_source</td></tr>
+<tr><th>Quality Factor (E)</th><td>$E</td><th>Source of E</th><td>$E_source</td></tr>
+<tr><th>Weld Joint Factor (W)</th><td>$W</td><th>Source of W</th><td>$W_source</td></tr>
+<tr><th>Coefficient (Y)</th><td>$Y</td><th>Source of Y</th><td>$Y_source</td></tr>
+<tr><th>Corrosion (C)</th><td>$C mm</td><th></th><td></td></tr>
+</table>
+<div class="formula">t = P·D / 2(S·E·W + P·Y) = $P × $D / 2($S × $E × $W + $P × $Y) = $t mm</div>
+<div class="formula">t<sub>m</sub> = t + c = $t + $C = <span class="result">$tm mm</span></div>
+</div>
+""")
+PDF_LINES = [Template(line) for line in (
+    "Calculation Sheet - Line $line",
+    "ASME B31.3 304.1.2, Eq. (3a): straight pipe under internal pressure",
+    "",
+    "Design Pressure (P) = $P MPa          Outside Diameter (D) = $D mm",
+    "Allowable Stress (S) = $S MPa         Source of S: $S_source",
+    "Quality Factor (E) = $E               Source of E: $E_source",
+    "Weld Joint Factor (W) = $W            Source of W: $W_source",
+    "Coefficient (Y) = $Y                  Source of Y: $Y_source",
+    "Corrosion (C) = $C mm",
+    "",
+    "t = P*D / 2(S*E*W + P*Y) = $P x $D / 2($S x $E x $W + $P x $Y) = $t mm",
+    "tm = t + c = $t + $C = $tm mm",
+)]
+
+# --- 2. 계산서 값 생성 ---
+def _fmt(value: float) -> str:
+    return "-" if value != value else f"{value:.6g}"
+
+def _source(columns: Dict[str, np.ndarray], i: int, given: bool, looked_up: bool, table: str,
+            missing: str = "blank (0)") -> str:
+    """값의 출처 (E/W/Y 는 조회하지 못하면 resolve_inputs 와 같이 0 으로 계산)"""
+    if given:
+        return "input"
+    if not looked_up:
+        return missing
+    temperature = float(np.nan_to_num(float(columns["temperature"][i]))) if "temperature" in columns else 0.0
+    return f"{table}, {columns['spec'][i]} {columns['grade'][i]} at {_fmt(temperature)} ˚C"
+
+def sheet_records(columns: Dict[str, np.ndarray], db, first_line: int = 1) -> Iterator[Dict[str, str]]:
+    """청크 하나를 한 번에 계산하고 라인별 템플릿 값을 하나씩 돌려줌
+
+    S, E, W, Y 가 비어 있으면 spec/grade/temperature 로 참조 표에서 조회하고 출처를 함께 기록
+    """
+    n = len(next(iter(columns.values())))
+    inputs, looked_up = resolve_inputs(columns, db)
+    tm = required_thickness(**inputs)
+    stress, corrosion = inputs["stress"], inputs["corrosion"]
+    given_stress = np.isfinite(np.asarray(columns.get("stress", np.full(n, np.nan)), dtype=float))
+    names = columns.get("line")
+    symbols = {"quality": "E", "weld": "W", "coeff": "Y"}
+    for i in range(n):
+        record = {
+            "line": str(names[i]) if names is not None else str(first_line + i),
+            "P": _fmt(columns["pressure"][i]), "D": _fmt(columns["diameter"][i]),
+            "S": _fmt(stress[i]),
+            "S_source": _source(columns, i, given_stress[i], looked_up["stress"][i], "Table A-1", "-"),
+            "C": _fmt(corrosion[i]), "t": _fmt(tm[i] - corrosion[i]), "tm": _fmt(tm[i]),
+        }
+        for field, symbol in symbols.items():
+            given = field in columns and not np.isnan(float(columns[field][i]))
+            record[symbol] = _fmt(inputs[field][i])
+            record[f"{symbol}_source"] = _source(columns, i, given, looked_up[field][i], FACTOR_TABLES[field])
+        yield record
+
+# --- 3. 출력 형식 ---
+class HtmlReportWriter:
+    """계산서를 한 장씩 HTML 파일에 바로 기록 (인쇄 시 장마다 페이지 나눔)"""
+    def __init__(self, path: str):
+        self.file = open(path, "w", encoding="utf-8")
+        self.file.write(HTML_HEAD)
+
+    def write_sheet(self, record: Dict[str, str]):
+        self.file.write(SHEET_TEMPLATE.substitute({k: html.escape(v) for k, v in record.items()}))
+
+    def close(self):
+        self.file.write(HTML_TAIL)
+        self.file.close()
+
+A4_SIZE = (595.2756, 841.8898)   # pt
+
+def _pdf_text(text: str) -> bytes:
+    """PDF 문자열 리터럴 (표준 글꼴의 WinAnsi 인코딩, ˚ 기호는 deg 로 표기)"""
+    data = text.replace("˚", "deg ").encode("cp1252", errors="replace")
+    return b"(" + data.replace(b"\\", b"\\\\").replace(b"(", b"\\(").replace(b")", b"\\)") + b")"
+
+class PdfReportWriter:
+    """계산서를 PDF 한 페이지씩 바로 파일에 기록
+
+    페이지 내용과 페이지 객체를 만드는 즉시 쓰고, 메모리에는 객체 위치(xref)와 페이지 번호만 남김.
+    페이지 목록(Pages)과 xref 는 close() 에서 파일 끝에 씀. 글꼴은 내장하지 않는 표준 Helvetica
+    """
+    def __init__(self, path: str):
+        self.file = open(path, "wb")
+        self.offsets = {}     # 객체 번호 -> 파일 위치
+        self.pages = []       # 페이지 객체 번호
+        self.next_id = 5      # 1: Catalog, 2: Pages (마지막에 기록), 3, 4: 글꼴
+        self.file.write(b"%PDF-1.4\n%\xe2\xe3\xcf\xd3\n")
+        self._object(1, b"<< /Type /Catalog /Pages 2 0 R >>")
+        self._object(3, b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica /Encoding /WinAnsiEncoding >>")
+        self._object(4, b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica-Bold /Encoding /WinAnsiEncoding >>")
+
+    def _object(self, number: int, body: bytes):
+        self.offsets[number] = self.file.tell()
+        self.file.write(b"%d 0 obj\n" % number + body + b"\nendobj\n")
+
+    def write_sheet(self, record: Dict[str, str]):
+        commands = [b"BT"]
+        y = A4_SIZE[1] - 60
+        for i, template in enumerate(PDF_LINES):
+            commands.append(b"/F2 13 Tf" if i == 0 else b"/F1 10 Tf")
+            commands.append(b"1 0 0 1 50 %.2f Tm " % y + _pdf_text(template.substitute(record)) + b" Tj")
+            y -= 22
+        commands.append(b"ET")
+        content = zlib.compress(b"\n".join(commands))
+        content_id, page_id = self.next_id, self.next_id + 1
+        self.next_id += 2
+        self._object(content_id, b"<< /Length %d /Filter /FlateDecode >>\nstream\n" % len(content)
+                     + content + b"\nendstream")
+        self._object(page_id, b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 %.4f %.4f] " % A4_SIZE
+                     + b"/Resources << /Font << /F1 3 0 R /F2 4 0 R >> >> /Contents %d 0 R >>" % content_id)
+        self.pages.append(page_id)
+
+    def close(self):
+        kids = b" ".join(b"%d 0 R" % page for page in self.pages)
+        self._object(2, b"<< /Type /Pages /Kids [" + kids + b"] /Count %d >>" % len(self.pages))
+        xref = self.file.tell()
+        self.file.write(b"xref\n0 %d\n0000000000 65535 f \n" % self.next_id)
+        for number in range(1, self.next_id):
+            self.file.write(b"%010d 00000 n \n" % self.offsets[number])
+        self.file.write(b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (self.next_id, xref))
+        self.file.close()
+
+WRITERS = {".html": HtmlReportWriter, ".pdf": PdfReportWriter}
+
+def open_writer(path: str):
+    ext = os.path.splitext(path)[1].lower()
+    if ext not in WRITERS:
+        raise ValueError(f"Unsupported report format: {ext} (use .html or .pdf)")
+    return WRITERS[ext](path)
+
+def part_path(path: str, part: int) -> str:
+    stem, ext = os.path.splitext(path)
+    return f"{stem}.part{part:04d}{ext}"
+
+# --- 4. 생성 ---
+_worker_db = None   # 워커 프로세스의 참조 데이터 (init_worker 에서 프로세스마다 한 번 로드)
+
+def init_worker():
+    global _worker_db
+    _worker_db = load_reference_data()
+
+def render_part(path: str, columns: Dict[str, np.ndarray], first_line: int) -> int:
+    """워커 프로세스: 청크 하나를 파일 하나로 기록"""
+    writer = open_writer(path)
+    count = 0
+    try:
+        for record in sheet_records(columns, _worker_db, first_line):
+            writer.write_sheet(record)
+            count += 1
+    finally:
+        writer.close()
+    return count
+
+def write_report(in_path: str, out_path: str, chunk_size: int = REPORT_CHUNK_SIZE, workers: int = 1) -> Dict[str, float]:
+    """라인 리스트 전체의 계산서를 생성하고 (장 수, 파일 수, 소요 시간) 을 반환
+
+    workers == 1: out_path 하나에 순서대로 기록
+    workers > 1: 청크마다 out_path.partNNNN.ext 로 나눠 병렬 기록 (진행 중인 청크는 워커 수의 2배까지)
+    """
+    start = time.perf_counter()
+    sheets = files = 0
+    if workers <= 1:
+        db = load_reference_data()
+        writer = open_writer(out_path)
+        try:
+            first = 1
+            for columns in iter_chunks(in_path, chunk_size):
+                for record in sheet_records(columns, db, first):
+                    writer.write_sheet(record)
+                    sheets += 1
+                first += len(next(iter(columns.values())))
+        finally:
+            writer.close()
+        files = 1
+    else:
+        with ProcessPoolExecutor(workers, initializer=init_worker) as pool:
+            pending = set()
+            first = 1
+            for part, columns in enumerate(iter_chunks(in_path, chunk_size), 1):
+                if len(pending) >= 2 * workers:
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    sheets += sum(f.result() for f in done)
+                pending.add(pool.submit(render_part, part_path(out_path, part), columns, first))
+                first += len(next(iter(columns.values())))
+                files = part
+            sheets += sum(f.result() for f in pending)
+    elapsed = time.perf_counter() - start
+    return {"sheets": sheets, "files": files, "seconds": elapsed}
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Pipe wall thickness calculation sheets")
+    parser.add_argument("input", help="line list (.xlsx, .xls, .csv)")
+    parser.add_argument("output", help="report file (.html or .pdf)")
+    parser.add_argument("--chunk-size", type=int, default=REPORT_CHUNK_SIZE)
+    parser.add_argument("--workers", type=int, default=1)
+    args = parser.parse_args()
+    stats = write_report(args.input, args.output, args.chunk_size, args.workers)
+    print(f"{stats['sheets']} sheets in {stats['files']} file(s), {stats['seconds']:.2f} s "
+          f"({stats['sheets'] / stats['seconds']:,.0f} sheets/s)", file=sys.stderr)
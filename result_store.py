@@ -0,0 +1,133 @@
+"""라인 리스트 두께 계산 결과 저장소 (입력 해시 기반 증분 재계산)
+
+각 행의 키 = sha1(행 입력값 + 참조 재질 데이터 버전)
+입력이나 참조하는 stress_data 행, E/W/Y 조회 표가 바뀐 행만 다시 계산하고 나머지는 SQLite 에서 재사용
+"""
+import sys
+import csv
+import json
+import sqlite3
+import hashlib
+from typing import Dict, Iterable, List, Tuple
+import numpy as np
+
+from thickness import THICKNESS_FIELDS, thickness_from_columns, stress_table
+from reference_data import load_reference_data
+
+STORE_FILE = "thickness_results.sqlite"
+MATERIAL_FIELDS = ["spec", "grade", "temperature"]
+SQL_CHUNK = 500   # SQLite 바인딩 변수 개수 제한 대비
+
+# --- 1. 키 계산 ---
+FACTOR_DATASETS = ["longitu_data", "weld_data", "coefficient_data"]   # E / W / Y 조회 표
+MISSING = ("", "")   # stress_data 에 없는 재질 (Spec 이 빈 행은 stress_table 에 들어가지 않음)
+
+def _digest(value) -> str:
+    return hashlib.sha1(json.dumps(value, ensure_ascii=False).encode("utf-8")).hexdigest()
+
+def material_versions(db) -> Dict[Tuple[str, str], str]:
+    """(Spec, Grade) 별 참조 데이터 버전 (해당 stress_data 행, 블록 헤더와 E/W/Y 조회 표의 해시)
+
+    미등록 재질도 E 는 Spec 으로 조회하므로 MISSING 키에 E/W/Y 조회 표만의 버전을 둠
+    """
+    factors = _digest([db.get(name, []) for name in FACTOR_DATASETS])
+    versions = {key: _digest([rows, factors]) for key, (_, _, rows) in stress_table(db).items()}
+    versions[MISSING] = f"missing:{factors}"
+    return versions
+
+def row_version(row: Dict[str, str], versions: Dict[Tuple[str, str], str]) -> str:
+    """행이 참조하는 재질 데이터 버전 (S, E, W, Y 를 모두 직접 입력한 행은 빈 문자열)"""
+    if all(str(row.get(k, "")).strip() for k in ("stress", "quality", "weld", "coeff")):
+        return ""
+    key = (str(row.get("spec", "")).strip(), str(row.get("grade", "")).strip())
+    return versions.get(key, versions[MISSING])
+
+def row_key(row: Dict[str, str], version: str) -> str:
+    """행 입력값과 참조 재질 버전으로 결과 키 생성"""
+    fields = {k: str(row.get(k, "")).strip() for k in THICKNESS_FIELDS + MATERIAL_FIELDS}
+    payload = json.dumps([fields, version], sort_keys=True, ensure_ascii=False)
+    return hashlib.sha1(payload.encode("utf-8")).hexdigest()
+
+# --- 2. 저장소 ---
+class ResultStore:
+    """key -> 두께 결과를 보관하는 SQLite 저장소 (key 는 PRIMARY KEY, 재질 버전에도 인덱스)"""
+    def __init__(self, path: str = STORE_FILE):
+        self.conn = sqlite3.connect(path)
+        columns = [row[1] for row in self.conn.execute("PRAGMA table_info(results)")]
+        if columns and "version" not in columns:
+            # 재질 버전 열이 없던 이전 형식: 무효화할 수 없으므로 캐시를 비우고 새로 만듦
+            with self.conn:
+                self.conn.execute("DROP TABLE results")
+        self.conn.execute("CREATE TABLE IF NOT EXISTS results ("
+                          "key TEXT PRIMARY KEY, version TEXT, thickness REAL)")
+        self.conn.execute("CREATE INDEX IF NOT EXISTS idx_results_version ON results(version)")
+
+    def get_many(self, keys: Iterable[str]) -> Dict[str, float]:
+        keys = list(keys)
+        found = {}
+        for i in range(0, len(keys), SQL_CHUNK):
+            chunk = keys[i:i + SQL_CHUNK]
+            query = f"SELECT key, thickness FROM results WHERE key IN ({','.join('?' * len(chunk))})"
+            found.update(self.conn.execute(query, chunk))
+        return found
+
+    def put_many(self, items: Iterable[Tuple[str, str, float]]):
+        with self.conn:
+            self.conn.executemany("INSERT OR REPLACE INTO results VALUES (?, ?, ?)", items)
+
+    def invalidate_stale(self, versions: Dict[Tuple[str, str], str]) -> int:
+        """현재 참조 데이터에 없는 재질 버전의 결과를 삭제하고 삭제된 행 수를 반환"""
+        current = set(versions.values()) | {""}
+        with self.conn:
+            self.conn.execute("CREATE TEMP TABLE IF NOT EXISTS current_versions (version TEXT PRIMARY KEY)")
+            self.conn.execute("DELETE FROM current_versions")
+            self.conn.executemany("INSERT INTO current_versions VALUES (?)", ((v,) for v in current))
+            return self.conn.execute("DELETE FROM results WHERE version NOT IN "
+                                     "(SELECT version FROM current_versions)").rowcount
+
+    def close(self):
+        self.conn.close()
+
+# --- 3. 증분 계산 ---
+def _column(rows: List[Dict[str, str]], key: str) -> np.ndarray:
+    """CSV 행 목록에서 숫자 열을 꺼냄 (빈 칸은 nan: S/E/W/Y 는 조회 대상, 나머지는 resolve_inputs 에서 0)"""
+    return np.array([float(r[key]) if str(r.get(key, "")).strip() else np.nan for r in rows])
+
+def compute_rows(rows: List[Dict[str, str]], db) -> np.ndarray:
+    """행 목록의 요구 두께를 한 번에 계산 (S/E/W/Y 가 비어 있으면 spec/grade/temperature 로 조회)"""
+    if not rows:
+        return np.empty(0)
+    columns = {k: _column(rows, k) for k in THICKNESS_FIELDS + ["temperature"]}
+    columns["spec"] = np.array([str(r.get("spec", "")).strip() for r in rows])
+    columns["grade"] = np.array([str(r.get("grade", "")).strip() for r in rows])
+    return thickness_from_columns(columns, db)
+
+def calculate_line_list(rows: List[Dict[str, str]], store: ResultStore, db=None) -> Tuple[np.ndarray, int]:
+    """저장소에 없는 행만 계산하고 (두께 배열, 재사용 행 수) 를 반환"""
+    db = db or load_reference_data()
+    versions = material_versions(db)
+    row_versions = [row_version(r, versions) for r in rows]
+    keys = [row_key(r, v) for r, v in zip(rows, row_versions)]
+    cached = store.get_many(set(keys))
+
+    missing = [i for i, k in enumerate(keys) if k not in cached]
+    computed = compute_rows([rows[i] for i in missing], db)
+    store.put_many((keys[i], row_versions[i], None if np.isnan(t) else float(t))
+                   for i, t in zip(missing, computed))
+
+    thickness = np.array([cached.get(k, np.nan) for k in keys], dtype=float)
+    thickness[missing] = computed
+    return thickness, len(rows) - len(missing)
+
+if __name__ == "__main__":
+    if len(sys.argv) != 2:
+        print("usage: python result_store.py <line_list.csv>")
+        sys.exit(1)
+    with open(sys.argv[1], newline="", encoding="utf-8") as f:
+        line_rows = list(csv.DictReader(f))
+    result_store = ResultStore()
+    thickness, reused = calculate_line_list(line_rows, result_store)
+    result_store.close()
+    for i, t in enumerate(thickness, 1):
+        print(f"{i:>5} {t:10.4f} mm")
+    print(f"{len(line_rows)} rows: {reused} reused, {len(line_rows) - reused} computed")
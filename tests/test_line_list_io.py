@@ -0,0 +1,45 @@
+import numpy as np
+import pytest
+
+pytest.importorskip("pyarrow")
+from line_list_io import LineListWriter, iter_chunks, read_columns, write_columns
+
+@pytest.mark.parametrize("ext", [".arrow", ".parquet"])
+def test_blank_first_chunk_then_text(tmp_path, ext):
+    path = str(tmp_path / f"out{ext}")
+    with LineListWriter(path, ["note", "pressure"]) as writer:
+        writer.write_chunk({"note": np.array([np.nan]), "pressure": np.array([np.nan])})
+        writer.write_chunk({"note": np.array(["hot"]), "pressure": np.array([1.5])})
+    columns, units = read_columns(path)
+    assert columns["note"].tolist() == [None, "hot"]
+    np.testing.assert_array_equal(columns["pressure"], [np.nan, 1.5])
+    assert units["pressure"] == "MPa"
+
+def test_declared_types(tmp_path):
+    path = str(tmp_path / "out.arrow")
+    with LineListWriter(path, ["tag", "flow"], types={"tag": "string", "flow": "float"}) as writer:
+        writer.write_chunk({"tag": np.array([1.0, 2.0]), "flow": np.array(["", "3.5"])})
+    columns, _ = read_columns(path)
+    assert columns["tag"].tolist() == ["1.0", "2.0"]
+    np.testing.assert_array_equal(columns["flow"], [np.nan, 3.5])
+
+def test_text_in_float_column_names_column(tmp_path):
+    with LineListWriter(str(tmp_path / "out.arrow"), ["flow"]) as writer:
+        writer.write_chunk({"flow": np.array([1.0])})
+        with pytest.raises(ValueError, match="flow"):
+            writer.write_chunk({"flow": np.array(["high"])})
+
+def test_arrow_round_trip_keeps_values(tmp_path):
+    columns = {"thickness": np.linspace(0, 1, 5), "line": np.array(list("abcde"))}
+    write_columns(str(tmp_path / "out.parquet"), columns)
+    read, units = read_columns(str(tmp_path / "out.parquet"))
+    np.testing.assert_array_equal(read["thickness"], columns["thickness"])
+    assert read["line"].tolist() == list("abcde")
+    assert units["thickness"] == "mm"
+
+def test_csv_chunks(tmp_path):
+    path = tmp_path / "lines.csv"
+    path.write_text("line,pressure\nA,1\nB,\nC,2.5\n", encoding="utf-8")
+    chunks = list(iter_chunks(str(path), chunk_size=2))
+    assert [len(c["line"]) for c in chunks] == [2, 1]
+    np.testing.assert_array_equal(chunks[0]["pressure"], [1.0, np.nan])
@@ -0,0 +1,40 @@
+import numpy as np
+
+from line_sizing import pipe_size_table, size_lines
+from pressure_drop import pressure_drop
+from reference_data import load_reference_data
+from thickness import required_thickness
+
+DB = load_reference_data()
+
+def size_one(flow, pressure, max_velocity, max_dp, tolerance=0.125):
+    """라인 하나를 NPS 순으로 하나씩 검토 (검증용 반복문)"""
+    nps, od, schedules, wall = pipe_size_table(DB)
+    for i in range(len(od)):
+        t_req = float(required_thickness(pressure, od[i], 138, 1, 1, 0.4, 1.5))
+        passing = [j for j in range(len(schedules)) if wall[i, j] * (1 - tolerance) >= t_req]
+        if not passing:
+            continue
+        j = passing[0]
+        hyd = pressure_drop(flow, "m³/hr", od[i] - 2 * wall[i, j], 100.0, 998.0, 1.0, "mPa·s")
+        if hyd["velocity"] <= max_velocity and hyd["pressure_drop"] <= max_dp:
+            return nps[i], schedules[j]
+    return "", ""
+
+def test_size_lines_equals_loop():
+    rng = np.random.default_rng(0)
+    flow = rng.uniform(0.5, 400, 60)
+    pressure = rng.uniform(0.5, 15, 60)
+    max_velocity = rng.uniform(1, 4, 60)
+    max_dp = rng.uniform(5, 60, 60)
+    result = size_lines(flow, "m³/hr", 998.0, 1.0, "mPa·s", pressure, 138, 1, 1, 0.4, 1.5,
+                        max_velocity, max_dp, db=DB)
+    expected = [size_one(*args) for args in zip(flow, pressure, max_velocity, max_dp)]
+    assert list(zip(result["nps"].tolist(), result["schedule"].tolist())) == expected
+
+def test_governing_constraint():
+    # 낮은 압력, 큰 유량: 유속 제한이 크기를 정함
+    result = size_lines([200.0], "m³/hr", 998.0, 1.0, "mPa·s", 1.0, 138, 1, 1, 0.4, 0.0,
+                        max_velocity=2.0, max_pressure_drop=1e9, db=DB)
+    assert result["governing"][0] == "velocity"
+    assert result["velocity"][0] <= 2.0
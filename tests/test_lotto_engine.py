@@ -0,0 +1,99 @@
+from itertools import combinations
+
+import numpy as np
+import pytest
+
+from lotto_engine import (POOL, PICK, DrawStats, draw, from_masks, load_history, match_histogram, popcount,
+                          simulate, to_masks)
+
+def test_draw_rows_are_valid_and_reproducible():
+    draws = draw(20000, rng=np.random.default_rng(1))
+    assert draws.shape == (20000, PICK) and draws.dtype == np.uint8
+    assert draws.min() >= 1 and draws.max() <= POOL
+    assert (np.diff(draws.astype(int), axis=1) > 0).all()    # 오름차순, 중복 없음
+    np.testing.assert_array_equal(draws, draw(20000, rng=np.random.default_rng(1)))
+
+def test_draw_is_uniform():
+    counts = np.bincount(draw(200000, rng=np.random.default_rng(2)).ravel(), minlength=POOL + 1)[1:]
+    expected = 200000 * PICK / POOL
+    chi2 = ((counts - expected) ** 2 / expected).sum()
+    assert chi2 < 90   # 자유도 44, p ≈ 5e-5
+
+def test_small_pool_covers_every_combination():
+    draws = draw(30000, k=2, pool=4, rng=np.random.default_rng(3))
+    combos, counts = np.unique(draws, axis=0, return_counts=True)
+    assert len(combos) == 6
+    assert counts.min() > 30000 / 6 * 0.9
+
+def test_masks_round_trip_and_popcount():
+    draws = draw(1000, rng=np.random.default_rng(4))
+    masks = to_masks(draws)
+    np.testing.assert_array_equal(from_masks(masks), draws)
+    np.testing.assert_array_equal(popcount(masks), PICK)
+
+@pytest.mark.parametrize("per_ticket", [False, True])
+def test_match_histogram_equals_sets(per_ticket):
+    rng = np.random.default_rng(5)
+    tickets, draws = draw(40, rng=rng), draw(300, rng=rng)
+    expected = np.zeros((len(tickets), PICK + 1), dtype=np.int64)
+    for t, ticket in enumerate(tickets):
+        for row in draws:
+            expected[t, len(set(ticket) & set(row))] += 1
+    result = match_histogram(to_masks(tickets), to_masks(draws), per_ticket=per_ticket)
+    np.testing.assert_array_equal(result, expected if per_ticket else expected.sum(axis=0))
+
+def test_load_history(tmp_path):
+    path = tmp_path / "history.csv"
+    path.write_text("회차,날짜,n1,n2,n3,n4,n5,n6,보너스\n1,2002-12-07,10,23,29,33,37,40,16\n", encoding="utf-8")
+    np.testing.assert_array_equal(from_masks(load_history(str(path), bonus=True)), [[10, 23, 29, 33, 37, 40]])
+
+# --- 시뮬레이션: 워커 수와 무관하게 같은 결과 ---
+def test_simulate_workers_equal_serial():
+    tickets = to_masks([[1, 2, 3, 4, 5, 6], [7, 14, 21, 28, 35, 42]])
+    serial = simulate(50000, seed=7, workers=1, chunk_size=8192, tickets=tickets)
+    parallel = simulate(50000, seed=7, workers=2, chunk_size=8192, tickets=tickets)
+    for key in ("number_counts", "match_counts"):
+        np.testing.assert_array_equal(serial[key], parallel[key])
+    assert serial["number_counts"].sum() == 50000 * PICK
+    assert serial["match_counts"].sum() == 50000 * len(tickets)
+
+def test_simulate_without_draws():
+    result = simulate(0, seed=7, tickets=to_masks([[1, 2, 3, 4, 5, 6]]))
+    np.testing.assert_array_equal(result["match_counts"], np.zeros(PICK + 1))
+    assert result["number_counts"].sum() == 0 and result["draws"] == 0
+
+# --- 누적 통계: 회차별 반복문과 비교 ---
+def brute_force_stats(draws, max_gap, max_streak):
+    counts = np.zeros(POOL, dtype=np.int64)
+    pairs = np.zeros((POOL, POOL), dtype=np.int64)
+    gaps = np.zeros(max_gap + 1, dtype=np.int64)
+    streaks = np.zeros(max_streak + 1, dtype=np.int64)
+    last = {}
+    run = {}
+    for n, row in enumerate(draws):
+        numbers = set(int(v) - 1 for v in row)
+        for a, b in combinations(sorted(numbers), 2):
+            pairs[a, b] += 1
+            pairs[b, a] += 1
+        for v in range(POOL):
+            if v in numbers:
+                counts[v] += 1
+                if v in last:
+                    gaps[min(n - last[v] - 1, max_gap)] += 1
+                last[v] = n
+                run[v] = run.get(v, 0) + 1
+            elif run.get(v):
+                streaks[min(run[v], max_streak)] += 1
+                run[v] = 0
+    return counts, pairs, gaps, streaks
+
+def test_draw_stats_equals_loop():
+    draws = draw(3000, rng=np.random.default_rng(8))
+    stats = DrawStats(max_gap=30, max_streak=5)
+    for start in range(0, len(draws), 700):   # 나눠서 넣어도 한 번에 넣은 것과 같아야 함
+        stats.update(draws[start:start + 700])
+    counts, pairs, gaps, streaks = brute_force_stats(draws, 30, 5)
+    np.testing.assert_array_equal(stats.counts, counts)
+    np.testing.assert_array_equal(stats.pairs, pairs)
+    np.testing.assert_array_equal(stats.gap_hist, gaps)
+    np.testing.assert_array_equal(stats.streak_hist, streaks)
@@ -0,0 +1,53 @@
+from itertools import combinations
+
+import numpy as np
+import scipy.sparse as sp
+
+from near_duplicates import estimate_jaccard, exact_pairs, minhash_signatures, near_duplicate_pairs
+
+def random_sets(seed: int, n_docs: int = 120, n_features: int = 400):
+    """무작위 문서 + 그 일부를 조금씩 바꾼 유사 문서"""
+    rng = np.random.default_rng(seed)
+    docs = [set(rng.choice(n_features, rng.integers(20, 60), replace=False).tolist()) for _ in range(n_docs)]
+    for i in range(0, n_docs, 4):
+        near = set(docs[i])
+        near.discard(min(near))
+        near.add(n_features - 1 - i % 7)
+        docs.append(near)
+    rows = [r for r, doc in enumerate(docs) for _ in doc]
+    cols = [c for doc in docs for c in sorted(doc)]
+    matrix = sp.csr_matrix((np.ones(len(rows), dtype=np.uint8), (rows, cols)), shape=(len(docs), n_features))
+    return docs, matrix
+
+def brute_force(docs, threshold):
+    return {(i, j): len(docs[i] & docs[j]) / len(docs[i] | docs[j])
+            for i, j in combinations(range(len(docs)), 2)
+            if len(docs[i] & docs[j]) / len(docs[i] | docs[j]) >= threshold}
+
+def test_exact_equals_brute_force():
+    docs, matrix = random_sets(0)
+    i, j, jaccard = exact_pairs(matrix, 0.5)
+    expected = brute_force(docs, 0.5)
+    assert set(zip(i.tolist(), j.tolist())) == set(expected)
+    np.testing.assert_allclose(jaccard, [expected[p] for p in zip(i.tolist(), j.tolist())])
+
+def test_minhash_estimate_is_close():
+    docs, matrix = random_sets(1)
+    signatures = minhash_signatures(matrix)
+    pairs = list(brute_force(docs, 0.3))
+    i, j = np.array(pairs).T
+    exact = np.array([len(docs[a] & docs[b]) / len(docs[a] | docs[b]) for a, b in pairs])
+    assert np.abs(estimate_jaccard(signatures, i, j) - exact).max() < 0.2
+
+def test_lsh_finds_planted_duplicates():
+    docs, matrix = random_sets(2)
+    i, j, _ = near_duplicate_pairs(matrix, threshold=0.8)
+    found = set(zip(i.tolist(), j.tolist()))
+    expected = set(brute_force(docs, 0.9))
+    assert len(expected & found) >= 0.9 * len(expected)
+    assert all(i < j for i, j in found)
+
+def test_empty_documents_are_ignored():
+    matrix = sp.csr_matrix((3, 10), dtype=np.uint8)
+    i, j, jaccard = near_duplicate_pairs(matrix)
+    assert len(i) == len(j) == len(jaccard) == 0
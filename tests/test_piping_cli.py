@@ -0,0 +1,68 @@
+import io
+import json
+
+import numpy as np
+import pytest
+
+from piping_cli import convert_record, convert_value, main, run, thickness_record, thickness_value
+from thickness import required_thickness
+from units import UNIT_DATA, convert_array
+
+def run_lines(text, handle, defaults=None):
+    out = io.StringIO()
+    errors = run(io.StringIO(text), handle, defaults or {}, out=out)
+    return errors, [json.loads(line) for line in out.getvalue().splitlines()]
+
+def test_required_thickness_vector_equals_scalar_cli():
+    rng = np.random.default_rng(0)
+    values = [rng.uniform(0.1, 10, 300), rng.uniform(20, 600, 300), rng.uniform(50, 200, 300),
+              rng.uniform(0.6, 1, 300), rng.uniform(0.5, 1, 300), rng.uniform(0, 0.7, 300), rng.uniform(0, 3, 300)]
+    vector = required_thickness(*values)
+    np.testing.assert_allclose(vector, [thickness_value(*row) for row in zip(*values)])
+
+@pytest.mark.parametrize("category", list(UNIT_DATA))
+def test_convert_array_equals_scalar_cli(category):
+    units = list(UNIT_DATA[category])
+    values = np.linspace(-5, 1000, len(units))
+    for in_unit in units:
+        out = convert_array(values, category, in_unit, units[::-1])
+        expected = [convert_value(v, in_unit, u, category) for v, u in zip(values, units[::-1])]
+        np.testing.assert_allclose(out, expected, rtol=1e-12)
+
+# --- NDJSON 입출력 ---
+def test_convert_lines():
+    errors, lines = run_lines('{"value": 100, "from": "Celsius", "to": "Fahrenheit", "tag": "T-1"}\n'
+                              '{"value": 150}\n', convert_record, {"from": "psi", "to": "bar"})
+    assert errors == 0
+    assert lines[0]["tag"] == "T-1" and lines[0]["result"] == pytest.approx(212.0)
+    assert lines[1]["from"] == "psi" and lines[1]["result"] == pytest.approx(150 * 0.0689475729)
+
+def test_thickness_lines():
+    errors, lines = run_lines('{"pressure": 2, "diameter": 168.3, "stress": 138, "quality": 1, "weld": 1, '
+                              '"coeff": 0.4, "corrosion": 1.5}\n'
+                              '{"pressure": 2, "diameter": 168.3, "stress": 0, "quality": 1, "weld": 1, '
+                              '"coeff": 0}\n', thickness_record)
+    assert errors == 0
+    assert lines[0]["thickness"] == pytest.approx(336.6 / 277.6 + 1.5)
+    assert lines[1]["thickness"] is None    # 분모 0 -> nan -> null
+
+def test_bad_lines_write_errors_and_continue():
+    errors, lines = run_lines('not json\n'
+                              '{"value": 1, "from": "psi", "to": "bar"}\n'
+                              '{"value": 1, "from": "psi", "to": "xyz"}\n'
+                              '{"value": 1, "from": "psi"}\n'
+                              '{"value": "abc", "from": "psi", "to": "bar"}\n'
+                              '{"pressure": 2}\n', convert_record)
+    assert errors == 5
+    assert "error" in lines[0]
+    assert lines[1]["result"] == pytest.approx(0.0689475729)
+    assert lines[2] == {"error": "unknown unit: xyz"}
+    assert lines[3] == {"error": "missing 'to'"}
+    assert "error" in lines[4] and "error" in lines[5]
+
+def test_main_reads_stdin(monkeypatch, capsys):
+    monkeypatch.setattr("sys.stdin", io.StringIO('{"value": 0, "from": "Celsius", "to": "Kelvin"}\n\n'))
+    assert main(["convert"]) == 0
+    assert json.loads(capsys.readouterr().out)["result"] == pytest.approx(273.15)
+    assert main(["convert", "--from", "psi", "--to", "qq", "1"]) == 1
+    assert json.loads(capsys.readouterr().out) == {"error": "unknown unit: qq"}
@@ -0,0 +1,51 @@
+import math
+
+import numpy as np
+import pytest
+
+from pressure_drop import colebrook_friction, pressure_drop
+
+def colebrook_reference(re: float, rr: float) -> float:
+    """스칼라 고정점 반복으로 푼 Colebrook 식 (검증용)"""
+    x = 8.0
+    for _ in range(200):
+        x = -2.0 * math.log10(rr / 3.7 + 2.51 * x / re)
+    return 1.0 / x ** 2
+
+@pytest.mark.parametrize("re", [2500, 1e4, 1e5, 1e6, 1e8])
+@pytest.mark.parametrize("rr", [0.0, 1e-5, 1e-3, 0.05])
+def test_colebrook_matches_reference(re, rr):
+    np.testing.assert_allclose(colebrook_friction(re, rr), colebrook_reference(re, rr), rtol=1e-9)
+
+def test_colebrook_moody_value_and_laminar():
+    # Moody 선도: Re = 1e5, ε/D = 1e-4 -> f ≈ 0.0185
+    assert abs(float(colebrook_friction(1e5, 1e-4)) - 0.0185) < 2e-4
+    np.testing.assert_allclose(colebrook_friction([500, 1500], 0.01), [64 / 500, 64 / 1500])
+    assert colebrook_friction(0, 0.01) == 0
+
+def test_colebrook_vector_equals_scalar():
+    rng = np.random.default_rng(0)
+    re = 10 ** rng.uniform(2, 8, 500)
+    rr = rng.uniform(0, 0.02, 500)
+    vector = colebrook_friction(re, rr)
+    scalar = [float(colebrook_friction(r, e)) for r, e in zip(re, rr)]
+    np.testing.assert_allclose(vector, scalar, rtol=1e-12)
+
+def test_pressure_drop_water_line():
+    """물 10 m³/hr, 내경 52.5 mm, 100 m: Darcy-Weisbach 식 직접 계산과 비교"""
+    result = pressure_drop(10, "m³/hr", 52.5, 100, 998.0, 1.0, "mPa·s")
+    d = 52.5e-3
+    v = 10 / 3600 / (math.pi * d ** 2 / 4)
+    re = v * d / (1e-3 / 998.0)
+    f = colebrook_reference(re, 0.045e-3 / d)
+    dp_kpa = f * (100 / d) * 998.0 * v ** 2 / 2 / 1000
+    np.testing.assert_allclose(result["velocity"], v)
+    np.testing.assert_allclose(result["reynolds"], re)
+    np.testing.assert_allclose(result["pressure_drop"], dp_kpa, rtol=1e-9)
+
+def test_pressure_drop_unit_equivalence():
+    volume = pressure_drop(10, "m³/hr", 52.5, 100, 998.0, 1.0, "mPa·s")["pressure_drop"]
+    mass = pressure_drop(9980, "kg/hr", 52.5, 100, 998.0, 1.0, "Centipoise")["pressure_drop"]
+    bar = pressure_drop(10, "m³/hr", 52.5, 100, 998.0, 1.0, "mPa·s", out_unit="bar")["pressure_drop"]
+    np.testing.assert_allclose(mass, volume)
+    np.testing.assert_allclose(bar * 100, volume)
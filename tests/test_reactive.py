@@ -0,0 +1,76 @@
+import math
+
+from reactive import Graph
+
+def parse_number(text):
+    try:
+        return float(text)
+    except (TypeError, ValueError):
+        return math.nan
+
+def diamond():
+    """a, b -> sum, product -> total (total 은 두 경로로 a, b 에 의존)"""
+    graph = Graph()
+    graph.input("a", parse_number, "1")
+    graph.input("b", parse_number, "2")
+    calls = []
+    def node(name, func):
+        def wrapped(*values):
+            calls.append(name)
+            return func(*values)
+        return wrapped
+    graph.computed("sum", node("sum", lambda a, b: a + b), ["a", "b"])
+    graph.computed("product", node("product", lambda a, b: a * b), ["a", "b"])
+    graph.computed("total", node("total", lambda s, p: s + p), ["sum", "product"])
+    calls.clear()
+    return graph, calls
+
+def test_propagates_in_dependency_order():
+    graph, calls = diamond()
+    seen = []
+    graph.subscribe("total", seen.append, call_now=False)
+    assert graph.set("a", "3") == ["a", "sum", "product", "total"]
+    assert calls == ["sum", "product", "total"]
+    assert graph.value("total") == 5 + 6 and seen == [11]
+
+def test_unchanged_values_stop_propagation():
+    graph, calls = diamond()
+    assert graph.set("a", "1.0") == []    # 파싱한 값이 같으면 계산하지 않음
+    assert calls == []
+
+    graph = Graph()
+    graph.input("x", parse_number, "1")
+    graph.computed("sign", lambda x: x > 0, ["x"])
+    graph.computed("label", lambda s: "+" if s else "-", ["sign"])
+    before = graph.recompute_counts()
+    assert graph.set("x", "5") == ["x"]     # sign 은 다시 계산했지만 값이 같음
+    after = graph.recompute_counts()
+    assert (after["sign"] - before["sign"], after["label"] - before["label"]) == (1, 0)
+    assert graph.set("x", "-1") == ["x", "sign", "label"] and graph.value("label") == "-"
+    graph.set("x", "nan")
+    assert graph.set("x", "abc") == []    # nan -> nan 도 같은 값
+
+def test_diamond_recomputes_once_per_set():
+    graph, calls = diamond()
+    before = graph.recompute_counts()
+    graph.set("b", "4")
+    after = graph.recompute_counts()
+    assert {name: after[name] - before[name] for name in after} == {"a": 0, "b": 1, "sum": 1, "product": 1,
+                                                                     "total": 1}
+    assert calls.count("total") == 1
+
+def test_invalidate_recomputes_dependents_once():
+    graph = Graph()
+    table = {"k": 2.0}
+    graph.input("key", None, "k")
+    graph.input("x", parse_number, "3")
+    graph.computed("scaled", lambda key, x: table[key] * x, ["key", "x"])
+    seen = []
+    graph.subscribe("scaled", seen.append, call_now=False)
+    table["k"] = 5.0   # 입력은 그대로, 외부 데이터만 바뀜
+    before = graph.recompute_counts()["scaled"]
+    assert graph.invalidate("key") == ["key", "scaled"]
+    assert graph.recompute_counts()["scaled"] == before + 1
+    assert seen == [15.0]
+    assert graph.invalidate("key") == ["key"]   # 다시 계산해도 값이 같으면 구독자는 호출하지 않음
+    assert seen == [15.0]
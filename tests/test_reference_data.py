@@ -0,0 +1,26 @@
+from reference_data import SearchIndex, diff_datasets, load_reference_data
+
+def test_index_is_prebuilt():
+    db = load_reference_data()
+    index = SearchIndex(db)
+    assert set(index.index) == set(db)
+
+def test_incremental_search_equals_fresh():
+    index = SearchIndex(load_reference_data())
+    within = None
+    for query in ["a", "a1", "a10", "a106", "a106 a"]:
+        within = index.search_all(query, within)
+        assert within == index.search_all(query)
+
+def test_update_rebuilds_only_changed_dataset():
+    db = load_reference_data()
+    index = SearchIndex(db)
+    kept = index.index["stress_data"]
+    index.update("weld_data", db["weld_data"] + [["zzzunique"]])
+    assert index.index["stress_data"] is kept
+    assert index.counts("zzzuni")["weld_data"] == 1
+
+def test_diff_datasets_reports_changed_rows():
+    db = load_reference_data()
+    new = {**db, "weld_data": db["weld_data"] + [["x"]]}
+    assert list(diff_datasets(db, new)) == ["weld_data"]
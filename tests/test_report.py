@@ -0,0 +1,58 @@
+import re
+
+import numpy as np
+import pytest
+
+from reference_data import load_reference_data
+from report import part_path, sheet_records, write_report
+
+HEADER = "line,pressure,diameter,stress,quality,weld,coeff,corrosion,spec,grade,temperature\n"
+ROWS = ["L-1,2,168.3,138,1,1,0.4,1.5,,,\n",
+        "L-2,2,168.3,,,,,,A106,A,200\n",
+        "L-3,1,60.3,,,,,,ZZZ,Q,100\n"]
+
+@pytest.fixture
+def line_list(tmp_path):
+    path = tmp_path / "lines.csv"
+    path.write_text(HEADER + "".join(ROWS * 5), encoding="utf-8")
+    return str(path)
+
+def columns_of(rows):
+    names = HEADER.strip().split(",")
+    cells = [r.strip().split(",") for r in rows]
+    columns = {}
+    for k, name in enumerate(names):
+        values = [c[k] for c in cells]
+        try:
+            columns[name] = np.array([float(v) if v else np.nan for v in values])
+        except ValueError:
+            columns[name] = np.array(values)
+    return columns
+
+def test_sources_and_blank_corrosion():
+    records = list(sheet_records(columns_of(ROWS), load_reference_data()))
+    assert records[0]["S_source"] == "input" and records[0]["tm"] != "-"
+    looked_up = records[1]
+    assert looked_up["S_source"].startswith("Table A-1,")
+    assert (looked_up["E"], looked_up["W"], looked_up["Y"]) == ("1", "1", "0.4")
+    assert looked_up["Y_source"].startswith("Table 304.1.1")
+    assert looked_up["C"] == "0" and looked_up["tm"] != "-"
+    assert records[2]["E_source"] == "blank (0)" and records[2]["S_source"] == "-"
+
+def test_pdf_is_streamed_with_valid_xref(line_list, tmp_path):
+    out = str(tmp_path / "report.pdf")
+    assert write_report(line_list, out)["sheets"] == 15
+    data = open(out, "rb").read()
+    xref = int(re.search(rb"startxref\n(\d+)", data).group(1))
+    table = data[xref:].split(b"trailer")[0].split(b"\n")[3:-1]
+    for number, entry in enumerate(table, 1):
+        offset = int(entry[:10])
+        assert data[offset:].startswith(b"%d 0 obj" % number)
+    assert b"/Count 15" in data
+
+def test_workers_write_parts(line_list, tmp_path):
+    out = str(tmp_path / "report.html")
+    stats = write_report(line_list, out, chunk_size=6, workers=2)
+    assert (stats["sheets"], stats["files"]) == (15, 3)
+    text = open(part_path(out, 2), encoding="utf-8").read()
+    assert text.count('class="sheet"') == 6 and "Table 302.3.5" in text
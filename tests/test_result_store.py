@@ -0,0 +1,72 @@
+import numpy as np
+import pytest
+
+from reference_data import load_reference_data
+from result_store import ResultStore, calculate_line_list, compute_rows, material_versions
+from thickness import required_thickness, thickness_from_columns
+
+@pytest.fixture(scope="module")
+def db():
+    return load_reference_data()
+
+ROW = {"pressure": "2", "diameter": "168.3", "stress": "138", "quality": "1", "weld": "1", "coeff": "0.4",
+       "corrosion": "1.5", "spec": "", "grade": "", "temperature": ""}
+
+@pytest.mark.parametrize("blank", ["coeff", "weld", "corrosion", "quality"])
+def test_blank_cells_count_as_zero(db, blank):
+    """위젯의 float(text or 0) 과 같은 값"""
+    row = {**ROW, blank: ""}
+    values = {k: float(row[k] or 0) for k in ["pressure", "diameter", "stress", "quality", "weld", "coeff",
+                                              "corrosion"]}
+    np.testing.assert_allclose(compute_rows([row], db), required_thickness(**values))
+
+def test_blank_temperature_looks_up_lowest_column(db):
+    row = {**ROW, "stress": "", "spec": "A53", "grade": "B", "temperature": ""}
+    np.testing.assert_allclose(compute_rows([row], db), compute_rows([{**row, "temperature": "0"}], db))
+    assert not np.isnan(compute_rows([row], db)).any()
+
+def test_line_list_columns_blank_as_zero(db):
+    columns = {k: np.array([float(v) if v else np.nan]) for k, v in ROW.items() if k not in ("spec", "grade")}
+    columns["coeff"] = np.array([np.nan])
+    expected = required_thickness(2, 168.3, 138, 1, 1, 0, 1.5)
+    np.testing.assert_allclose(thickness_from_columns(columns, db), expected)
+
+def test_store_reuses_rows(db, tmp_path):
+    store = ResultStore(str(tmp_path / "store.sqlite"))
+    rows = [ROW, {**ROW, "pressure": "3"}]
+    first, reused = calculate_line_list(rows, store, db)
+    assert reused == 0
+    second, reused = calculate_line_list(rows + [{**ROW, "coeff": ""}], store, db)
+    assert reused == 2
+    np.testing.assert_allclose(second[:2], first)
+    store.close()
+
+def test_store_migrates_old_schema(db, tmp_path):
+    """version 열이 없던 (key, thickness) 형식의 파일도 열 수 있음"""
+    import sqlite3
+    path = str(tmp_path / "old.sqlite")
+    conn = sqlite3.connect(path)
+    conn.execute("CREATE TABLE results (key TEXT PRIMARY KEY, thickness REAL)")
+    conn.execute("INSERT INTO results VALUES ('x', 1.0)")
+    conn.commit()
+    conn.close()
+    store = ResultStore(path)
+    thickness, reused = calculate_line_list([ROW], store, db)
+    assert reused == 0 and store.get_many(["x"]) == {}
+    assert calculate_line_list([ROW], store, db)[1] == 1
+    store.close()
+
+def test_factor_table_edit_recomputes(db, tmp_path):
+    """E/W/Y 조회 표가 바뀌면 해당 표를 쓴 행만 다시 계산"""
+    import copy
+    store = ResultStore(str(tmp_path / "store.sqlite"))
+    looked_up = {**ROW, "coeff": "", "spec": "A53", "grade": "B", "temperature": "200"}
+    rows = [ROW, looked_up]
+    first, _ = calculate_line_list(rows, store, db)
+    edited = copy.deepcopy(db)
+    edited["coefficient_data"][2][1] = "0.5"   # Ferritic Steel, ≤482˚C
+    assert store.invalidate_stale(material_versions(edited)) == 1
+    second, reused = calculate_line_list(rows, store, edited)
+    assert reused == 1
+    np.testing.assert_allclose(second, [first[0], required_thickness(2, 168.3, 138, 1, 1, 0.5, 1.5)])
+    store.close()
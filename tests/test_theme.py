@@ -0,0 +1,38 @@
+import os
+
+import pytest
+
+pytest.importorskip("PySide6")
+qdarktheme = pytest.importorskip("qdarktheme")
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+from PySide6.QtGui import QPalette
+from PySide6.QtWidgets import QApplication, QStyle
+
+from theme import APP_QSS, SETUP_STYLE_PROPERTY, URL_RE, apply_theme, palette_to_dict
+
+def snapshot(app):
+    """팔레트, 아이콘 경로를 파일 이름으로 바꾼 스타일시트, 검색창 지우기 버튼 아이콘 (프록시 스타일이 그림)"""
+    qss = URL_RE.sub(lambda m: f"url({os.path.basename(m.group(1))})", app.styleSheet())
+    icon = app.style().standardIcon(QStyle.StandardPixmap.SP_LineEditClearButton).pixmap(16).toImage()
+    return palette_to_dict(app.palette()), qss, icon
+
+def reset(app):
+    app.setStyleSheet("")
+    app.setPalette(QPalette())
+    app.setStyle("Fusion")
+    app.setProperty(SETUP_STYLE_PROPERTY, None)
+
+def test_apply_theme_matches_setup_theme(tmp_path):
+    app = QApplication.instance() or QApplication([])
+    results = []
+    for cache_hit in (False, True):
+        reset(app)
+        assert apply_theme(app, "dark", str(tmp_path))["cache_hit"] == cache_hit
+        results.append(snapshot(app))
+    reset(app)
+    qdarktheme.setup_theme("dark", additional_qss=APP_QSS)
+    expected = snapshot(app)
+    for palette, qss, icon in results:
+        assert palette == expected[0]
+        assert qss == expected[1]
+        assert icon == expected[2]
@@ -0,0 +1,33 @@
+import numpy as np
+
+from reference_data import load_reference_data
+from thermal import REFERENCE_TEMP, expansion_table, mean_coefficient, thermal_expansion
+
+DB = load_reference_data()
+CS = list(expansion_table(DB))[0]
+
+def test_known_value():
+    """탄소강 100 m, 20 -> 200˚C: α(200) = 12.7e-6 -> 100000 * 12.7e-6 * 180 = 228.6 mm"""
+    result = thermal_expansion(100, 20, 200, CS, DB)
+    np.testing.assert_allclose(result["delta"], 228.6)
+
+def test_fahrenheit_and_length_units():
+    celsius = thermal_expansion(100, 20, 200, CS, DB)["delta"]
+    np.testing.assert_allclose(thermal_expansion(100, 68, 392, CS, DB, "Fahrenheit")["delta"], celsius)
+    np.testing.assert_allclose(thermal_expansion(100000, 20, 200, CS, DB, length_unit="mm")["delta"], celsius)
+
+def test_vector_equals_scalar_loop():
+    rng = np.random.default_rng(0)
+    materials = np.array(list(expansion_table(DB)))[rng.integers(0, 3, 200)]
+    t1, t2 = rng.uniform(-20, 50, 200), rng.uniform(50, 400, 200)
+    length = rng.uniform(1, 200, 200)
+    table = expansion_table(DB)
+    vector = thermal_expansion(length, t1, t2, materials, DB, table=table)["delta"]
+    scalar = [thermal_expansion(L, a, b, m, DB)["delta"][0] for L, a, b, m in zip(length, t1, t2, materials)]
+    np.testing.assert_allclose(vector, scalar)
+
+def test_reference_temperature_and_range():
+    table = expansion_table(DB)
+    np.testing.assert_allclose(thermal_expansion(10, REFERENCE_TEMP, REFERENCE_TEMP, CS, DB)["delta"], 0)
+    assert np.isnan(mean_coefficient(table, CS, 5000)).all()
+    assert np.isnan(mean_coefficient(table, "unobtainium", 100)).all()
@@ -0,0 +1,44 @@
+import numpy as np
+import pytest
+
+from reference_data import load_reference_data
+from thickness import allowable_stress, required_thickness
+
+DB = load_reference_data()
+
+def test_required_thickness_known_value():
+    # t = P·D / 2(SEW + PY) = 2 × 168.3 / 2(138 + 0.8) = 1.21254 mm, + C 1.5
+    np.testing.assert_allclose(required_thickness(2, 168.3, 138, 1, 1, 0.4, 1.5), 336.6 / 277.6 + 1.5)
+    assert np.isnan(required_thickness(2, 168.3, 0, 1, 1, 0, 0))
+
+def test_allowable_stress_table_values():
+    # A53 B: 40˚C 138, 300˚C 126, 325˚C 122 MPa (Table A-1)
+    np.testing.assert_allclose(allowable_stress(DB, "A53", "B", 40), 138)
+    np.testing.assert_allclose(allowable_stress(DB, "A53", "B", 312.5), 124)
+    np.testing.assert_allclose(allowable_stress(DB, ["A53", "A312"], ["B", "TP316L"], [300, 40]), [126, 115])
+    assert np.isnan(allowable_stress(DB, "A53", "B", 900)).all()
+    assert np.isnan(allowable_stress(DB, "X", "Y", 40)).all()
+
+def test_blank_factors_same_in_every_path(tmp_path):
+    """S/E/W/Y 가 빈 라인: 계산서, 스트리밍 CLI, 결과 저장소가 같은 두께"""
+    pytest.importorskip("pyarrow")
+    from line_list_io import read_columns, stream_thickness
+    from report import sheet_records
+    from result_store import ResultStore, calculate_line_list
+
+    row = {"line": "L-1", "pressure": "2", "diameter": "168.3", "stress": "", "quality": "", "weld": "",
+           "coeff": "", "corrosion": "1.5", "spec": "A53", "grade": "B", "temperature": "200"}
+    path = tmp_path / "lines.csv"
+    path.write_text(",".join(row) + "\n" + ",".join(row.values()) + "\n", encoding="utf-8")
+    # S 138 MPa (Table A-1), E 1 (Seamless), W 1, Y 0.4 (Ferritic, ≤482˚C)
+    expected = required_thickness(2, 168.3, 138, 1, 1, 0.4, 1.5)
+
+    stream_thickness(str(path), str(tmp_path / "out.arrow"), db=DB)
+    np.testing.assert_allclose(read_columns(str(tmp_path / "out.arrow"))[0]["thickness"], expected)
+    store = ResultStore(str(tmp_path / "store.sqlite"))
+    np.testing.assert_allclose(calculate_line_list([row], store, DB)[0], expected)
+    store.close()
+    columns = {k: np.array([v]) for k, v in row.items()}
+    columns.update({k: np.array([float(v) if v else np.nan]) for k, v in row.items()
+                    if k not in ("line", "spec", "grade")})
+    assert next(sheet_records(columns, DB))["tm"] == f"{float(expected):.6g}"
@@ -0,0 +1,60 @@
+import numpy as np
+import pytest
+
+from piping_cli import convert_value
+from units import (TEMPERATURE_CATEGORY, TEMPERATURE_DATA, UNIT_DATA, convert_temperature, convert_to_all,
+                   format_values, is_bulk_text, parse_pasted_values, unit_vectors)
+
+# --- 모든 단위로 변환 ---
+@pytest.mark.parametrize("category", [*UNIT_DATA, TEMPERATURE_CATEGORY])
+def test_convert_to_all_equals_scalar(category):
+    names, _, _ = unit_vectors(category)
+    for in_unit in names:
+        for value in (-40.0, 0.0, 1.0, 123.456):
+            expected = [convert_value(value, in_unit, out_unit, category) for out_unit in names]
+            np.testing.assert_allclose(convert_to_all(value, category, in_unit), expected, rtol=1e-12, atol=1e-12)
+
+def test_temperature_offsets():
+    """배율이 아닌 1차식 변환: 손으로 계산한 값과 비교"""
+    names, _, _ = unit_vectors(TEMPERATURE_CATEGORY)
+    result = dict(zip(names, convert_to_all(100.0, TEMPERATURE_CATEGORY, "Celsius")))
+    assert result == pytest.approx({"Celsius": 100.0, "Fahrenheit": 212.0, "Kelvin": 373.15})
+    result = dict(zip(names, convert_to_all(-40.0, TEMPERATURE_CATEGORY, "Fahrenheit")))
+    assert result == pytest.approx({"Celsius": -40.0, "Fahrenheit": -40.0, "Kelvin": 233.15})
+    result = dict(zip(names, convert_to_all(0.0, TEMPERATURE_CATEGORY, "Kelvin")))
+    assert result == pytest.approx({"Celsius": -273.15, "Fahrenheit": -459.67, "Kelvin": 0.0})
+
+def test_temperature_round_trip():
+    units = list(TEMPERATURE_DATA)
+    np.testing.assert_allclose(convert_temperature([100.0], "Celsius", "Fahrenheit"), [212.0])
+    values = np.linspace(-40, 500, len(units))
+    back = convert_temperature(convert_temperature(values, units, "Kelvin"), "Kelvin", units)
+    np.testing.assert_allclose(back, values)
+
+# --- 붙여넣기 텍스트 ---
+def test_is_bulk_text():
+    assert is_bulk_text("1\n2") and is_bulk_text("1\t2") and is_bulk_text("1\r\n2\r\n")
+    assert not is_bulk_text("1,234.5") and not is_bulk_text("12\n") and not is_bulk_text("")
+
+def test_newline_column():
+    np.testing.assert_array_equal(parse_pasted_values("1\n2.5\r\n-3e2\r\n"), [[1], [2.5], [-300]])
+    np.testing.assert_array_equal(parse_pasted_values("1\r2"), [[1], [2]])   # 구형 맥 줄바꿈
+
+def test_tab_table_pads_short_rows():
+    values = parse_pasted_values("1\t2\t3\n4\t5\n")
+    np.testing.assert_array_equal(values, [[1, 2, 3], [4, 5, np.nan]])
+
+def test_comma_is_thousands_separator():
+    np.testing.assert_array_equal(parse_pasted_values("1,234.5\n12,000"), [[1234.5], [12000]])
+    np.testing.assert_array_equal(parse_pasted_values("1,000\t2,500,000"), [[1000, 2500000]])
+
+def test_blank_and_unparseable_cells_are_nan():
+    values = parse_pasted_values("1\t\t3\n\tabc\t 6 \nN/A\t7\t")
+    np.testing.assert_array_equal(values, [[1, np.nan, 3], [np.nan, np.nan, 6], [np.nan, 7, np.nan]])
+    np.testing.assert_array_equal(parse_pasted_values("1\n\n3"), [[1], [np.nan], [3]])
+
+def test_format_values_round_trip():
+    values = np.array([[1.0, np.nan], [1 / 3, -2.5e-12]])
+    assert format_values(values) == "1\t\n0.33333333333\t-2.5e-12"
+    np.testing.assert_allclose(parse_pasted_values(format_values(values)), values, rtol=1e-10)   # 유효 숫자 11자리
+    assert format_values(np.array([7.0])) == "7"
@@ -0,0 +1,142 @@
+import numpy as np
+import pytest
+import scipy.sparse as sp
+
+from example_code import (VocabularyCache, comparison_test, comparison_vectors, make_vectorizer, parallel_vectors,
+                          read_blocks, stream_vectors, write_blocks)
+
+WORDS = [f"w{i:03d}" for i in range(200)]
+
+def random_corpus(seed: int, n_docs: int = 300):
+    rng = np.random.default_rng(seed)
+    return [" ".join(rng.choice(WORDS, rng.integers(0, 15))) for _ in range(n_docs)]
+
+# --- 희소/비트 출력 == 밀집 출력 ---
+@pytest.mark.parametrize("max_features", [5, 8, 20, 200])
+def test_sparse_and_packed_equal_dense(max_features):
+    text = random_corpus(20, 60) + ["", "w000"]   # 빈 문서 포함
+    dense = make_vectorizer(True, max_features).fit_transform(text).toarray()   # 기존 comparison_test 의 계산
+    if max_features == 20:
+        np.testing.assert_array_equal(comparison_test(text), dense)
+    csr = comparison_vectors(text, max_features=max_features)
+    assert sp.issparse(csr) and csr.dtype == np.uint8
+    np.testing.assert_array_equal(csr.toarray(), dense)
+    packed = comparison_vectors(text, output="packed", max_features=max_features)
+    assert packed.shape == (len(text), (dense.shape[1] + 7) // 8)
+    np.testing.assert_array_equal(np.unpackbits(packed, axis=1, count=dense.shape[1]), dense)
+
+def test_counts_equal_dense():
+    text = random_corpus(21, 60)
+    dense = make_vectorizer(False).fit_transform(text).toarray()
+    np.testing.assert_array_equal(comparison_vectors(text, binary=False).toarray(), dense)
+    np.testing.assert_array_equal(comparison_vectors(text, output="dense", binary=False), dense)
+    with pytest.raises(ValueError):
+        comparison_vectors(text, output="packed", binary=False)
+
+# --- 스트리밍 ---
+@pytest.mark.parametrize("sample_size", [0, 50])
+def test_stream_generator_keeps_sample_documents(sample_size):
+    text = random_corpus(10)
+    from_list = sp.vstack(list(stream_vectors(text, batch_size=64, sample_size=sample_size)))
+    from_generator = sp.vstack(list(stream_vectors((doc for doc in text), batch_size=64, sample_size=sample_size)))
+    assert from_generator.shape[0] == len(text)
+    assert (from_list != from_generator).nnz == 0
+
+def test_stream_sample_vocabulary_matches_fit():
+    text = random_corpus(11)
+    streamed = sp.vstack(list(stream_vectors(iter(text), batch_size=70, sample_size=len(text))))
+    assert (streamed != comparison_vectors(text)).nnz == 0
+
+def test_write_blocks_replaces_previous_run(tmp_path):
+    text = random_corpus(12)
+    write_blocks(stream_vectors(text, batch_size=30), str(tmp_path))
+    stats = write_blocks(stream_vectors(text[:100], batch_size=30), str(tmp_path))
+    blocks = list(read_blocks(str(tmp_path)))
+    assert len(blocks) == stats["blocks"] == 4
+    assert sum(block.shape[0] for block in blocks) == 100
+
+# --- 병렬 == 직렬 ---
+@pytest.mark.parametrize("seed", range(10))
+@pytest.mark.parametrize("max_features", [5, 20, 50])
+def test_parallel_equals_serial(seed, max_features):
+    text = random_corpus(seed)
+    serial = comparison_vectors(text, max_features=max_features)
+    parallel = parallel_vectors(text, workers=1, chunk_size=100, max_features=max_features)
+    assert serial.shape == parallel.shape
+    assert (serial != parallel).nnz == 0
+
+@pytest.mark.parametrize("output", ["dense", "packed"])
+def test_parallel_outputs(output):
+    text = random_corpus(1)
+    expected = comparison_vectors(text, output, max_features=20)
+    np.testing.assert_array_equal(parallel_vectors(text, workers=1, chunk_size=70, output=output, max_features=20),
+                                  expected)
+
+def test_parallel_vocabulary_matches_fit():
+    text = random_corpus(2)
+    vocabulary = make_vectorizer(True, 20, np.uint8).fit(text).vocabulary_
+    columns = parallel_vectors(text, workers=1, chunk_size=100, max_features=20).sum(axis=0)
+    expected = comparison_vectors(text, max_features=20).sum(axis=0)
+    assert len(vocabulary) == columns.shape[1]
+    np.testing.assert_array_equal(columns, expected)
+
+def test_parallel_process_pool():
+    text = random_corpus(3)
+    serial = comparison_vectors(text, max_features=50)
+    assert (serial != parallel_vectors(text, workers=2, chunk_size=100, max_features=50)).nnz == 0
+
+# --- 빈 청크 (기본 token_pattern 은 두 글자 이상만 단어로 봄) ---
+def test_chunk_without_terms():
+    text = ["", "a b", "x"] * 40 + random_corpus(4, 100)
+    serial = comparison_vectors(text, max_features=20)
+    parallel = parallel_vectors(text, workers=1, chunk_size=60, max_features=20)
+    assert (serial != parallel).nnz == 0
+
+def test_no_terms_raises_like_serial():
+    text = ["a b", ""] * 10
+    with pytest.raises(ValueError):
+        comparison_vectors(text)
+    with pytest.raises(ValueError):
+        parallel_vectors(text, workers=1, chunk_size=5)
+
+# --- 어휘 캐시 (적중 / 추가 / 처음) == 새로 fit ---
+@pytest.fixture
+def cache(tmp_path):
+    cache = VocabularyCache(str(tmp_path / "vocab.sqlite"))
+    yield cache
+    cache.close()
+
+def fresh_vocabulary(text, max_features):
+    return make_vectorizer(True, max_features, np.uint8).fit(text).vocabulary_
+
+@pytest.mark.parametrize("max_features", [5, 20, 50])
+def test_cache_miss_hit_append(cache, max_features):
+    text = random_corpus(5)
+    assert cache.vocabulary(text, max_features=max_features) == fresh_vocabulary(text, max_features)
+    assert cache.last_status == "miss"
+    assert cache.vocabulary(text, max_features=max_features) == fresh_vocabulary(text, max_features)
+    assert cache.last_status == "hit"
+    longer = text + random_corpus(6, 50)
+    assert cache.vocabulary(longer, max_features=max_features) == fresh_vocabulary(longer, max_features)
+    assert cache.last_status == "append"
+
+@pytest.mark.parametrize("max_features", [5, 20, 50])
+def test_cache_vectors_equal_fresh_fit(cache, max_features):
+    text = random_corpus(7)
+    longer = text + random_corpus(8, 40)
+    for corpus in (text, text, longer):
+        for output in ("csr", "dense"):
+            expected = comparison_vectors(corpus, output, max_features=max_features)
+            cached = comparison_vectors(corpus, output, max_features=max_features, cache=cache)
+            if output == "csr":
+                assert (expected != cached).nnz == 0
+            else:
+                np.testing.assert_array_equal(expected, cached)
+
+def test_cache_append_without_terms(cache):
+    text = random_corpus(9)
+    cache.vocabulary(text)
+    longer = text + ["a"]
+    assert cache.vocabulary(longer) == fresh_vocabulary(longer, 20)
+    assert cache.last_status == "append"
+    assert (comparison_vectors(longer, cache=cache) != comparison_vectors(longer)).nnz == 0
@@ -0,0 +1,175 @@
+"""애플리케이션 테마 (Qt 스타일시트 한 벌 + qdarktheme 결과 디스크 캐시)
+
+위젯마다 setStyleSheet 를 호출하면 Qt 가 위젯별로 스타일시트를 다시 파싱/폴리시하므로,
+위젯에는 objectName 과 동적 속성(card, role)만 지정하고 스타일은 APP_QSS 한 곳에서 관리
+"""
+import os
+import re
+import sys
+import json
+import time
+import shutil
+from typing import Dict, Optional, Tuple
+from importlib import metadata
+
+from PySide6.QtGui import QColor, QPalette
+
+CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "piping_tool")
+BUNDLED_CACHE_DIR = "theme_cache"  # 패키징된 실행 파일 안에 미리 만들어 넣는 캐시 폴더
+ICON_DIR_TOKEN = "%ICON_DIR%"      # 캐시된 스타일시트 안의 아이콘 폴더 자리 (로드 시 실제 경로로 치환)
+URL_RE = re.compile(r'url\(["\']?([^)"\']+)["\']?\)')
+CACHE_FORMAT = 3                   # 캐시 내용이 바뀌면 올림 (이전 캐시 파일은 무시됨)
+SETUP_STYLE_PROPERTY = "_qdarktheme_use_setup_style"  # qdarktheme.setup_theme 이 앱에 표시하는 속성
+
+# --- 1. 앱 전체 스타일시트 (기존 위젯별 스타일을 선택자로 옮김) ---
+APP_QSS = """
+QFrame[card="true"] {
+    background-color: transparent;
+    border-radius: 10px;
+    border: 1px solid #dee2e6;
+}
+QFrame[card="true"] QLabel { border: none; }
+QFrame[card="true"] QLineEdit { border: 1px solid #ced4da; border-radius: 4px; padding: 2px; }
+QFrame[card="true"] QComboBox { border: 1px solid #ced4da; border-radius: 4px; }
+QFrame#thicknessInput QLineEdit { padding: 5px; }
+QFrame#thicknessResult {
+    background-color: transparent;
+    border-radius: 5px;
+    border: 1px solid #e9ecef;
+}
+
+QLabel[role="result"] { font-weight: bold; color: #d35400; font-size: 11pt; border: none; }
+QLabel#thicknessValue { font-size: 12pt; }
+QLabel[role="title"] { font-size: 13pt; font-weight: bold; color: #d35400; margin-bottom: 10px; }
+QLabel[role="strong"] { font-weight: bold; border: none; }
+QLabel[role="muted"] { color: #95a5a6; border: none; }
+
+QTableView#referenceTable {
+    gridline-color: #ecf0f1;
+    background-color: transparent;
+    alternate-background-color: transparent;
+}
+QTableView#referenceTable QHeaderView::section {
+    background-color: #34495e;
+    color: white;
+    padding: 5px;
+    font-weight: bold;
+}
+"""
+
+# --- 2. qdarktheme 스타일시트/팔레트 캐시 ---
+PALETTE_GROUPS = [QPalette.ColorGroup.Active, QPalette.ColorGroup.Inactive, QPalette.ColorGroup.Disabled]
+PALETTE_ROLES = [role for role in QPalette.ColorRole if role != QPalette.ColorRole.NColorRoles]
+
+def cache_path(theme: str, cache_dir: str = CACHE_DIR) -> str:
+    """qdarktheme 버전과 캐시 형식별 캐시 파일 경로 (둘 중 하나가 바뀌면 새로 생성)"""
+    try:
+        version = metadata.version("pyqtdarktheme")
+    except metadata.PackageNotFoundError:
+        version = "unknown"
+    return os.path.join(cache_dir, f"qdarktheme-{version}-{theme}-v{CACHE_FORMAT}.json")
+
+def palette_to_dict(palette: QPalette) -> Dict[str, Dict[str, str]]:
+    return {group.name: {role.name: palette.color(group, role).name(QColor.NameFormat.HexArgb)
+                         for role in PALETTE_ROLES}
+            for group in PALETTE_GROUPS}
+
+def palette_from_dict(colors: Dict[str, Dict[str, str]]) -> QPalette:
+    palette = QPalette()
+    for group in PALETTE_GROUPS:
+        for role in PALETTE_ROLES:
+            if role.name in colors.get(group.name, {}):
+                palette.setColor(group, role, QColor(colors[group.name][role.name]))
+    return palette
+
+def default_cache_dir() -> str:
+    """패키징된 실행 파일이면 번들 캐시, 아니면 사용자 캐시 폴더"""
+    bundled = os.path.join(getattr(sys, "_MEIPASS", ""), BUNDLED_CACHE_DIR)
+    if getattr(sys, "frozen", False) and os.path.isdir(bundled):
+        return bundled
+    return CACHE_DIR
+
+def relocate_icons(qss: str, cache_dir: str) -> str:
+    """qdarktheme 가 ~/.cache/qdarktheme 에 만든 아이콘을 캐시 폴더로 복사하고 경로를 토큰으로 바꿈
+
+    캐시(또는 번들) 폴더를 통째로 옮겨도 아이콘 경로가 깨지지 않도록 함
+    """
+    icon_dir = os.path.join(cache_dir, "icons")
+    os.makedirs(icon_dir, exist_ok=True)
+
+    def replace(match):
+        src = match.group(1)
+        if not os.path.isfile(src):
+            return match.group(0)
+        name = os.path.basename(src)
+        shutil.copyfile(src, os.path.join(icon_dir, name))
+        return f"url({ICON_DIR_TOKEN}/{name})"
+    return URL_RE.sub(replace, qss)
+
+def compile_theme(theme: str) -> Tuple[str, Optional[Dict[str, Dict[str, str]]]]:
+    """qdarktheme 로 스타일시트와 팔레트를 생성 (캐시가 없을 때만 qdarktheme 를 import)"""
+    import qdarktheme
+    from PySide6.QtCore import QCoreApplication
+    app = QCoreApplication.instance()
+    if app is not None: # setup_theme 과 같이 표준 아이콘은 스타일시트 대신 프록시 스타일이 그림
+        app.setProperty(SETUP_STYLE_PROPERTY, True)
+    qss = qdarktheme.load_stylesheet(theme)
+    try:
+        palette = palette_to_dict(qdarktheme.load_palette(theme, for_stylesheet=True)) # setup_theme 과 같은 팔레트
+    except AttributeError: # 팔레트 API 가 없는 구버전
+        palette = None
+    return qss, palette
+
+def with_icon_dir(qss: str, cache_dir: str) -> str:
+    icon_dir = os.path.abspath(os.path.join(cache_dir, "icons")).replace(os.sep, "/")
+    return qss.replace(ICON_DIR_TOKEN, icon_dir)
+
+def build_theme_cache(theme: str = "dark", cache_dir: str = CACHE_DIR) -> str:
+    """스타일시트/팔레트/아이콘을 cache_dir 에 미리 만들어 두고 캐시 파일 경로를 반환 (패키징용)"""
+    qss, palette = compile_theme(theme)
+    os.makedirs(cache_dir, exist_ok=True)
+    qss = relocate_icons(qss, cache_dir)
+    path = cache_path(theme, cache_dir)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump({"qss": qss, "palette": palette}, f)
+    return path
+
+def load_theme(theme: str = "dark", cache_dir: str = None) -> Tuple[str, Optional[dict], bool]:
+    """(스타일시트, 팔레트, 캐시 사용 여부) - 캐시가 없거나 깨졌으면 새로 만들어 저장"""
+    cache_dir = cache_dir or default_cache_dir()
+    path = cache_path(theme, cache_dir)
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            cached = json.load(f)
+        return with_icon_dir(cached["qss"], cache_dir), cached["palette"], True
+    except (OSError, ValueError, KeyError):
+        pass
+
+    try:
+        build_theme_cache(theme, cache_dir)
+    except OSError:
+        qss, palette = compile_theme(theme) # 캐시는 선택 사항 (읽기 전용 환경 등)
+        return qss, palette, False
+    with open(path, "r", encoding="utf-8") as f:
+        cached = json.load(f)
+    return with_icon_dir(cached["qss"], cache_dir), cached["palette"], False
+
+# --- 3. 적용 ---
+def apply_theme(app, theme: str = "dark", cache_dir: str = None) -> Dict[str, float]:
+    """qdarktheme.setup_theme 과 같이 스타일시트, 팔레트, 프록시 스타일을 적용하고 소요 시간을 반환
+
+    프록시 스타일(QDarkThemeStyle)은 표준 아이콘(검색창 지우기 버튼 등)을 테마 색의 SVG 로 바꿈
+    """
+    start = time.perf_counter()
+    app.setProperty(SETUP_STYLE_PROPERTY, True)
+    qss, palette, cache_hit = load_theme(theme, cache_dir)
+    loaded = time.perf_counter()
+    from qdarktheme._proxy_style import QDarkThemeStyle # qdarktheme 의 Qt 호환 모듈 import 가 대부분의 적용 시간
+    app.setStyleSheet(qss + APP_QSS)
+    if palette:
+        app.setPalette(palette_from_dict(palette))
+    if not isinstance(app.style(), QDarkThemeStyle):
+        app.setStyle(QDarkThemeStyle())
+    return {"cache_hit": cache_hit,
+            "load_ms": (loaded - start) * 1000,
+            "apply_ms": (time.perf_counter() - loaded) * 1000}
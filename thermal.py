@@ -0,0 +1,67 @@
+"""배관 열팽창량 계산 (스칼라/배열 공용)
+
+piping_data.json 의 expansion_data (기준 온도 20˚C 부터의 평균 선팽창 계수, 10⁻⁶/˚C)를
+재질별로 선형 보간하고, 설치 온도 -> 설계 온도 사이의 길이 변화 ΔL 을 구함
+"""
+from typing import Dict, Tuple
+import numpy as np
+
+from units import convert_temperature, to_base
+from thickness import _to_float
+
+REFERENCE_TEMP = 20.0   # 평균 계수의 기준 온도 (˚C)
+
+def expansion_table(db) -> Dict[str, Tuple[np.ndarray, np.ndarray]]:
+    """expansion_data 를 재질 -> (온도 ˚C, 평균 계수 10⁻⁶/˚C) 로 정리 (빈 칸은 제외)"""
+    table = {}
+    header = None
+    for row in db.get("expansion_data", []):
+        if row[0] == "Material":
+            header = np.array([_to_float(h) for h in row[1:]])
+            continue
+        if header is None or not row[0]:
+            continue
+        values = np.array([_to_float(v) for v in row[1:]])
+        valid = ~np.isnan(values) & ~np.isnan(header)
+        table[row[0]] = (header[valid], values[valid])
+    return table
+
+def mean_coefficient(table, material, temperature) -> np.ndarray:
+    """재질과 온도(˚C)로 평균 선팽창 계수를 선형 보간 (table: expansion_table 결과, 표 범위 밖/미등록 재질은 nan)"""
+    material = np.atleast_1d(np.asarray(material))
+    temperature = np.asarray(temperature, dtype=float)
+    shape = np.broadcast_shapes(material.shape, temperature.shape)
+    material = np.broadcast_to(material, shape)
+    temperature = np.broadcast_to(temperature, shape)
+    result = np.full(shape, np.nan)
+    for name in np.unique(material).tolist():
+        if name not in table:
+            continue
+        temps, values = table[name]
+        rows = material == name
+        result[rows] = np.interp(temperature[rows], temps, values, left=np.nan, right=np.nan)
+    return result
+
+def thermal_expansion(length, install_temp, design_temp, material, db,
+                      temp_unit="Celsius", length_unit="m", table=None) -> Dict[str, np.ndarray]:
+    """설치 온도 -> 설계 온도의 열팽창량 ΔL (mm, 늘어나면 양수)
+
+    평균 계수 α(T) 는 20˚C 부터의 값이므로 ΔL = L * (α(T2) * (T2 - 20) - α(T1) * (T1 - 20))
+    온도 단위는 units.convert_temperature 와 같은 변환을 사용 (행별 단위 배열도 가능)
+    table: 미리 만든 expansion_table(db) (없으면 db 에서 한 번 만듦)
+    """
+    table = table if table is not None else expansion_table(db)
+    t1 = convert_temperature(install_temp, temp_unit, "Celsius")
+    t2 = convert_temperature(design_temp, temp_unit, "Celsius")
+    length_mm = to_base(length, "길이", length_unit) * 1000.0
+    a1 = mean_coefficient(table, material, t1)
+    a2 = mean_coefficient(table, material, t2)
+    strain = (a2 * (t2 - REFERENCE_TEMP) - a1 * (t1 - REFERENCE_TEMP)) * 1e-6
+    return {"install_c": t1, "design_c": t2, "alpha_install": a1, "alpha_design": a2,
+            "delta": length_mm * strain}
+
+def expansion_from_columns(columns: Dict[str, np.ndarray], db) -> np.ndarray:
+    """라인 리스트 열 배열(length, install_temp, design_temp, material[, temp_unit, length_unit])로 ΔL(mm) 계산"""
+    return thermal_expansion(columns["length"], columns["install_temp"], columns["design_temp"],
+                             columns["material"], db,
+                             columns.get("temp_unit", "Celsius"), columns.get("length_unit", "m"))["delta"]
@@ -0,0 +1,175 @@
+"""ASME B31.3 직관 최소 두께 계산 (스칼라/배열 공용)"""
+import re
+from typing import Dict, List, Tuple
+import numpy as np
+
+# PipeThicknessWidget.inputs 의 키와 동일한 순서
+THICKNESS_FIELDS = ["pressure", "diameter", "stress", "quality", "weld", "coeff", "corrosion"]
+
+def required_thickness(pressure, diameter, stress, quality, weld, coeff, corrosion=0.0) -> np.ndarray:
+    """식 (3a) t = PD / 2(SEW + PY) 에 부식 여유 C 를 더한 요구 두께 (mm)
+
+    분모가 0 이하인 행은 nan 으로 반환
+    """
+    P, D, S, E, W, Y, C = (np.asarray(v, dtype=float) for v in
+                           (pressure, diameter, stress, quality, weld, coeff, corrosion))
+    denominator = 2 * (S * E * W + P * Y)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return np.where(denominator > 0, P * D / denominator + C, np.nan)
+
+# --- 허용 응력 조회 (piping_data.json 의 stress_data) ---
+def _to_float(text: str) -> float:
+    try:
+        return float(text)
+    except ValueError:
+        return np.nan
+
+def stress_table(db) -> Dict[Tuple[str, str], Tuple[np.ndarray, np.ndarray, List[List[str]]]]:
+    """stress_data 를 (Spec, Grade) -> (온도 ˚C, 허용 응력 MPa, [헤더 행, 원본 행]) 로 정리
+
+    stress_data 는 온도 헤더가 다른 여러 블록으로 되어 있으므로 각 행은 자기 블록의 헤더를 사용
+    """
+    table = {}
+    header = None
+    for row in db.get("stress_data", []):
+        if row[0].startswith("Nominal"):
+            header = row
+            continue
+        if header is None or not row[2]:
+            continue
+        temps = np.array([_to_float(re.findall(r"[\d.]+", h)[-1]) for h in header[7:]])
+        values = np.array([_to_float(v) for v in row[7:]])
+        valid = ~np.isnan(values)
+        table[(row[2], row[3])] = (temps[valid], values[valid], [header, row])
+    return table
+
+def allowable_stress(db, spec, grade, temperature) -> np.ndarray:
+    """Spec/Grade 와 설계 온도(˚C)로 허용 응력을 선형 보간 (표 범위 밖, 미등록 재질은 nan)"""
+    table = stress_table(db)
+    spec, grade = np.atleast_1d(np.asarray(spec)), np.atleast_1d(np.asarray(grade))
+    temperature = np.broadcast_to(np.asarray(temperature, dtype=float), spec.shape)
+    result = np.full(spec.shape, np.nan)
+    for key in set(zip(spec.tolist(), grade.tolist())):
+        if key not in table:
+            continue
+        temps, values, _ = table[key]
+        rows = (spec == key[0]) & (grade == key[1])
+        result[rows] = np.interp(temperature[rows], temps, values, right=np.nan)
+    return result
+
+def resolve_stress(columns: Dict[str, np.ndarray], db) -> np.ndarray:
+    """stress 열 값을 쓰고, 없거나 nan 인 행은 spec/grade/temperature 열로 허용 응력을 조회 (빈 온도는 0)"""
+    n = len(next(iter(columns.values())))
+    stress = np.array(columns.get("stress", np.full(n, np.nan)), dtype=float)
+    lookup = np.isnan(stress)
+    if lookup.any() and "spec" in columns:
+        stress[lookup] = allowable_stress(db, np.asarray(columns["spec"])[lookup],
+                                          np.asarray(columns["grade"])[lookup],
+                                          np.nan_to_num(np.asarray(columns["temperature"], dtype=float)[lookup]))
+    return stress
+
+# --- 계수 E / W / Y 조회 (longitu_data, weld_data, coefficient_data) ---
+FACTOR_TABLES = {"quality": "Table A-1B", "weld": "Table 302.3.5", "coeff": "Table 304.1.1"}
+
+def weld_group(composition: str) -> str:
+    """stress_data 의 Nominal Composition -> weld_data 의 Steel Group"""
+    if composition.startswith("Carbon"):
+        return "Carbon Steel"
+    if "Cr" in composition and "Ni" in composition:
+        return "Austenitic..."
+    if "Cr" in composition and "Mo" in composition:
+        return "CrMo"
+    return "Other materials"
+
+def coeff_group(composition: str) -> str:
+    """stress_data 의 Nominal Composition -> coefficient_data 의 Material"""
+    if "Cr" in composition and "Ni" in composition:
+        return "Austenitic steels"
+    if composition.startswith("Carbon") or ("Cr" in composition and "Mo" in composition):
+        return "Ferritic Steel"
+    return "Other ductile metals"
+
+def temperature_table(rows: List[List[str]]) -> Dict[str, Tuple[np.ndarray, np.ndarray]]:
+    """첫 열이 재질 그룹, 나머지가 온도별 값인 표 -> 그룹 -> (온도 ˚C, 값) ('...' 칸은 제외)"""
+    table = {}
+    temps = None
+    for row in rows:
+        if temps is None:
+            if row[1].strip().startswith("≤"): # 온도 헤더 행 ("≤427", "454", ...)
+                temps = np.array([_to_float(re.findall(r"[\d.]+", h)[-1]) for h in row[1:]])
+            continue
+        values = np.array([_to_float(v) for v in row[1:]])
+        valid = ~np.isnan(values)
+        if row[0] and valid.any():
+            table[row[0]] = (temps[valid], values[valid])
+    return table
+
+def seamless_quality(db) -> Dict[str, float]:
+    """Spec -> longitu_data 의 이음매 없는 관(Seamless pipe) Ej"""
+    table = {}
+    spec = ""
+    for row in db.get("longitu_data", [])[1:]:
+        spec = row[0] or spec
+        if row[2].startswith("Seamless") and spec not in table:
+            table[spec] = _to_float(row[3])
+    return table
+
+def resolve_factors(columns: Dict[str, np.ndarray], db) -> Dict[str, Tuple[np.ndarray, np.ndarray]]:
+    """quality/weld/coeff 열의 빈 칸(nan)을 spec/grade/temperature 로 참조 표에서 채움
+
+    E 는 해당 Spec 의 이음매 없는 관 Ej, W/Y 는 재질 그룹과 온도로 선형 보간 (표 범위 밖이나 미등록 재질은 nan 유지)
+    반환: 열 -> (값, 표에서 조회한 행 마스크)
+    """
+    n = len(next(iter(columns.values())))
+    materials = stress_table(db)
+    spec = np.asarray(columns.get("spec", np.full(n, "")))
+    grade = np.asarray(columns.get("grade", np.full(n, "")))
+    temperature = np.nan_to_num(np.asarray(columns.get("temperature", np.zeros(n)), dtype=float))
+    quality = seamless_quality(db)
+    weld = temperature_table(db.get("weld_data", []))
+    coeff = temperature_table(db.get("coefficient_data", []))
+
+    result = {}
+    for field in FACTOR_TABLES:
+        values = np.array(columns.get(field, np.full(n, np.nan)), dtype=float)
+        lookup = np.isnan(values)
+        for key in set(zip(spec[lookup].tolist(), grade[lookup].tolist())):
+            rows = lookup & (spec == key[0]) & (grade == key[1])
+            if field == "quality":
+                values[rows] = quality.get(key[0], np.nan)
+                continue
+            if key not in materials:
+                continue
+            composition = materials[key][2][1][0]
+            group = (weld_group if field == "weld" else coeff_group)(composition)
+            table = weld if field == "weld" else coeff
+            if group in table:
+                temps, factors = table[group]
+                values[rows] = np.interp(temperature[rows], temps, factors, right=np.nan)
+        result[field] = (values, lookup & ~np.isnan(values))
+    return result
+
+def resolve_inputs(columns: Dict[str, np.ndarray], db) -> Tuple[Dict[str, np.ndarray], Dict[str, np.ndarray]]:
+    """라인 리스트 열 배열 -> (THICKNESS_FIELDS 별 계산 입력, 참조 표에서 조회한 행 마스크)
+
+    S 는 resolve_stress, E/W/Y 는 resolve_factors 로 빈 칸을 채움 (S 를 찾지 못한 행은 nan).
+    그 외 남은 빈 칸(nan)은 위젯의 float(text or 0) 과 같이 0 이며, corrosion 열이 없으면 0
+    """
+    n = len(next(iter(columns.values())))
+    given_stress = np.array(columns.get("stress", np.full(n, np.nan)), dtype=float)
+    stress = resolve_stress(columns, db)
+    inputs = {"stress": stress}
+    looked_up = {"stress": np.isnan(given_stress) & ~np.isnan(stress)}
+    for field, (values, mask) in resolve_factors(columns, db).items():
+        inputs[field] = np.nan_to_num(values)
+        looked_up[field] = mask
+    for field in ("pressure", "diameter"):
+        inputs[field] = np.nan_to_num(np.asarray(columns[field], dtype=float))
+    corrosion = np.asarray(columns.get("corrosion", 0.0), dtype=float)
+    inputs["corrosion"] = np.nan_to_num(np.broadcast_to(corrosion, (n,)))
+    return inputs, looked_up
+
+def thickness_from_columns(columns: Dict[str, np.ndarray], db) -> np.ndarray:
+    """라인 리스트 열 배열로 요구 두께를 한 번에 계산 (입력은 resolve_inputs 로 정함)"""
+    inputs, _ = resolve_inputs(columns, db)
+    return required_thickness(**inputs)
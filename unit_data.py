@@ -0,0 +1,56 @@
+"""단위 환산 상수 데이터 (numpy/Qt 없이 import 가능 - CLI 빠른 시작용)"""
+
+# --- 1. 상수 데이터 정의 (데이터와 로직 분리) ---
+# 각 카테고리의 값은 기준 단위(factor == 1.0)에 대한 배율
+UNIT_DATA = {
+    "길이": {
+        "mm": 0.001, "cm": 0.01, "m": 1.0, "km": 1000.0, "in": 0.0254,
+        "ft": 0.3048, "yd": 0.9144, "mi": 1609.344
+    },
+    "넓이": {
+        "mm²": 1e-6, "cm²": 0.0001, "m²": 1.0, "km²": 1e6,
+        "in²": 0.00064516, "ft²": 0.09290304,
+        "yd²": 0.83612736, "mi²": 2589988.110336
+    },
+    "부피": {
+        "Milliliter": 1e-6, "Liter": 0.001, "m³": 1.0, "mm³": 1e-9,
+        "cm³": 1e-6, "Barrel(oil)": 0.1589872949, "CC": 1e-6,
+        "in³": 0.0000163871, "ft³": 0.0283168466,
+        "yd³": 0.764554858, "US Gallon": 0.0037854118,
+    },
+    "무게": {
+        "Milligram": 1e-6, "Gram": 0.001, "Kilogram": 1.0,
+        "Ton": 1000.0, "Ounce": 0.0283495231, "Pound": 0.45359237
+    },
+    "압력": {
+        "Kilopascal": 0.001, "bar": 0.1, "Megapascal": 1.0,
+        "psi": 0.0068947573, "Standard Atmosphere": 0.101325,
+        "Newton/m²": 1e-6, "Newton/cm²": 0.01, "Newton/mm²": 1.0,
+        "kgf/m²": 0.00000980665, "kgf/cm²": 0.0980665, "kgf/mm²": 9.80665,
+        "Torr": 0.0001333224
+    },
+    "동적 유속": {
+        "mN·s/m²": 1.0, "Centipoise": 1.0, "mPa·s": 1.0
+    },
+    "정적 유속": {
+        "mm²/s": 1.0, "Centistokes": 1.0
+    },
+    "부피 유량": {
+        "cm³/s": 0.0036, "cm³/min": 0.00006, "cm³/hr": 1e-6,
+        "m³/s": 3600.0, "m³/min": 60.0, "m³/hr": 1.0,
+        "L/s": 3.6, "L/min": 0.06, "L/hr": 0.001,
+        "gal(US)/s": 13.627482, "gal(US)/min": 0.227124, "gal(US)/hr": 0.003785,
+        "barrel/s": 572.35426, "barrel/min": 9.539237, "barrel/hr": 0.158987
+    },
+    "질량 유량": {
+        "g/s": 3.6, "g/min": 0.06, "g/hr": 0.001,
+        "kg/s": 3600.0, "kg/min": 60.0, "kg/hr": 1.0,
+        "lb/s": 1632.9325, "lb/min": 27.21554, "lb/hr": 0.453592
+    }
+}
+
+# 온도는 비율이 아닌 1차 변환: 섭씨 = scale * 값 + offset
+TEMPERATURE_CATEGORY = "온도"
+TEMPERATURE_DATA = {
+    "Celsius": (1.0, 0.0), "Fahrenheit": (5 / 9, -32 * 5 / 9), "Kelvin": (1.0, -273.15)
+}
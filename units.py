@@ -0,0 +1,123 @@
+"""단위 환산 데이터와 배열 단위 환산 로직 (Qt 없이 사용 가능)"""
+from functools import lru_cache
+from typing import Iterable, List, Sequence, Tuple, Union
+import numpy as np
+
+# --- 1. 상수 데이터 (unit_data 모듈에서 관리) ---
+from unit_data import UNIT_DATA, TEMPERATURE_CATEGORY, TEMPERATURE_DATA
+
+UnitSpec = Union[str, Sequence[str], np.ndarray]
+
+# --- 2. 배열 단위 환산 ---
+def find_category(unit: str, categories: Iterable[str] = None) -> str:
+    """단위 이름이 속한 카테고리 이름을 반환"""
+    for category in (categories or UNIT_DATA.keys()):
+        if unit in UNIT_DATA[category]:
+            return category
+    raise KeyError(f"Unknown unit: {unit}")
+
+def unit_factors(category: str, units: UnitSpec) -> Union[float, np.ndarray]:
+    """단위(단일 또는 행별 배열)를 기준 단위 배율로 변환
+
+    행별 단위 배열은 고유 단위만 사전에서 찾은 뒤 인덱스로 펼침
+    """
+    table = UNIT_DATA[category]
+    if isinstance(units, str):
+        return table[units]
+    uniq, inverse = np.unique(np.asarray(units), return_inverse=True)
+    return np.array([table[u] for u in uniq], dtype=float)[inverse]
+
+def to_base(values, category: str, units: UnitSpec) -> np.ndarray:
+    """값 배열을 카테고리의 기준 단위로 변환"""
+    return np.asarray(values, dtype=float) * unit_factors(category, units)
+
+def from_base(values, category: str, units: UnitSpec) -> np.ndarray:
+    """기준 단위 값 배열을 목표 단위로 변환"""
+    return np.asarray(values, dtype=float) / unit_factors(category, units)
+
+def _temperature_index(lookup: dict, units: UnitSpec):
+    """온도 단위(단일 또는 행별 배열) -> unit_vectors 번호 (고유 단위만 사전에서 찾음)"""
+    if isinstance(units, str):
+        return lookup[units]
+    uniq, inverse = np.unique(np.asarray(units), return_inverse=True)
+    return np.array([lookup[u] for u in uniq])[inverse]
+
+def convert_temperature(values, in_unit: UnitSpec, out_unit: UnitSpec) -> np.ndarray:
+    """온도 배열을 섭씨를 거쳐 목표 단위로 변환"""
+    names, scales, offsets = unit_vectors(TEMPERATURE_CATEGORY)
+    lookup = {name: i for i, name in enumerate(names)}
+    i_in = _temperature_index(lookup, in_unit)
+    i_out = _temperature_index(lookup, out_unit)
+    celsius = np.asarray(values, dtype=float) * scales[i_in] + offsets[i_in]
+    return (celsius - offsets[i_out]) / scales[i_out]
+
+def convert_array(values, category: str, in_unit: UnitSpec, out_unit: UnitSpec) -> np.ndarray:
+    """BaseConverterWidget.calculate 와 같은 계산을 배열 전체에 한 번에 수행"""
+    if category == TEMPERATURE_CATEGORY:
+        return convert_temperature(values, in_unit, out_unit)
+    return from_base(to_base(values, category, in_unit), category, out_unit)
+
+@lru_cache(maxsize=None)
+def unit_vectors(category: str) -> Tuple[List[str], np.ndarray, np.ndarray]:
+    """카테고리의 (단위 이름, scale 벡터, offset 벡터) - 기준값 = scale * 값 + offset"""
+    if category == TEMPERATURE_CATEGORY:
+        names = list(TEMPERATURE_DATA)
+        scales, offsets = (np.array(v) for v in zip(*TEMPERATURE_DATA.values()))
+    else:
+        names = list(UNIT_DATA[category])
+        scales, offsets = np.array(list(UNIT_DATA[category].values())), np.zeros(len(names))
+    return names, scales, offsets
+
+def convert_to_all(value: float, category: str, in_unit: str) -> np.ndarray:
+    """값 하나를 카테고리의 모든 단위로 한 번의 벡터 연산으로 변환 (unit_vectors 순서)"""
+    names, scales, offsets = unit_vectors(category)
+    i = names.index(in_unit)
+    return (value * scales[i] + offsets[i] - offsets) / scales
+
+def lookup_units(units: UnitSpec, categories: Sequence[str]):
+    """행별 단위가 여러 카테고리에 섞여 있을 때 (배율, 카테고리 번호) 를 반환
+
+    categories 순서대로 번호를 매기며, 단일 단위 문자열이면 스칼라를 반환
+    """
+    uniq, inverse = np.unique(np.atleast_1d(np.asarray(units)), return_inverse=True)
+    owners = [find_category(u, categories) for u in uniq]
+    factor = np.array([UNIT_DATA[c][u] for c, u in zip(owners, uniq)], dtype=float)[inverse]
+    index = np.array([list(categories).index(c) for c in owners])[inverse]
+    if isinstance(units, str):
+        return factor[0], index[0]
+    return factor, index
+
+# --- 3. 붙여넣기(엑셀 열) 텍스트 처리 ---
+def is_bulk_text(text: str) -> bool:
+    """여러 줄이거나 탭으로 구분된 값이면 True (엑셀에서 복사한 열/표)"""
+    text = text.strip("\r\n")
+    return "\n" in text or "\t" in text
+
+def parse_pasted_values(text: str) -> np.ndarray:
+    """탭/줄바꿈으로 구분된 텍스트를 2차원 float 배열로 (빈 칸, 숫자가 아닌 칸은 nan)
+
+    천 단위 구분 쉼표는 제거하며, 대부분 숫자인 경우 numpy 의 일괄 변환을 사용
+    """
+    rows = text.strip("\r\n").replace("\r\n", "\n").replace("\r", "\n").split("\n")
+    if "\t" in text:
+        cells = [row.split("\t") for row in rows]
+        width = max(len(r) for r in cells)
+        flat = [c for r in cells for c in r + [""] * (width - len(r))]
+    else: # 한 열만 붙여넣은 경우 행 분리만 수행
+        width, flat = 1, rows
+    flat = [c.strip().replace(",", "") or "nan" for c in flat]
+    try:
+        values = np.array(flat, dtype=float)
+    except ValueError:
+        def to_float(cell: str) -> float:
+            try:
+                return float(cell)
+            except ValueError:
+                return np.nan
+        values = np.array([to_float(c) for c in flat])
+    return values.reshape(len(rows), width)
+
+def format_values(values: np.ndarray) -> str:
+    """2차원 배열을 엑셀에 붙여넣을 수 있는 탭 구분 텍스트로 (nan 은 빈 칸)"""
+    return "\n".join("\t".join("" if v != v else f"{v:.11g}" for v in row)
+                     for row in np.atleast_2d(values).tolist())